@@ -19,7 +19,10 @@ from src.models.__tutor_model import TutorModel
 from src.models.__user_model import UserModel
 from src.models.__animals_model import AnimalModel
 from src.models.__appointments_model import AppointmentsModel
+from src.models.__appointment_series_model import AppointmentSeriesModel
 from src.models.__medical_records_model import MedicalRecordsModel
+from src.models.__change_log_model import ChangeLogModel
+from src.models.__prescription_model import PrescriptionModel
 
 config = context.config
 
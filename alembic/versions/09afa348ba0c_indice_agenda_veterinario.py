@@ -0,0 +1,28 @@
+"""indice agenda veterinario
+
+Revision ID: 09afa348ba0c
+Revises: 5c634d43d1d6
+Create Date: 2026-10-18 10:41:05.630915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '09afa348ba0c'
+down_revision: Union[str, Sequence[str], None] = '5c634d43d1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_appointments_vet_id_scheduled_at', 'appointments', ['vet_id', 'scheduled_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointments_vet_id_scheduled_at', table_name='appointments')
@@ -0,0 +1,61 @@
+"""slot das consultas
+
+Revision ID: 0c5b54ba1504
+Revises: 09afa348ba0c
+Create Date: 2026-10-18 11:20:52.904417
+
+"""
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c5b54ba1504'
+down_revision: Union[str, Sequence[str], None] = '09afa348ba0c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EPOCH = datetime(1970, 1, 1)
+SLOT = timedelta(minutes=30)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('appointments', sa.Column('slot', sa.Integer(), nullable=True))
+
+    # Consultas antigas que já se sobrepõem ficam com slot NULL (a mais antiga vence)
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT id, vet_id, scheduled_at FROM appointments "
+        "WHERE status != 'cancelled' ORDER BY id"
+    ))
+    taken = set()
+    updates = []
+
+    for row in rows:
+        scheduled_at = row.scheduled_at
+        if isinstance(scheduled_at, str):
+            scheduled_at = datetime.fromisoformat(scheduled_at)
+
+        slot = (scheduled_at - EPOCH) // SLOT
+        if (row.vet_id, slot) in taken:
+            continue
+
+        taken.add((row.vet_id, slot))
+        updates.append({'id': row.id, 'slot': slot})
+
+    if updates:
+        connection.execute(
+            sa.text("UPDATE appointments SET slot = :slot WHERE id = :id"), updates
+        )
+
+    op.create_unique_constraint('uq_appointments_vet_id_slot', 'appointments', ['vet_id', 'slot'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_appointments_vet_id_slot', 'appointments', type_='unique')
+    op.drop_column('appointments', 'slot')
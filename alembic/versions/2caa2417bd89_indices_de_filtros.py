@@ -0,0 +1,36 @@
+"""indices de filtros
+
+Revision ID: 2caa2417bd89
+Revises: ebe29397038e
+Create Date: 2026-10-18 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2caa2417bd89'
+down_revision: Union[str, Sequence[str], None] = 'ebe29397038e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_animals_species'), 'animals', ['species'], unique=False)
+    op.create_index(op.f('ix_animals_tutor_id'), 'animals', ['tutor_id'], unique=False)
+    op.create_index(op.f('ix_appointments_scheduled_at'), 'appointments', ['scheduled_at'], unique=False)
+    op.create_index(op.f('ix_appointments_status'), 'appointments', ['status'], unique=False)
+    op.create_index(op.f('ix_medical_records_follow_up_date'), 'medical_records', ['follow_up_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_medical_records_follow_up_date'), table_name='medical_records')
+    op.drop_index(op.f('ix_appointments_status'), table_name='appointments')
+    op.drop_index(op.f('ix_appointments_scheduled_at'), table_name='appointments')
+    op.drop_index(op.f('ix_animals_tutor_id'), table_name='animals')
+    op.drop_index(op.f('ix_animals_species'), table_name='animals')
@@ -0,0 +1,30 @@
+"""indices historico do animal
+
+Revision ID: 43c4fc9e9aff
+Revises: 19c8c505f675
+Create Date: 2026-10-18 14:22:06.730915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '43c4fc9e9aff'
+down_revision: Union[str, Sequence[str], None] = '19c8c505f675'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_appointments_animal_id_scheduled_at', 'appointments', ['animal_id', 'scheduled_at'], unique=False)
+    op.create_index(op.f('ix_medical_records_appointment_id'), 'medical_records', ['appointment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_medical_records_appointment_id'), table_name='medical_records')
+    op.drop_index('ix_appointments_animal_id_scheduled_at', table_name='appointments')
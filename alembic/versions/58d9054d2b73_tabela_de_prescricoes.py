@@ -0,0 +1,94 @@
+"""tabela de prescricoes
+
+Revision ID: 58d9054d2b73
+Revises: e1c24c956f98
+Create Date: 2026-10-18 15:52:31.604187
+
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '58d9054d2b73'
+down_revision: Union[str, Sequence[str], None] = 'e1c24c956f98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    prescriptions = op.create_table('prescriptions',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('medical_record_id', sa.Integer(), nullable=False),
+    sa.Column('animal_id', sa.Integer(), nullable=False),
+    sa.Column('medicine', sa.String(length=200), nullable=False),
+    sa.Column('dosage', sa.String(length=100), nullable=False),
+    sa.Column('frequency', sa.String(length=100), nullable=False),
+    sa.Column('duration_days', sa.Integer(), nullable=False),
+    sa.Column('batch', sa.String(length=100), nullable=True),
+    sa.Column('starts_on', sa.Date(), nullable=False),
+    sa.Column('ends_on', sa.Date(), nullable=False),
+    sa.ForeignKeyConstraint(['animal_id'], ['animals.id'], ),
+    sa.ForeignKeyConstraint(['medical_record_id'], ['medical_records.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_prescriptions_medical_record_id'), 'prescriptions', ['medical_record_id'], unique=False)
+    op.create_index(op.f('ix_prescriptions_batch'), 'prescriptions', ['batch'], unique=False)
+    op.create_index('ix_prescriptions_medicine_ends_on', 'prescriptions', ['medicine', 'ends_on'], unique=False)
+    op.create_index('ix_prescriptions_animal_id_ends_on', 'prescriptions', ['animal_id', 'ends_on'], unique=False)
+
+    # Backfill a partir do JSON; o período começa na data da consulta
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT medical_records.id, medical_records.prescriptions, "
+        "appointments.animal_id, appointments.scheduled_at "
+        "FROM medical_records "
+        "JOIN appointments ON appointments.id = medical_records.appointment_id "
+        "WHERE medical_records.prescriptions IS NOT NULL"
+    ))
+    batch = []
+
+    for row in rows:
+        items = row.prescriptions
+        if isinstance(items, str):
+            items = json.loads(items)
+
+        scheduled_at = row.scheduled_at
+        if isinstance(scheduled_at, str):
+            scheduled_at = datetime.fromisoformat(scheduled_at)
+
+        for item in items or []:
+            batch.append({
+                'medical_record_id': row.id,
+                'animal_id': row.animal_id,
+                'medicine': item['medicine'],
+                'dosage': item['dosage'],
+                'frequency': item['frequency'],
+                'duration_days': item['duration_days'],
+                'batch': item.get('batch'),
+                'starts_on': scheduled_at.date(),
+                'ends_on': scheduled_at.date() + timedelta(days=max(item['duration_days'] - 1, 0)),
+            })
+
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(prescriptions, batch)
+            batch = []
+
+    if batch:
+        op.bulk_insert(prescriptions, batch)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_prescriptions_animal_id_ends_on', table_name='prescriptions')
+    op.drop_index('ix_prescriptions_medicine_ends_on', table_name='prescriptions')
+    op.drop_index(op.f('ix_prescriptions_batch'), table_name='prescriptions')
+    op.drop_index(op.f('ix_prescriptions_medical_record_id'), table_name='prescriptions')
+    op.drop_table('prescriptions')
@@ -0,0 +1,37 @@
+"""updated_at
+
+Revision ID: 5c634d43d1d6
+Revises: 2caa2417bd89
+Create Date: 2026-10-18 10:03:47.118420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c634d43d1d6'
+down_revision: Union[str, Sequence[str], None] = '2caa2417bd89'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['tutors', 'animals', 'appointments', 'users']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    updated_at = sa.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql')
+
+    for table in TABLES:
+        op.add_column(table, sa.Column('updated_at', updated_at, nullable=True))
+        op.execute(sa.text(f'UPDATE {table} SET updated_at = CURRENT_TIMESTAMP'))
+        op.alter_column(table, 'updated_at', existing_type=updated_at, nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
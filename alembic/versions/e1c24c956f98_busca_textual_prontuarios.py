@@ -0,0 +1,42 @@
+"""busca textual prontuarios
+
+Revision ID: e1c24c956f98
+Revises: 43c4fc9e9aff
+Create Date: 2026-10-18 15:08:44.192630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c24c956f98'
+down_revision: Union[str, Sequence[str], None] = '43c4fc9e9aff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'mysql':
+        op.create_index('ft_medical_records_diagnosis_treatment', 'medical_records', ['diagnosis', 'treatment'], unique=False, mysql_prefix='FULLTEXT')
+    elif dialect == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE medical_records_fts USING fts5(diagnosis, treatment)")
+        op.execute(
+            "INSERT INTO medical_records_fts (rowid, diagnosis, treatment) "
+            "SELECT id, diagnosis, treatment FROM medical_records"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'mysql':
+        op.drop_index('ft_medical_records_diagnosis_treatment', table_name='medical_records')
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS medical_records_fts")
@@ -0,0 +1,59 @@
+"""series de consultas
+
+Revision ID: e709d346a2fd
+Revises: 0c5b54ba1504
+Create Date: 2026-10-18 12:34:10.271553
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e709d346a2fd'
+down_revision: Union[str, Sequence[str], None] = '0c5b54ba1504'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('appointment_series',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('vet_id', sa.Integer(), nullable=False),
+    sa.Column('animal_id', sa.Integer(), nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('frequency', sa.Enum('weekly', 'monthly', name='seriesfrequencyenum'), nullable=False),
+    sa.Column('interval', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=True),
+    sa.Column('until', sa.DateTime(), nullable=True),
+    sa.Column('reason', sa.String(length=300), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql'), nullable=False),
+    sa.ForeignKeyConstraint(['animal_id'], ['animals.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['vet_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_appointment_series_id'), 'appointment_series', ['id'], unique=False)
+    op.create_index(op.f('ix_appointment_series_vet_id'), 'appointment_series', ['vet_id'], unique=False)
+    op.add_column('appointments', sa.Column('series_id', sa.Integer(), nullable=True))
+    op.add_column('appointments', sa.Column('occurrence_at', sa.DateTime(), nullable=True))
+    op.create_foreign_key('fk_appointments_series_id', 'appointments', 'appointment_series', ['series_id'], ['id'])
+    op.create_unique_constraint('uq_appointments_series_occurrence', 'appointments', ['series_id', 'occurrence_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_appointments_series_occurrence', 'appointments', type_='unique')
+    op.drop_constraint('fk_appointments_series_id', 'appointments', type_='foreignkey')
+    op.drop_column('appointments', 'occurrence_at')
+    op.drop_column('appointments', 'series_id')
+    op.drop_index(op.f('ix_appointment_series_vet_id'), table_name='appointment_series')
+    op.drop_index(op.f('ix_appointment_series_id'), table_name='appointment_series')
+    op.drop_table('appointment_series')
@@ -0,0 +1,89 @@
+"""Agenda semanal de um veterinário sobre uma tabela grande de consultas,
+com e sem o índice composto (vet_id, scheduled_at).
+
+Uso: python benchmarks/bench_agenda.py [linhas]
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, text
+
+from common import bench_client
+
+from src.models.__appointments_model import AppointmentsModel
+
+VETS = 50
+PER_DAY = 16
+START = datetime(2024, 1, 1, 8, 0)
+
+
+def appointment(i: int) -> dict:
+    vet = i % VETS + 1
+    slot = i // VETS
+    day, minute = divmod(slot, PER_DAY)
+
+    return {
+        "vet_id": vet,
+        "animal_id": 1,
+        "scheduled_at": START + timedelta(days=day, minutes=30 * minute),
+        "reason": "Consulta",
+        "notes": "",
+        "status": "scheduled",
+        "created_by": 1,
+    }
+
+
+async def seed(session_factory, rows: int):
+    async with session_factory() as session:
+        for start in range(0, rows, 20000):
+            await session.execute(
+                insert(AppointmentsModel),
+                [appointment(i) for i in range(start, min(start + 20000, rows))],
+            )
+        await session.commit()
+
+
+async def timed(client, url: str, params: dict, repeat: int = 50) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        response = await client.get(url, params=params)
+        assert response.status_code == 200, response.text
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(rows: int):
+    async with bench_client() as (client, engine, session_factory):
+        start = time.perf_counter()
+        await seed(session_factory, rows)
+        print(f"{rows} consultas inseridas em {time.perf_counter() - start:.1f}s")
+
+        middle = START + timedelta(days=rows // VETS // PER_DAY // 2)
+        params = {
+            "from": middle.isoformat(),
+            "to": (middle + timedelta(days=7)).isoformat(),
+        }
+        url = "/api/v1/appointments/vets/7/agenda"
+
+        response = await client.get(url, params=params)
+        found = sum(len(day["appointments"]) for day in response.json()["days"])
+        print(f"consultas na semana: {found}")
+
+        print(f"com índice (vet_id, scheduled_at): {await timed(client, url, params):.2f} ms")
+
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_appointments_vet_id_scheduled_at"))
+
+        print(f"só com índice em scheduled_at:     {await timed(client, url, params):.2f} ms")
+
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP INDEX ix_appointments_scheduled_at"))
+
+        print(f"sem índice:                        {await timed(client, url, params, 5):.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000))
@@ -0,0 +1,100 @@
+"""Busca de horários livres para 50 veterinários ao longo de um mês,
+com ~70% dos slots do horário comercial (8h-18h) ocupados.
+
+Uso: python benchmarks/bench_availability.py [veterinarios] [dias]
+"""
+import asyncio
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from common import bench_client
+
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__user_model import UserModel
+from src.utils.slots import to_slot
+
+OCCUPANCY = 0.7
+
+
+async def seed(session_factory, vets: int, start: datetime, days: int) -> int:
+    random.seed(15)
+    rows = []
+
+    for vet_id in range(2, vets + 2):
+        for day in range(days):
+            opening = start + timedelta(days=day, hours=8)
+            for i in range(20):
+                if random.random() < OCCUPANCY:
+                    scheduled_at = opening + timedelta(minutes=30 * i)
+                    rows.append(
+                        {
+                            "vet_id": vet_id,
+                            "animal_id": 1,
+                            "scheduled_at": scheduled_at,
+                            "slot": to_slot(scheduled_at),
+                            "reason": "Consulta",
+                            "notes": "",
+                            "status": "scheduled",
+                            "created_by": 1,
+                        }
+                    )
+
+    async with session_factory() as session:
+        await session.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": f"Vet {i}",
+                    "email": f"vet{i}@email.com",
+                    "password": "not-used",
+                    "role": "vet",
+                }
+                for i in range(vets)
+            ],
+        )
+        await session.execute(insert(AppointmentsModel), rows)
+        await session.commit()
+
+    return len(rows)
+
+
+async def timed(client, params: dict, repeat: int = 20) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        response = await client.get("/api/v1/appointments/availability", params=params)
+        assert response.status_code == 200, response.text
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(vets: int, days: int):
+    start = (datetime.now() + timedelta(days=1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+    async with bench_client() as (client, _, session_factory):
+        booked = await seed(session_factory, vets, start, days)
+        print(f"{vets} veterinários, {days} dias, {booked} consultas")
+
+        for label, end, duration in (
+            ("mês inteiro, 30 min", start + timedelta(days=days), 30),
+            ("mês inteiro, 90 min", start + timedelta(days=days), 90),
+            ("uma tarde, 30 min", start + timedelta(hours=18), 30),
+        ):
+            offset = timedelta(hours=13) if end - start < timedelta(days=1) else timedelta()
+            params = {
+                "from": (start + offset).isoformat(),
+                "to": end.isoformat(),
+                "duration": duration,
+            }
+            print(f"{label:>22}: {await timed(client, params):8.2f} ms")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [50, 30][len(args):])))
@@ -0,0 +1,33 @@
+"""Requests/sec em GET /api/v1/animals/ com e sem o cache de usuários.
+
+Uso: python benchmarks/bench_current_user.py [total_requests]
+"""
+import asyncio
+import sys
+
+from common import bench_client, requests_per_second
+
+from src.utils.auth import user_cache
+
+URL = "/api/v1/animals/"
+
+
+async def main(total: int):
+    async with bench_client() as (client, _, _):
+        ttl = user_cache.ttl
+
+        user_cache.ttl = 0
+        user_cache.clear()
+        without_cache = await requests_per_second(client, URL, total)
+
+        user_cache.ttl = ttl
+        user_cache.clear()
+        with_cache = await requests_per_second(client, URL, total)
+
+        print(f"sem cache: {without_cache:8.1f} req/s")
+        print(f"com cache: {with_cache:8.1f} req/s")
+        print(f"stats:     {user_cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
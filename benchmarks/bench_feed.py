@@ -0,0 +1,101 @@
+"""Carga no feed SSE de consultas: centenas de clientes conectados num
+servidor uvicorn real recebendo eventos publicados no broker.
+
+Mede o tempo para conectar todos, a latência publish -> cliente (p50/p99)
+e quantas mensagens foram entregues.
+
+Uso: python benchmarks/bench_feed.py [clientes] [eventos]
+"""
+import asyncio
+import json
+import sys
+import time
+
+import httpx
+import uvicorn
+
+from common import bench_client
+
+from src.main import app
+from src.services.appointments_service import APPOINTMENTS_CHANNEL
+from src.utils.events import broker
+
+PORT = 8765
+URL = "/api/v1/appointments/feed"
+
+
+async def listen(http, events: int, latencies: list):
+    received = 0
+
+    async with http.stream("GET", URL, params={"vet_id": 7}) as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+
+            message = json.loads(line[len("data: "):])
+            latencies.append(time.perf_counter() - message["sent"])
+            received += 1
+
+            if received == events:
+                return
+
+
+async def main(clients: int, events: int):
+    async with bench_client() as (client, _, _):
+        config = uvicorn.Config(app, port=PORT, log_level="warning", lifespan="off")
+        server = uvicorn.Server(config)
+        serving = asyncio.create_task(server.serve())
+
+        while not server.started:
+            await asyncio.sleep(0.05)
+
+        limits = httpx.Limits(max_connections=clients + 10)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{PORT}",
+            headers=client.headers,
+            limits=limits,
+            timeout=None,
+        ) as http:
+            latencies = []
+            start = time.perf_counter()
+            listeners = [
+                asyncio.create_task(listen(http, events, latencies))
+                for _ in range(clients)
+            ]
+
+            while broker.backend.stats()["subscribers"] < clients:
+                await asyncio.sleep(0.01)
+            print(f"{clients} clientes conectados em {time.perf_counter() - start:.2f}s")
+
+            start = time.perf_counter()
+            for i in range(events):
+                broker.publish(
+                    APPOINTMENTS_CHANNEL,
+                    {
+                        "type": "created",
+                        "id": i,
+                        "vet_id": 7,
+                        "scheduled_at": "2026-11-02T08:00:00",
+                        "sent": time.perf_counter(),
+                    },
+                )
+                await asyncio.sleep(0.01)
+
+            await asyncio.gather(*listeners)
+            elapsed = time.perf_counter() - start
+
+        server.should_exit = True
+        await serving
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+
+    print(f"{len(latencies)} mensagens entregues em {elapsed:.2f}s")
+    print(f"latência p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    print(f"descartadas por fila cheia: {broker.backend.stats()['dropped']}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(main(*(args + [500, 100][len(args):])))
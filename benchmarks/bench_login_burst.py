@@ -0,0 +1,76 @@
+"""Latência p99 de GET /api/v1/animals/ enquanto uma rajada de logins roda.
+
+Compara o bcrypt rodando no event loop (comportamento anterior) com o
+executor dedicado de src.utils.security.
+
+Uso: python benchmarks/bench_login_burst.py [logins]
+"""
+import asyncio
+import sys
+import time
+
+from common import bench_client
+
+from src.models.__user_model import UserModel
+from src.utils.security import security
+
+URL = "/api/v1/animals/"
+
+
+async def inline_verify(password, hash_password):
+    return security.CRIPTO.verify(password, hash_password)
+
+
+async def probe(client, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(URL)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def run(client, logins: int) -> float:
+    latencies = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(client, stop, latencies))
+
+    form = {"username": "vet@email.com", "password": "secret"}
+    await asyncio.gather(
+        *(client.post("/api/v1/auth/login", data=form) for _ in range(logins))
+    )
+
+    stop.set()
+    await probe_task
+
+    latencies.sort()
+
+    return latencies[int(len(latencies) * 0.99)] * 1000
+
+
+async def main(logins: int):
+    async with bench_client() as (client, _, session_factory):
+        async with session_factory() as session:
+            session.add(
+                UserModel(
+                    name="Vet",
+                    email="vet@email.com",
+                    password=await security.generate_hashed_password("secret"),
+                    role="vet",
+                )
+            )
+            await session.commit()
+
+        verify = security.verify_password
+
+        security.verify_password = inline_verify
+        blocking = await run(client, logins)
+
+        security.verify_password = verify
+        offloaded = await run(client, logins)
+
+        print(f"bcrypt no event loop: p99 {blocking:8.1f} ms")
+        print(f"executor dedicado:    p99 {offloaded:8.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 40))
@@ -0,0 +1,82 @@
+"""Tempo por página em profundidades crescentes: OFFSET x keyset (cursor).
+
+Uso: python benchmarks/bench_pagination.py [linhas]
+"""
+import asyncio
+import sys
+import time
+from datetime import date
+
+from sqlalchemy import insert
+from sqlalchemy.future import select
+
+from common import bench_client
+
+from src.models.__animals_model import AnimalModel
+from src.models.__tutor_model import TutorModel
+from src.utils.pagination import PageParams, encode_cursor
+
+PAGE = 50
+
+
+async def seed(session_factory, rows: int):
+    async with session_factory() as session:
+        await session.execute(
+            insert(TutorModel),
+            [{"name": "Tutor", "cpf": "1", "email": "t@email.com"}],
+        )
+        for start in range(0, rows, 10000):
+            await session.execute(
+                insert(AnimalModel),
+                [
+                    {
+                        "name": f"Animal {i}",
+                        "species": "dog",
+                        "breed": "srd",
+                        "birth_date": date(2020, 1, 1),
+                        "weight_kg": 10.0,
+                        "tutor_id": 1,
+                    }
+                    for i in range(start, min(start + 10000, rows))
+                ],
+            )
+        await session.commit()
+
+
+async def timed(session, query, repeat: int = 20) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        result = await session.execute(query)
+        result.scalars().all()
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(rows: int):
+    async with bench_client() as (_, _, session_factory):
+        await seed(session_factory, rows)
+
+        async with session_factory() as session:
+            print(f"{'profundidade':>12} {'offset (ms)':>12} {'keyset (ms)':>12}")
+
+            for depth in (0, rows // 10, rows // 2, rows - PAGE):
+                offset_query = (
+                    select(AnimalModel).order_by(AnimalModel.id).offset(depth).limit(PAGE)
+                )
+                page = PageParams(
+                    request=None,
+                    response=None,
+                    limit=PAGE,
+                    cursor=encode_cursor([depth]) if depth else None,
+                )
+                keyset_query = page.apply(select(AnimalModel), AnimalModel.id)
+
+                print(
+                    f"{depth:>12} {await timed(session, offset_query):>12.2f}"
+                    f" {await timed(session, keyset_query):>12.2f}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000))
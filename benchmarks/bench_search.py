@@ -0,0 +1,128 @@
+"""Busca textual em prontuários: índice FTS5 (via endpoint /search) contra
+o LIKE '%termo%' em diagnosis/treatment sobre uma tabela grande.
+
+Mede um termo raro e um termo comum; o LIKE ordena por id e para no
+primeiro lote, o FTS ranqueia todos os documentos que casam.
+
+Uso: python benchmarks/bench_search.py [linhas]
+"""
+import asyncio
+import random
+import sys
+import time
+
+from sqlalchemy import insert, or_, text
+from sqlalchemy.future import select
+
+from common import bench_client
+
+from src.models.__medical_records_model import MedicalRecordsModel
+
+DIAGNOSES = [
+    "Dermatite alérgica",
+    "Otite externa",
+    "Gastroenterite aguda",
+    "Fratura de rádio",
+    "Doença periodontal",
+    "Insuficiência renal crônica",
+    "Obesidade",
+    "Conjuntivite",
+    "Cistite idiopática",
+    "Displasia coxofemoral",
+]
+TREATMENTS = [
+    "Amoxicilina por 7 dias",
+    "Limpeza auricular e pomada",
+    "Fluidoterapia e dieta leve",
+    "Imobilização e repouso",
+    "Profilaxia dentária",
+    "Ração renal e acompanhamento",
+    "Dieta e exercícios",
+    "Colírio antibiótico",
+    "Aumento da ingestão de água",
+    "Fisioterapia e analgésico",
+]
+RARE = "leishmaniose"
+
+
+def record(i: int, rng: random.Random) -> dict:
+    diagnosis = rng.choice(DIAGNOSES)
+    if i % 100000 == 0:
+        diagnosis = f"Suspeita de {RARE}"
+
+    return {
+        "appointment_id": i + 1,
+        "vet_id": 1,
+        "diagnosis": f"{diagnosis}. Paciente {i} estável, retorno em {i % 30} dias.",
+        "treatment": rng.choice(TREATMENTS),
+    }
+
+
+async def seed(session_factory, rows: int):
+    rng = random.Random(24)
+
+    async with session_factory() as session:
+        for start in range(0, rows, 20000):
+            await session.execute(
+                insert(MedicalRecordsModel),
+                [record(i, rng) for i in range(start, min(start + 20000, rows))],
+            )
+        await session.execute(
+            text(
+                "INSERT INTO medical_records_fts (rowid, diagnosis, treatment) "
+                "SELECT id, diagnosis, treatment FROM medical_records"
+            )
+        )
+        await session.commit()
+
+
+async def timed_search(client, term: str, repeat: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        response = await client.get(
+            "/api/v1/medical-records/search", params={"q": term}
+        )
+        assert response.status_code == 200, response.text
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def timed_like(session_factory, term: str, repeat: int) -> float:
+    pattern = f"%{term}%"
+    query = (
+        select(MedicalRecordsModel)
+        .where(
+            or_(
+                MedicalRecordsModel.diagnosis.ilike(pattern),
+                MedicalRecordsModel.treatment.ilike(pattern),
+            )
+        )
+        .order_by(MedicalRecordsModel.id.desc())
+        .limit(50)
+    )
+    start = time.perf_counter()
+
+    async with session_factory() as session:
+        for _ in range(repeat):
+            (await session.execute(query)).scalars().all()
+            session.expunge_all()
+
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(rows: int):
+    async with bench_client() as (client, engine, session_factory):
+        start = time.perf_counter()
+        await seed(session_factory, rows)
+        elapsed = time.perf_counter() - start
+        print(f"{rows} prontuários inseridos e indexados em {elapsed:.1f}s")
+
+        for label, term in (("raro", RARE), ("comum", "amoxicilina")):
+            fts = await timed_search(client, term, 20)
+            like = await timed_like(session_factory, term, 3)
+            print(f"termo {label} ({term}): FTS5 {fts:.2f} ms, LIKE {like:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000))
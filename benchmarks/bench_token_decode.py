@@ -0,0 +1,49 @@
+"""Micro-benchmark de get_current_user isolado, com e sem o cache de tokens.
+
+O usuário fica no user_cache, então o tempo medido é só o da verificação
+do JWT e da montagem do principal.
+
+Uso: python benchmarks/bench_token_decode.py [chamadas]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath("."))
+
+import src.main  # noqa: F401  registra todos os models
+from src.core.deps import get_current_user
+from src.models.__user_model import UserModel
+from src.utils.auth import _create_access_token, user_cache, token_cache
+
+
+async def measure(token: str, calls: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(calls):
+        await get_current_user(db=None, token=token)
+
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+async def main(calls: int):
+    user_cache.set(1, UserModel(id=1, role="admin", is_active=True))
+    token = _create_access_token(sub=1)
+
+    max_size = token_cache.max_size
+
+    token_cache.max_size = 0
+    uncached = await measure(token, calls)
+
+    token_cache.max_size = max_size
+    token_cache.clear()
+    cached = await measure(token, calls)
+
+    print(f"jwt.decode a cada chamada: {uncached:7.2f} us/chamada")
+    print(f"cache de tokens:           {cached:7.2f} us/chamada")
+    print(f"stats: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+
+sys.path.append(os.path.abspath("."))
+
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.main import app
+from src.core.deps import get_session
+from src.core.configs import settings
+from src.models.__user_model import UserModel
+from src.utils.auth import _create_access_token
+
+DATABASE_URL = "sqlite+aiosqlite:///./bench.db"
+
+
+@asynccontextmanager
+async def bench_client(database_url: str = DATABASE_URL):
+    engine = create_async_engine(database_url, echo=False)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(settings.DBBaseModel.metadata.drop_all)
+        await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+
+    async with session_factory() as session:
+        admin = UserModel(
+            name="Admin", email="admin@email.com", password="not-used", role="admin"
+        )
+        session.add(admin)
+        await session.commit()
+
+    async def override_get_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://bench",
+            headers={"Authorization": f"Bearer {_create_access_token(sub=admin.id)}"},
+        ) as client:
+            yield client, engine, session_factory
+    finally:
+        app.dependency_overrides.clear()
+        await engine.dispose()
+        if database_url == DATABASE_URL and os.path.exists("bench.db"):
+            os.remove("bench.db")
+
+
+async def requests_per_second(client, url: str, total: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(total):
+        response = await client.get(url)
+        assert response.status_code == 200, response.text
+
+    return total / (time.perf_counter() - start)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from src.api.v1.routes import tutors, animals, users, appointments, medical_records, auth
+from src.api.v1.routes import tutors, animals, users, appointments, medical_records, auth, metrics, changes, prescriptions
 
 api_router = APIRouter()
 
@@ -12,4 +12,8 @@ api_router.include_router(
     appointments.router, prefix="/appointments", tags=["appointments"]
 )
 api_router.include_router(medical_records.router, prefix="/medical-records", tags=["medical records"])
-
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
+api_router.include_router(
+    prescriptions.router, prefix="/prescriptions", tags=["prescriptions"]
+)
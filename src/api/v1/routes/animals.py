@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, status, Depends
+from datetime import datetime
+from fastapi import APIRouter, status, Depends, Query, Request, Response
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,11 +9,24 @@ from src.schemas.animals_schema import (
     AnimalsSchema,
     AnimalsSchemaTutors,
     AnimalHistorySchema,
+    AnimalFilterSchema,
 )
 
-from src.services.animal_service import AnimalsService
+from src.schemas.medical_records_schema import AnimalMedicalRecordSchema
 
-from src.core.deps import get_session, get_current_user
+from src.services.animal_service import AnimalsService
+from src.services.medical_records_service import MedicalRecordsService
+
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest
+from src.utils.fields import FieldSelection, SparseFields
+from src.core.configs import settings
+from src.core.deps import (
+    get_session,
+    get_read_session,
+    get_stream_session,
+    get_current_user,
+)
 
 router = APIRouter()
 
@@ -22,7 +36,7 @@ router = APIRouter()
 )
 async def post_animal(
     animal: AnimalsSchemaTutors,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     animal_service = AnimalsService(db)
@@ -33,11 +47,16 @@ async def post_animal(
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[AnimalsSchema])
 async def get_animals(
-    db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    filters: AnimalFilterSchema = Depends(),
+    fields: FieldSelection = Depends(SparseFields(AnimalsSchema)),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
 ):
     animal_service = AnimalsService(db)
 
-    return await animal_service.get_animals()
+    return await animal_service.get_animals(page, filters, fields, conditional)
 
 
 @router.get(
@@ -45,12 +64,13 @@ async def get_animals(
 )
 async def get_animal(
     animal_id: int,
-    db: AsyncSession = Depends(get_session),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     user=Depends(get_current_user),
 ):
     animal_service = AnimalsService(db)
 
-    return await animal_service.get_animal(animal_id)
+    return await animal_service.get_animal(animal_id, conditional)
 
 
 @router.put(
@@ -61,7 +81,7 @@ async def get_animal(
 async def put_animal(
     animal_id: int,
     animal: AnimalsSchemaTutors,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     animal_service = AnimalsService(db)
@@ -72,7 +92,7 @@ async def put_animal(
 @router.delete("/{animal_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_animal(
     animal_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     animal_service = AnimalsService(db)
@@ -84,9 +104,55 @@ async def delete_animal(
     "/{id}/history", status_code=status.HTTP_200_OK, response_model=AnimalHistorySchema
 )
 async def get_animal_history(
-    id: int, db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    id: int,
+    request: Request,
+    response: Response,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    last: Optional[int] = Query(None, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    primary: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    # Sem janela: documento completo (em cache); com janela: página de visitas
+    if start or end or last or cursor:
+        limit = last or settings.PAGE_SIZE_DEFAULT
+        page = PageParams(request, response, limit, cursor)
+
+        return await AnimalsService(db).get_animal_history_window(
+            id, start, end, page
+        )
+
+    # O cache é compartilhado por todos: a falta lê do primário, nunca de uma
+    # réplica que ainda não aplicou a escrita que invalidou a entrada
+    return await AnimalsService(primary).get_animal_history(id)
+
+
+@router.get("/{id}/history/stream", status_code=status.HTTP_200_OK)
+async def stream_animal_history(
+    id: int,
+    start: Optional[datetime] = Query(None, alias="from"),
+    end: Optional[datetime] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_stream_session),
+    user=Depends(get_current_user),
 ):
-
     animal_service = AnimalsService(db)
 
-    return await animal_service.get_animal_history(id)
+    return await animal_service.stream_animal_history(id, start, end)
+
+
+@router.get(
+    "/{id}/medical_records",
+    status_code=status.HTTP_200_OK,
+    response_model=List[AnimalMedicalRecordSchema],
+)
+async def get_animal_medical_records(
+    id: int,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    medical_record_service = MedicalRecordsService(db)
+
+    return await medical_record_service.get_animal_medical_records(id, page)
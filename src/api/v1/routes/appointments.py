@@ -1,8 +1,16 @@
 from typing import List, Optional, Any
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
-from fastapi import APIRouter, status, HTTPException, Depends, Response
+from fastapi import (
+    APIRouter,
+    status,
+    HTTPException,
+    Depends,
+    Response,
+    Query,
+    Request,
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
@@ -14,11 +22,38 @@ from src.schemas.appointments_schema import (
     AppointmentCreateSchema,
     AppointmentUpdatechema,
     AppointmentPatchStatusSchema,
+    AppointmentFilterSchema,
+    VetAgendaSchema,
+    AvailabilitySchema,
+    AppointmentBulkCreateSchema,
+    AppointmentBulkResultSchema,
+    AppointmentSeriesCreateSchema,
+    AppointmentSeriesSchema,
+    AppointmentSeriesUpdateSchema,
+    AppointmentOccurrenceSchema,
+    AppointmentBulkStatusSchema,
+    AppointmentBulkStatusResultSchema,
 )
 
-from src.services.appointments_service import AppointmentsService
+from src.services.appointments_service import (
+    AppointmentsService,
+    APPOINTMENTS_CHANNEL,
+    feed_filter,
+)
+from src.services.appointment_series_service import AppointmentSeriesService
 
-from src.core.deps import get_session, get_current_user
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest
+from src.utils.fields import FieldSelection, SparseFields
+from src.utils.export import ExportFormatEnum
+from src.utils.events import event_response
+from src.utils.slots import SLOT_MINUTES
+from src.core.deps import (
+    get_session,
+    get_read_session,
+    get_stream_session,
+    get_current_user,
+)
 
 router = APIRouter()
 
@@ -28,7 +63,7 @@ router = APIRouter()
 )
 async def post_appointment(
     appointment: AppointmentCreateSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     appointment_service = AppointmentsService(db)
@@ -39,17 +74,189 @@ async def post_appointment(
     return new_appointment
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AppointmentBulkResultSchema,
+)
+async def post_appointments_bulk(
+    batch: AppointmentBulkCreateSchema,
+    partial: bool = Query(False),
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return await appointment_service.create_appointments_bulk(
+        batch.appointments, partial, current_user=user
+    )
+
+
+@router.post(
+    "/series",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AppointmentSeriesSchema,
+)
+async def post_appointment_series(
+    series: AppointmentSeriesCreateSchema,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    series_service = AppointmentSeriesService(db)
+
+    return await series_service.create_series(series, current_user=user)
+
+
+@router.get(
+    "/series/{series_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=AppointmentSeriesSchema,
+)
+async def get_appointment_series(
+    series_id: int,
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    series_service = AppointmentSeriesService(db)
+
+    return await series_service.get_series(series_id)
+
+
+@router.patch(
+    "/series/{series_id}",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=AppointmentSeriesSchema,
+)
+async def patch_appointment_series(
+    series_id: int,
+    series: AppointmentSeriesUpdateSchema,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    series_service = AppointmentSeriesService(db)
+
+    return await series_service.update_series(series_id, series, current_user=user)
+
+
+@router.delete("/series/{series_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_appointment_series(
+    series_id: int,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    series_service = AppointmentSeriesService(db)
+
+    return await series_service.end_series(series_id, current_user=user)
+
+
+@router.post(
+    "/series/{series_id}/occurrences",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AppointmentSchema,
+)
+async def post_series_occurrence(
+    series_id: int,
+    occurrence: AppointmentOccurrenceSchema,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return await appointment_service.materialize_occurrence(
+        series_id, occurrence, current_user=user
+    )
+
+
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[AppointmentSchema])
 async def get_appointments(
-    db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    filters: AppointmentFilterSchema = Depends(),
+    fields: FieldSelection = Depends(SparseFields(AppointmentSchema)),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
 ):
     appointment_service = AppointmentsService(db)
 
-    appointments = await appointment_service.get_appointments()
+    appointments = await appointment_service.get_appointments(
+        page, filters, fields, conditional
+    )
 
     return appointments
 
 
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_appointments(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.ndjson, alias="format"),
+    db: AsyncSession = Depends(get_stream_session),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return appointment_service.export_appointments(export_format, current_user=user)
+
+
+@router.get("/feed", status_code=status.HTTP_200_OK)
+async def appointments_feed(
+    request: Request,
+    vet_id: Optional[int] = Query(None),
+    day: Optional[date] = Query(None),
+    user=Depends(get_current_user),
+):
+    return event_response(request, APPOINTMENTS_CHANNEL, feed_filter(vet_id, day))
+
+
+@router.get(
+    "/availability",
+    status_code=status.HTTP_200_OK,
+    response_model=AvailabilitySchema,
+)
+async def get_availability(
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    duration: int = Query(SLOT_MINUTES, ge=SLOT_MINUTES, multiple_of=SLOT_MINUTES),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return await appointment_service.get_availability(start, end, duration)
+
+
+@router.get(
+    "/vets/{vet_id}/agenda",
+    status_code=status.HTTP_200_OK,
+    response_model=VetAgendaSchema,
+)
+async def get_vet_agenda(
+    vet_id: int,
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return await appointment_service.get_vet_agenda(vet_id, start, end)
+
+
+@router.patch(
+    "/status",
+    status_code=status.HTTP_200_OK,
+    response_model=AppointmentBulkStatusResultSchema,
+)
+async def patch_appointments_status(
+    transition: AppointmentBulkStatusSchema,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    appointment_service = AppointmentsService(db)
+
+    return await appointment_service.patch_appointments_status(
+        transition, current_user=user
+    )
+
+
 @router.get(
     "/{appointment_id}",
     status_code=status.HTTP_200_OK,
@@ -57,12 +264,15 @@ async def get_appointments(
 )
 async def get_appointment(
     appointment_id: int,
-    db: AsyncSession = Depends(get_session),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     user=Depends(get_current_user),
 ):
     appointment_service = AppointmentsService(db)
 
-    appointment = await appointment_service.get_appointment(appointment_id)
+    appointment = await appointment_service.get_appointment(
+        appointment_id, conditional
+    )
 
     return appointment
 
@@ -75,7 +285,7 @@ async def get_appointment(
 async def put_appointment(
     appointment_id: int,
     appointment: AppointmentUpdatechema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     appointment_service = AppointmentsService(db)
@@ -90,7 +300,7 @@ async def put_appointment(
 @router.delete("/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_appointment(
     appointment_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     appointment_service = AppointmentsService(db)
@@ -103,7 +313,7 @@ async def delete_appointment(
 async def patch_appointment(
     appointment_id: int,
     appointment_status: AppointmentPatchStatusSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user = Depends(get_current_user)
 ):
     appointment_service = AppointmentsService(db)
@@ -112,5 +322,3 @@ async def patch_appointment(
     
     return appointment
 
-
-# TODO Criar rota para pegar agenda do veterinário por perído
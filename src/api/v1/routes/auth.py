@@ -14,23 +14,30 @@ from src.models.__user_model import UserModel
 from src.schemas.users_schema import UserCreateSchema, UsersBaseSchema
 from src.services.auth_service import AuthService
 
-from src.core.deps import get_session, get_current_user
+from src.core.deps import get_session, get_current_user, get_current_user_record
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UsersBaseSchema)
-def get_logged(logged_user: UserModel = Depends(get_current_user)):
+def get_logged(logged_user: UserModel = Depends(get_current_user_record)):
     return logged_user
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_session)):
+async def login(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_session, scope="function"),
+):
     auth_service = AuthService(db)
     
     return await auth_service.login(form_data)
 
 @router.post("/users", status_code=status.HTTP_201_CREATED, response_model=UsersBaseSchema)
-async def post_users(user: UserCreateSchema, db: AsyncSession = Depends(get_session), current_user = Depends(get_current_user)):
+async def post_users(
+    user: UserCreateSchema,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    current_user=Depends(get_current_user),
+):
     auth_service = AuthService(db)
     
     return await auth_service.register_user(user, current_user)
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fastapi import APIRouter, status, Depends, Query
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.configs import settings
+from src.schemas.changes_schema import (
+    ChangeEntityEnum,
+    ChangesHeadSchema,
+    ChangesPageSchema,
+)
+from src.services.changes_service import ChangesService
+from src.core.deps import get_session, get_current_user
+
+router = APIRouter()
+
+
+@router.get("/", status_code=status.HTTP_200_OK, response_model=ChangesPageSchema)
+async def get_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    entity: Optional[ChangeEntityEnum] = None,
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    changes_service = ChangesService(db)
+
+    return await changes_service.get_changes(since, limit, entity)
+
+
+@router.get("/head", status_code=status.HTTP_200_OK, response_model=ChangesHeadSchema)
+async def get_changes_head(
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    changes_service = ChangesService(db)
+
+    return await changes_service.get_head()
+
+
+@router.post("/compact", status_code=status.HTTP_200_OK)
+async def compact_changes(
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    changes_service = ChangesService(db)
+
+    return await changes_service.compact(current_user=user)
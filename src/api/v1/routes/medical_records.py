@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, status, HTTPException, Depends, Response
+from fastapi import APIRouter, status, HTTPException, Depends, Response, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
@@ -12,11 +12,21 @@ from src.schemas.medical_records_schema import (
     MedicalRecordSchema,
     MedicalRecordCreateSchema,
     MedicalRecordUpdateSchema,
+    MedicalRecordFilterSchema,
+    MedicalRecordSearchSchema,
 )
 
 from src.services.medical_records_service import MedicalRecordsService
 from src.core.configs import settings
-from src.core.deps import get_session, get_current_user
+from src.utils.pagination import PageParams
+from src.utils.fields import FieldSelection, SparseFields
+from src.utils.export import ExportFormatEnum
+from src.core.deps import (
+    get_session,
+    get_read_session,
+    get_stream_session,
+    get_current_user,
+)
 
 router = APIRouter()
 
@@ -26,7 +36,7 @@ router = APIRouter()
 )
 async def post_medical_record(
     medical_record: MedicalRecordCreateSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     medical_record_service = MedicalRecordsService(db)
@@ -38,11 +48,44 @@ async def post_medical_record(
     "/", status_code=status.HTTP_200_OK, response_model=List[MedicalRecordSchema]
 )
 async def get_medical_records(
-    db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    filters: MedicalRecordFilterSchema = Depends(),
+    fields: FieldSelection = Depends(SparseFields(MedicalRecordSchema)),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    medical_record_service = MedicalRecordsService(db)
+
+    return await medical_record_service.get_medical_records(page, filters, fields)
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_medical_records(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.ndjson, alias="format"),
+    db: AsyncSession = Depends(get_stream_session),
+    user=Depends(get_current_user),
 ):
     medical_record_service = MedicalRecordsService(db)
 
-    return await medical_record_service.get_medical_records()
+    return medical_record_service.export_medical_records(
+        export_format, current_user=user
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=List[MedicalRecordSearchSchema],
+)
+async def search_medical_records(
+    q: str = Query(..., min_length=2, max_length=200),
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    medical_record_service = MedicalRecordsService(db)
+
+    return await medical_record_service.search_medical_records(q, page)
 
 
 @router.get(
@@ -52,7 +95,7 @@ async def get_medical_records(
 )
 async def get_medical_record(
     medical_record_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     user=Depends(get_current_user),
 ):
     medical_record_service = MedicalRecordsService(db)
@@ -68,7 +111,7 @@ async def get_medical_record(
 async def put_medical_record(
     medical_record_id: int,
     medical_record: MedicalRecordUpdateSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     medical_record_service = MedicalRecordsService(db)
@@ -81,12 +124,10 @@ async def put_medical_record(
 @router.delete("/{medical_record_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_medical_record(
     medical_record_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     medical_record_service = MedicalRecordsService(db)
 
     return await medical_record_service.delete_medical_record(medical_record_id)
 
-
-# TODO Exibir prontuários de um animal
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, status, Depends
+
+from src.services.metrics_service import MetricsService
+
+from src.core.deps import get_current_user
+
+router = APIRouter()
+
+
+@router.get("/caches", status_code=status.HTTP_200_OK)
+async def get_cache_metrics(user=Depends(get_current_user)):
+    metrics_service = MetricsService()
+
+    return metrics_service.get_cache_metrics(current_user=user)
+
+
+@router.get("/pool", status_code=status.HTTP_200_OK)
+async def get_pool_metrics(user=Depends(get_current_user)):
+    metrics_service = MetricsService()
+
+    return metrics_service.get_pool_metrics(current_user=user)
@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+from datetime import date
+from fastapi import APIRouter, status, Depends, Query
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.prescriptions_schema import (
+    PrescriptionItemSchema,
+    PrescriptionFilterSchema,
+)
+from src.services.prescriptions_service import PrescriptionsService
+from src.utils.pagination import PageParams
+from src.core.deps import get_read_session, get_current_user
+
+router = APIRouter()
+
+
+@router.get(
+    "/", status_code=status.HTTP_200_OK, response_model=List[PrescriptionItemSchema]
+)
+async def get_prescriptions(
+    page: PageParams = Depends(),
+    filters: PrescriptionFilterSchema = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    prescription_service = PrescriptionsService(db)
+
+    return await prescription_service.get_prescriptions(page, filters)
+
+
+@router.get(
+    "/active",
+    status_code=status.HTTP_200_OK,
+    response_model=List[PrescriptionItemSchema],
+)
+async def get_active_prescriptions(
+    on: Optional[date] = Query(None),
+    page: PageParams = Depends(),
+    filters: PrescriptionFilterSchema = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
+):
+    prescription_service = PrescriptionsService(db)
+
+    return await prescription_service.get_prescriptions(
+        page, filters, active_on=on or date.today()
+    )
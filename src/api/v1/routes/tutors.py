@@ -6,7 +6,9 @@ from src.schemas.tutors_schema import TutorsSchema, TutorWithAnimals, TutorUpdat
 
 from src.services.tutors_service import TutorService
 
-from src.core.deps import get_session, get_current_user
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest
+from src.core.deps import get_session, get_read_session, get_current_user
 
 router = APIRouter()
 
@@ -14,7 +16,7 @@ router = APIRouter()
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=TutorsSchema)
 async def post_tutor(
     tutor: TutorsSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     tutor_service = TutorService(db)
@@ -24,22 +26,26 @@ async def post_tutor(
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=list[TutorsSchema])
 async def get_tutors(
-    db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
 ):
     tutor_service = TutorService(db)
 
-    return await tutor_service.get_tutors()
+    return await tutor_service.get_tutors(page, conditional)
 
 
 @router.get("/{tutor_id}", status_code=status.HTTP_200_OK, response_model=TutorsSchema)
 async def get_tutor(
     tutor_id: int,
-    db: AsyncSession = Depends(get_session),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     user=Depends(get_current_user),
 ):
     tutor_service = TutorService(db)
 
-    return await tutor_service.get_tutor(tutor_id)
+    return await tutor_service.get_tutor(tutor_id, conditional)
 
 
 @router.put(
@@ -50,7 +56,7 @@ async def get_tutor(
 async def put_tutor(
     tutor_id: int,
     tutor: TutorUpdateSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     tutor_service = TutorService(db)
@@ -61,7 +67,7 @@ async def put_tutor(
 @router.delete("/{tutor_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_tutor(
     tutor_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     tutor_service = TutorService(db)
@@ -72,10 +78,11 @@ async def delete_tutor(
 @router.get("/{tutor_id}/animals", response_model=TutorWithAnimals)
 async def get_tutor_with_animals(
     tutor_id: int,
-    db: AsyncSession = Depends(get_session),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     user=Depends(get_current_user),
 ):
 
     tutor_service = TutorService(db)
 
-    return await tutor_service.get_tutor_with_animals(tutor_id)
+    return await tutor_service.get_tutor_with_animals(tutor_id, conditional)
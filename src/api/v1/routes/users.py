@@ -13,18 +13,23 @@ from src.schemas.users_schema import (
 
 from src.services.user_service import UserService
 
-from src.core.deps import get_session, get_current_user
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest
+from src.core.deps import get_session, get_read_session, get_current_user
 
 router = APIRouter()
 
 
 @router.get("/", status_code=status.HTTP_200_OK, response_model=List[UsersBaseSchema])
 async def get_users(
-    db: AsyncSession = Depends(get_session), user=Depends(get_current_user)
+    page: PageParams = Depends(),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
+    user=Depends(get_current_user),
 ):
     user_service = UserService(db)
 
-    return await user_service.get_users()
+    return await user_service.get_users(page, conditional)
 
 
 @router.get(
@@ -32,12 +37,13 @@ async def get_users(
 )
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_session),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_read_session, scope="function"),
     current_user=Depends(get_current_user),
 ):
     user_service = UserService(db)
 
-    return await user_service.get_user(user_id)
+    return await user_service.get_user(user_id, conditional)
 
 
 @router.put(
@@ -46,7 +52,7 @@ async def get_user(
 async def put_user(
     user_id: int,
     user: UserUpdateSchema,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     current_user=Depends(get_current_user),
 ):
     user_service = UserService(db)
@@ -57,7 +63,7 @@ async def put_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: int,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     user_service = UserService(db)
@@ -71,7 +77,7 @@ async def delete_user(
 async def patch_user_is_active(
     user_id: int,
     user_is_active: UserPatchActive,
-    db: AsyncSession = Depends(get_session),
+    db: AsyncSession = Depends(get_session, scope="function"),
     user=Depends(get_current_user),
 ):
     user_service = UserService(db)
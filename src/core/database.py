@@ -1,14 +1,129 @@
-from sqlalchemy.orm import sessionmaker
+from contextlib import asynccontextmanager
+from itertools import cycle
+from time import perf_counter
+from typing import AsyncIterator, Callable, List, Optional
+
+from sqlalchemy import event, make_url
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import sessionmaker, Session as SyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 
 from src.core.configs import settings
 
-engine: AsyncEngine = create_async_engine(settings.DB_URL)
 
-Session: AsyncSession = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False,
-    class_=AsyncSession,
-    bind=engine,
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        start = perf_counter()
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = perf_counter() - start
+            self.acquisitions += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "acquisitions": self.acquisitions,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                self.total_wait / self.acquisitions * 1000 if self.acquisitions else 0.0
+            ),
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    options = {}
+    # Depois do lock por veterinário a checagem de conflito precisa ver o
+    # que já foi commitado, não o snapshot do início da transação. O SQLite
+    # serializa escritas e não aceita esse nível.
+    if make_url(url).get_backend_name() in ("mysql", "postgresql"):
+        options["isolation_level"] = "READ COMMITTED"
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        **options,
+    )
+
+
+def _create_session_factory(bind: AsyncEngine) -> sessionmaker:
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        bind=bind,
+    )
+
+
+engine: AsyncEngine = _create_engine(settings.DB_URL)
+
+Session: AsyncSession = _create_session_factory(engine)
+
+replica_engines: List[AsyncEngine] = [
+    _create_engine(url) for url in settings.DB_REPLICA_URLS
+]
+
+_replica_sessions = cycle(
+    [_create_session_factory(replica) for replica in replica_engines]
 )
+
+
+def replica_session_factory() -> Optional[sessionmaker]:
+    return next(_replica_sessions, None)
+
+
+@event.listens_for(SyncSession, "after_flush")
+def _mark_flush_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(SyncSession, "do_orm_execute")
+def _mark_statement_writes(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@asynccontextmanager
+async def session_scope(session_factory=Session) -> AsyncIterator[AsyncSession]:
+    # Uma sessão, uma conexão e uma transação por unidade de trabalho:
+    # commit ao final, rollback se algo falhar no meio.
+    async with session_factory() as session:
+        async with session.begin():
+            yield session
+
+        for callback in session.info.pop("after_commit", []):
+            callback()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]):
+    session.info.setdefault("after_commit", []).append(callback)
@@ -1,33 +1,102 @@
+import hashlib
 from typing import AsyncGenerator, Optional
 from pydantic import BaseModel
 
-from fastapi import Depends, HTTPException, status
-from jose import jwt, JWTError
+from fastapi import Depends, HTTPException, Request, status
+from jose import JWTError
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select 
 
-from src.core.database import Session
-from src.utils.auth import oauth2_schema
+from src.core.database import (
+    Session,
+    session_scope,
+    after_commit,
+    replica_session_factory,
+)
+from src.utils.auth import oauth2_schema, user_cache, revocation_list, _decode_token
 from src.core.configs import settings
-from src.models.__user_model import UserModel
+from src.models.__user_model import UserModel, UserRoleEnum
+from src.utils.cache import TTLCache
 
 
 class TokenData(BaseModel):
     username: Optional[str] = None
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    session: AsyncSession = Session()
+recent_writers: TTLCache = TTLCache(
+    max_size=10000, ttl=settings.READ_YOUR_WRITES_SECONDS
+)
 
-    try:
+
+def _client_key(request: Request) -> Optional[bytes]:
+    authorization = request.headers.get("authorization")
+
+    if authorization is None:
+        return None
+
+    return hashlib.sha256(authorization.encode()).digest()
+
+
+def _remember_writer(request: Request, session: AsyncSession):
+    key = _client_key(request)
+
+    if key is not None and session.info.get("has_writes"):
+        recent_writers.set(key, True)
+
+
+async def get_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with session_scope(Session) as session:
+        after_commit(session, lambda: _remember_writer(request, session))
+        yield session
+
+
+async def get_read_session(
+    request: Request, db: AsyncSession = Depends(get_session, scope="function")
+) -> AsyncGenerator[AsyncSession, None]:
+    replica = replica_session_factory()
+    key = _client_key(request)
+
+    # Quem escreveu há pouco continua no primário (read-your-writes)
+    if replica is None or (key is not None and recent_writers.get(key)):
+        yield db
+        return
+
+    async with replica() as session:
+        yield session
+
+
+async def get_stream_session() -> AsyncGenerator[AsyncSession, None]:
+    # Escopo da requisição inteira: a sessão continua aberta enquanto a
+    # StreamingResponse é enviada.
+    session_factory = replica_session_factory() or Session
+
+    async with session_factory() as session:
         yield session
-    finally:
-        await session.close()
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[UserModel]:
+    user: Optional[UserModel] = user_cache.get(user_id)
+
+    if user is not None:
+        return user
+
+    generation = user_cache.generation
+    query = select(UserModel).filter(UserModel.id == user_id)
+    result = await db.execute(query)
+
+    user = result.scalars().unique().one_or_none()
+
+    if user is not None:
+        # O cache guarda uma cópia desanexada, compartilhada entre requisições
+        db.expunge(user)
+        user_cache.set(user_id, user, generation=generation)
+
+    return user
 
 
 async def get_current_user(
-    db: AsyncSession = Depends(get_session), token: str = Depends(oauth2_schema)
+    db: AsyncSession = Depends(get_session, scope="function"), token: str = Depends(oauth2_schema)
 ) -> UserModel:
     credential_exception: HTTPException = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,12 +105,7 @@ async def get_current_user(
     )
     
     try: 
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_aud": False}
-        )
+        payload = _decode_token(token)
         username: str = payload.get("sub")
         
         if username is None:
@@ -51,14 +115,39 @@ async def get_current_user(
     except JWTError:
         raise credential_exception
     
-    async with db as session:
-        query = select(UserModel).filter(UserModel.id == int(token_data.username))
-        result = await session.execute(query)
-        
-        user: UserModel = result.scalars().unique().one_or_none()
-        
-        if user is None:
+    user_id = int(token_data.username)
+
+    if settings.JWT_STATELESS and "role" in payload:
+        if revocation_list.is_revoked(user_id, payload["iat"]):
             raise credential_exception
-        
-        return user
-    
\ No newline at end of file
+        if not payload.get("is_active"):
+            raise credential_exception
+
+        return UserModel(
+            id=user_id,
+            role=UserRoleEnum(payload["role"]),
+            is_active=payload["is_active"],
+        )
+
+    user = await _load_user(db, user_id)
+
+    if user is None or not user.is_active:
+        raise credential_exception
+
+    return user
+
+
+async def get_current_user_record(
+    db: AsyncSession = Depends(get_session, scope="function"),
+    user: UserModel = Depends(get_current_user),
+) -> UserModel:
+    user_record = await _load_user(db, user.id)
+
+    if user_record is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="It wasn't possible to authenticate the credential",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    return user_record
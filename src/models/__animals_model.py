@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 from src.core.configs import settings
@@ -12,13 +13,19 @@ class AnimalModel(settings.DBBaseModel):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     name = Column(String(100), nullable=False)
-    species = Column(String(100), nullable=False)
+    species = Column(String(100), nullable=False, index=True)
     breed = Column(String(100), nullable=False)
     birth_date = Column(Date, nullable=False)
     weight_kg = Column(Float, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.now)
-
-    tutor_id = Column(Integer, ForeignKey("tutors.id"), nullable=False)
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
+    )
+
+    tutor_id = Column(Integer, ForeignKey("tutors.id"), nullable=False, index=True)
 
     tutor = relationship("TutorModel", back_populates="animals")
     appointments = relationship("AppointmentsModel", back_populates="animal")
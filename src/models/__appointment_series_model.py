@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import relationship
+
+from enum import Enum as BaseEnum
+
+from src.core.configs import settings
+
+
+class SeriesFrequencyEnum(str, BaseEnum):
+    weekly = "weekly"
+    monthly = "monthly"
+
+
+class AppointmentSeriesModel(settings.DBBaseModel):
+    __tablename__ = "appointment_series"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    vet_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    animal_id = Column(Integer, ForeignKey("animals.id"), nullable=False)
+
+    # Regra de recorrência: starts_at + k * interval (semanas ou meses),
+    # até `count` ocorrências ou até `until`
+    starts_at = Column(DateTime, nullable=False)
+    frequency = Column(Enum(SeriesFrequencyEnum), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    count = Column(Integer, nullable=True)
+    until = Column(DateTime, nullable=True)
+
+    reason = Column(String(300), nullable=False)
+    notes = Column(Text, nullable=True)
+
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
+    )
+
+    appointments = relationship("AppointmentsModel", back_populates="series")
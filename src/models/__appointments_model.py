@@ -10,7 +10,10 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Text,
+    Index,
+    UniqueConstraint,
 )
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 from enum import Enum as BaseEnum
@@ -27,20 +30,46 @@ class AppointmentStatusEnum(str, BaseEnum):
 
 class AppointmentsModel(settings.DBBaseModel):
     __tablename__ = "appointments"
+    __table_args__ = (
+        # Agenda do veterinário: range scan por (vet_id, scheduled_at)
+        Index("ix_appointments_vet_id_scheduled_at", "vet_id", "scheduled_at"),
+        # Histórico do animal: filtra por animal_id já na ordem de scheduled_at
+        Index("ix_appointments_animal_id_scheduled_at", "animal_id", "scheduled_at"),
+        # Um veterinário, um slot: o banco rejeita double-booking no INSERT/UPDATE
+        UniqueConstraint("vet_id", "slot", name="uq_appointments_vet_id_slot"),
+        UniqueConstraint(
+            "series_id", "occurrence_at", name="uq_appointments_series_occurrence"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     vet_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     animal_id = Column(Integer, ForeignKey("animals.id"), nullable=False)
-    scheduled_at = Column(DateTime, nullable=False, default=datetime.now)
+    scheduled_at = Column(DateTime, nullable=False, default=datetime.now, index=True)
     reason = Column(String(300), nullable=False)
-    status = Column(Enum(AppointmentStatusEnum), default="scheduled", nullable=False)
+    status = Column(
+        Enum(AppointmentStatusEnum), default="scheduled", nullable=False, index=True
+    )
     notes = Column(Text, nullable=True)
+    # Slots de 30 min desde a epoch; NULL quando cancelada (libera o horário)
+    slot = Column(Integer, nullable=True)
 
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
 
+    # Ocorrência de série materializada (remarcada, cancelada ou iniciada)
+    series_id = Column(Integer, ForeignKey("appointment_series.id"), nullable=True)
+    occurrence_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
+    )
 
     animal = relationship("AnimalModel", back_populates="appointments")
+    series = relationship("AppointmentSeriesModel", back_populates="appointments")
 
     vet = relationship(
         "UserModel", foreign_keys=[vet_id], back_populates="appointments"
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index
+
+from src.core.configs import settings
+
+
+class ChangeLogModel(settings.DBBaseModel):
+    __tablename__ = "change_log"
+    __table_args__ = (Index("ix_change_log_entity_id", "entity", "id"),)
+
+    # Cursor monotônico do /changes (INTEGER no SQLite para o autoincrement)
+    id = Column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    entity = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    action = Column(String(10), nullable=False)
+    changed_at = Column(DateTime, nullable=False, default=datetime.now, index=True)
@@ -1,5 +1,7 @@
 from sqlalchemy import (
+    DDL,
     Column,
+    Index,
     Integer,
     String,
     Float,
@@ -8,7 +10,8 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Text,
-    JSON
+    JSON,
+    event,
 )
 from sqlalchemy.orm import relationship
 
@@ -18,19 +21,47 @@ from src.core.configs import settings
 
 class MedicalRecordsModel(settings.DBBaseModel):
     __tablename__ = "medical_records"
+    __table_args__ = (
+        # Busca textual em produção; no SQLite a busca usa a tabela FTS5 abaixo
+        Index(
+            "ft_medical_records_diagnosis_treatment",
+            "diagnosis",
+            "treatment",
+            mysql_prefix="FULLTEXT",
+        ).ddl_if(dialect="mysql"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     
-    appointment_id = Column(Integer, ForeignKey("appointments.id", ondelete="CASCADE"), nullable=False)
+    appointment_id = Column(
+        Integer,
+        ForeignKey("appointments.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
     vet_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     diagnosis = Column(Text, nullable=False)
     treatment = Column(Text, nullable=False)
     prescriptions = Column(JSON, nullable=True)
-    follow_up_date = Column(Date, nullable=True)
+    follow_up_date = Column(Date, nullable=True, index=True)
     created_at = Column(Date, default=datetime.now)
     updated_at = Column(Date, default=datetime.now)
     
     appointment = relationship("AppointmentsModel", back_populates="medical_record")
     vet = relationship("UserModel", lazy="selectin")
-    
\ No newline at end of file
+
+
+# Índice FTS5 (rowid = medical_records.id), mantido pelo MedicalRecordsService
+event.listen(
+    MedicalRecordsModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE VIRTUAL TABLE medical_records_fts USING fts5(diagnosis, treatment)"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    MedicalRecordsModel.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS medical_records_fts").execute_if(dialect="sqlite"),
+)
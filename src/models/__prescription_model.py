@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
+
+from src.core.configs import settings
+
+
+class PrescriptionModel(settings.DBBaseModel):
+    __tablename__ = "prescriptions"
+    __table_args__ = (
+        # "Quem está tomando X hoje": igualdade no medicamento + range em ends_on
+        Index("ix_prescriptions_medicine_ends_on", "medicine", "ends_on"),
+        Index("ix_prescriptions_animal_id_ends_on", "animal_id", "ends_on"),
+    )
+
+    # Cópia normalizada de MedicalRecordsModel.prescriptions (o JSON continua
+    # sendo a fonte); reescrita a cada gravação do prontuário
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    medical_record_id = Column(
+        Integer,
+        ForeignKey("medical_records.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    animal_id = Column(Integer, ForeignKey("animals.id"), nullable=False)
+
+    medicine = Column(String(200), nullable=False)
+    dosage = Column(String(100), nullable=False)
+    frequency = Column(String(100), nullable=False)
+    duration_days = Column(Integer, nullable=False)
+    batch = Column(String(100), nullable=True, index=True)
+
+    # Período do tratamento, inclusivo: data da consulta + duration_days - 1
+    starts_on = Column(Date, nullable=False)
+    ends_on = Column(Date, nullable=False)
@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 from datetime import datetime
@@ -15,5 +16,11 @@ class TutorModel(settings.DBBaseModel):
     email = Column(String(200), unique=True, nullable=False)
     phone = Column(String(20), nullable=True)
     address = Column(String(300), nullable=True)
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
+    )
 
     animals = relationship("AnimalModel", back_populates="tutor")
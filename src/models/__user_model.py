@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Boolean, Enum, DateTime
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 
 from datetime import datetime
@@ -23,6 +24,12 @@ class UserModel(settings.DBBaseModel):
     role = Column(Enum(UserRoleEnum), nullable=False)
     is_active = Column(Boolean(), default=True)
     created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(
+        DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now,
+    )
 
     appointments = relationship(
         "AppointmentsModel",
@@ -41,4 +41,10 @@ class AnimalHistorySchema(BaseModel):
     appointments: list[AppointmentHistorySchema] = []
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class AnimalFilterSchema(BaseModel):
+    species: Optional[str] = None
+    tutor_id: Optional[int] = None
+    sort: Optional[str] = None
@@ -1,8 +1,9 @@
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import List, Optional
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, date, timezone
 from enum import Enum
 
+from src.core.configs import settings
 from src.schemas.medical_records_schema import MedicalRecordHistorySchema
 
 
@@ -13,6 +14,11 @@ class AppointmentStatusEnum(str, Enum):
     cancelled = "cancelled"
 
 
+class SeriesFrequencyEnum(str, Enum):
+    weekly = "weekly"
+    monthly = "monthly"
+
+
 class AppointmentSchema(BaseModel):
     id: Optional[int] = None
     animal_id: int
@@ -64,4 +70,122 @@ class AppointmentHistorySchema(BaseModel):
         from_attributes = True
 
 class AppointmentPatchStatusSchema(BaseModel):
-    status: AppointmentStatusEnum
\ No newline at end of file
+    status: AppointmentStatusEnum
+
+
+class AppointmentFilterSchema(BaseModel):
+    vet_id: Optional[int] = None
+    animal_id: Optional[int] = None
+    status: Optional[AppointmentStatusEnum] = None
+    scheduled_from: Optional[datetime] = None
+    scheduled_to: Optional[datetime] = None
+    sort: Optional[str] = None
+
+
+class AgendaItemSchema(BaseModel):
+    id: Optional[int] = None
+    series_id: Optional[int] = None
+    scheduled_at: datetime
+    animal_id: int
+    status: AppointmentStatusEnum
+    reason: str
+
+
+class AgendaDaySchema(BaseModel):
+    day: date
+    appointments: List[AgendaItemSchema]
+
+
+class VetAgendaSchema(BaseModel):
+    vet_id: int
+    start: datetime
+    end: datetime
+    days: List[AgendaDaySchema]
+
+
+class AvailabilityWindowSchema(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class VetAvailabilitySchema(BaseModel):
+    vet_id: int
+    name: str
+    windows: List[AvailabilityWindowSchema]
+
+
+class AvailabilitySchema(BaseModel):
+    start: datetime
+    end: datetime
+    duration_minutes: int
+    vets: List[VetAvailabilitySchema]
+
+
+class AppointmentBulkCreateSchema(BaseModel):
+    appointments: List[AppointmentCreateSchema] = Field(
+        ..., min_length=1, max_length=settings.BULK_MAX_APPOINTMENTS
+    )
+
+
+class BulkItemErrorSchema(BaseModel):
+    index: int
+    detail: str
+
+
+class AppointmentBulkResultSchema(BaseModel):
+    created: int
+    errors: List[BulkItemErrorSchema]
+
+
+class AppointmentSeriesCreateSchema(BaseModel):
+    animal_id: int
+    vet_id: int
+    starts_at: datetime
+    frequency: SeriesFrequencyEnum
+    interval: int = Field(1, ge=1)
+    count: Optional[int] = Field(None, ge=1)
+    until: Optional[datetime] = None
+    reason: str
+    notes: str
+    created_by: int
+
+
+class AppointmentSeriesUpdateSchema(BaseModel):
+    animal_id: Optional[int] = None
+    vet_id: Optional[int] = None
+    starts_at: Optional[datetime] = None
+    frequency: Optional[SeriesFrequencyEnum] = None
+    interval: Optional[int] = Field(None, ge=1)
+    count: Optional[int] = Field(None, ge=1)
+    until: Optional[datetime] = None
+    reason: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class AppointmentSeriesSchema(AppointmentSeriesCreateSchema):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+
+class AppointmentOccurrenceSchema(BaseModel):
+    occurrence_at: datetime
+    scheduled_at: Optional[datetime] = None
+    status: Optional[AppointmentStatusEnum] = None
+    notes: Optional[str] = None
+
+
+class AppointmentBulkStatusSchema(BaseModel):
+    status: AppointmentStatusEnum
+    ids: Optional[List[int]] = Field(
+        None, min_length=1, max_length=settings.BULK_MAX_APPOINTMENTS
+    )
+    vet_id: Optional[int] = None
+    day: Optional[date] = None
+    current_status: Optional[AppointmentStatusEnum] = None
+
+
+class AppointmentBulkStatusResultSchema(BaseModel):
+    status: AppointmentStatusEnum
+    updated: int
@@ -0,0 +1,39 @@
+from typing import List
+from pydantic import BaseModel
+from datetime import datetime
+from enum import Enum
+
+
+class ChangeEntityEnum(str, Enum):
+    tutors = "tutors"
+    animals = "animals"
+    appointments = "appointments"
+    medical_records = "medical_records"
+
+
+class ChangeActionEnum(str, Enum):
+    created = "created"
+    updated = "updated"
+    deleted = "deleted"
+
+
+class ChangeSchema(BaseModel):
+    id: int
+    entity: ChangeEntityEnum
+    entity_id: int
+    action: ChangeActionEnum
+    changed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ChangesPageSchema(BaseModel):
+    changes: List[ChangeSchema]
+    next_since: int
+    has_more: bool
+
+
+class ChangesHeadSchema(BaseModel):
+    head: int
+    horizon: int
@@ -8,6 +8,7 @@ class PrescriptionSchema(BaseModel):
     dosage: str 
     frequency: str 
     duration_days: int
+    batch: Optional[str] = None
 
 class MedicalRecordSchema(BaseModel):
     id: Optional[int]
@@ -23,6 +24,12 @@ class MedicalRecordSchema(BaseModel):
     class Config:
         orm_mode = True
 
+class AnimalMedicalRecordSchema(MedicalRecordSchema):
+    scheduled_at: datetime
+
+class MedicalRecordSearchSchema(MedicalRecordSchema):
+    score: float
+
 class MedicalRecordCreateSchema(BaseModel):
     appointment_id: int
     vet_id: int
@@ -53,9 +60,17 @@ class MedicalRecordHistorySchema(BaseModel):
     id: int
     diagnosis: str
     treatment: str | None = None
-    prescriptions: list[PrescriptionSchema] = []
+    prescriptions: list[PrescriptionSchema] | None = []
     follow_up_date: date | None = None
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class MedicalRecordFilterSchema(BaseModel):
+    vet_id: Optional[int] = None
+    appointment_id: Optional[int] = None
+    follow_up_from: Optional[date] = None
+    follow_up_to: Optional[date] = None
+    sort: Optional[str] = None
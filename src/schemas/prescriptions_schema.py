@@ -0,0 +1,25 @@
+from typing import Optional
+from pydantic import BaseModel
+from datetime import date
+
+
+class PrescriptionItemSchema(BaseModel):
+    id: int
+    medical_record_id: int
+    animal_id: int
+    medicine: str
+    dosage: str
+    frequency: str
+    duration_days: int
+    batch: Optional[str] = None
+    starts_on: date
+    ends_on: date
+
+    class Config:
+        from_attributes = True
+
+
+class PrescriptionFilterSchema(BaseModel):
+    animal_id: Optional[int] = None
+    medicine: Optional[str] = None
+    batch: Optional[str] = None
@@ -1,19 +1,60 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, status, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.configs import settings
+from src.core.database import after_commit
+
 from src.schemas.animals_schema import (
     AnimalHistorySchema,
     AnimalsSchema,
     AnimalsSchemaTutors,
+    AnimalFilterSchema,
 )
 from src.models.__animals_model import AnimalModel
 from src.models.__appointments_model import AppointmentsModel
+from src.utils.pagination import PageParams
+from src.utils.filters import apply_filters, resolve_sort
+from src.utils.fields import FieldSelection
+from src.utils.etag import ConditionalRequest, collection_version
+from src.utils.cache import TTLCache
+from src.services.changes_service import record_change
+
+from src.schemas.appointments_schema import AppointmentHistorySchema
 
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+ANIMAL_FILTERS = {
+    "species": (AnimalModel.species, "eq"),
+    "tutor_id": (AnimalModel.tutor_id, "eq"),
+}
+
+ANIMAL_SORTS = {
+    "id": AnimalModel.id,
+    "name": AnimalModel.name,
+    "created_at": AnimalModel.created_at,
+}
+
+# animal_id -> JSON do AnimalHistorySchema
+history_cache: TTLCache = TTLCache(
+    max_size=settings.HISTORY_CACHE_MAX_SIZE, ttl=settings.HISTORY_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_history(db: AsyncSession, *animal_ids: int):
+    animal_ids = {animal_id for animal_id in animal_ids if animal_id is not None}
+
+    def invalidate():
+        for animal_id in animal_ids:
+            history_cache.invalidate(animal_id)
+
+    after_commit(db, invalidate)
 
 
 class AnimalsService:
@@ -32,85 +73,112 @@ class AnimalsService:
         animal: AnimalModel = AnimalModel(**schema.model_dump())
 
         self.db.add(animal)
-        await self.db.commit()
+        await self.db.flush()
+        record_change(self.db, "animals", animal.id, "created")
 
         return animal
 
-    async def get_animals(self) -> List[AnimalModel]:
-        async with self.db as session:
-            query = select(AnimalModel)
-            results = await session.execute(query)
+    async def get_animals(
+        self,
+        page: PageParams,
+        filters: AnimalFilterSchema,
+        fields: FieldSelection,
+        conditional: ConditionalRequest,
+    ) -> List[AnimalModel]:
+        version_query = apply_filters(
+            collection_version(AnimalModel), filters, ANIMAL_FILTERS
+        )
+        version = await self.db.execute(version_query)
+        not_modified = conditional.evaluate(*version.one())
 
-            animals = results.scalars().unique().all()
+        if not_modified:
+            return not_modified
 
-            return animals
+        sort_column, descending = resolve_sort(filters.sort, ANIMAL_SORTS)
+        query = fields.select(AnimalModel, sort_column)
+        query = apply_filters(query, filters, ANIMAL_FILTERS)
+        query = page.apply(query, AnimalModel.id, sort_column, descending)
+        results = await self.db.execute(query)
 
-    async def get_animal(self, animal_id: int) -> AnimalModel:
-        async with self.db as session:
-            query = select(AnimalModel).where(AnimalModel.id == animal_id)
-            result = await session.execute(query)
+        animals = fields.rows(results)
 
-            animal = result.scalars().unique().one_or_none()
+        return fields.render(page.slice(animals))
 
-            if not animal:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
-                )
+    async def get_animal(
+        self, animal_id: int, conditional: ConditionalRequest
+    ) -> AnimalModel:
+        query = select(AnimalModel).where(AnimalModel.id == animal_id)
+        result = await self.db.execute(query)
+
+        animal = result.scalars().unique().one_or_none()
+
+        if not animal:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
+            )
 
-            return animal
+        return conditional.evaluate(animal.id, animal.updated_at) or animal
 
     async def put_animal(
         self, animal_id: int, animal: AnimalsSchemaTutors
     ) -> AnimalModel:
         self.__validate_animal_weight(animal.weight_kg)
-        async with self.db as session:
-            query = select(AnimalModel).filter(AnimalModel.id == animal_id)
-            result = await session.execute(query)
-
-            animal_up: AnimalModel = result.scalars().unique().one_or_none()
-
-            if animal_up:
-                if animal.name:
-                    animal_up.name = animal.name
-                if animal.species:
-                    animal_up.species = animal.species
-                if animal.breed:
-                    animal_up.breed = animal.breed
-                if animal.birth_date:
-                    animal_up.birth_date = animal.birth_date
-                if animal.weight_kg:
-                    animal_up.weight_kg = animal.weight_kg
-                if animal.tutor_id:
-                    animal_up.tutor_id = animal.tutor_id
-
-                await session.commit()
-                return animal_up
-
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
-                )
+        query = select(AnimalModel).filter(AnimalModel.id == animal_id)
+        result = await self.db.execute(query)
+
+        animal_up: AnimalModel = result.scalars().unique().one_or_none()
+
+        if animal_up:
+            if animal.name:
+                animal_up.name = animal.name
+            if animal.species:
+                animal_up.species = animal.species
+            if animal.breed:
+                animal_up.breed = animal.breed
+            if animal.birth_date:
+                animal_up.birth_date = animal.birth_date
+            if animal.weight_kg:
+                animal_up.weight_kg = animal.weight_kg
+            if animal.tutor_id:
+                animal_up.tutor_id = animal.tutor_id
+
+            record_change(self.db, "animals", animal_up.id, "updated")
+            invalidate_history(self.db, animal_up.id)
+            await self.db.flush()
+            return animal_up
+
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
+            )
                 
     async def delete_animal(
         self, animal_id: int
     ):
-        async with self.db as session:
-            query = select(AnimalModel).filter(AnimalModel.id == animal_id)
-            result = await session.execute(query)
+        query = select(AnimalModel).filter(AnimalModel.id == animal_id)
+        result = await self.db.execute(query)
 
-            animal_del: AnimalModel = result.scalars().unique().one_or_none()
+        animal_del: AnimalModel = result.scalars().unique().one_or_none()
 
-            if animal_del:
-                await session.delete(animal_del)
-                await session.commit()
+        if animal_del:
+            record_change(self.db, "animals", animal_del.id, "deleted")
+            invalidate_history(self.db, animal_del.id)
+            await self.db.delete(animal_del)
+            await self.db.flush()
 
-                return Response(status_code=status.HTTP_204_NO_CONTENT)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
-                )
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
+            )
                 
     async def get_animal_history(self, id):
+        cached = history_cache.get(id)
+
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        generation = history_cache.generation
         stmt = (
             select(AnimalModel)
             .where(AnimalModel.id == id)
@@ -119,11 +187,112 @@ class AnimalsService:
                 .selectinload(AppointmentsModel.medical_record)
             )
         )
-        
+
         result = await self.db.execute(stmt)
         animal = result.scalars().first()
-        
+
         if not animal:
             raise HTTPException(status_code=404, detail="Animal not found")
-        
-        return animal
\ No newline at end of file
+
+        content = AnimalHistorySchema.model_validate(animal).model_dump_json()
+        history_cache.set(id, content, generation=generation)
+
+        return Response(content=content, media_type="application/json")
+
+    def __history_query(
+        self, id: int, start: Optional[datetime], end: Optional[datetime]
+    ):
+        if start and end and end <= start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'to' must be after 'from'.",
+            )
+
+        # selectinload só das consultas da janela, nunca do histórico inteiro
+        query = select(AppointmentsModel).where(AppointmentsModel.animal_id == id)
+        query = query.options(selectinload(AppointmentsModel.medical_record))
+
+        if start:
+            query = query.where(AppointmentsModel.scheduled_at >= start)
+        if end:
+            query = query.where(AppointmentsModel.scheduled_at < end)
+
+        return query
+
+    async def __get_animal_or_404(self, id: int) -> AnimalModel:
+        animal = await self.db.get(AnimalModel, id)
+
+        if not animal:
+            raise HTTPException(status_code=404, detail="Animal not found")
+
+        return animal
+
+    async def get_animal_history_window(
+        self,
+        id: int,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        page: PageParams,
+    ) -> AnimalHistorySchema:
+        query = self.__history_query(id, start, end)
+        animal = await self.__get_animal_or_404(id)
+
+        # Mais recentes primeiro; o cursor segue para as visitas mais antigas
+        query = page.apply(
+            query, AppointmentsModel.id, AppointmentsModel.scheduled_at, True
+        )
+        result = await self.db.execute(query)
+
+        appointments = page.slice(result.scalars().all())
+        set_committed_value(animal, "appointments", appointments)
+
+        return animal
+
+    async def stream_animal_history(
+        self, id: int, start: Optional[datetime], end: Optional[datetime]
+    ) -> StreamingResponse:
+        query = self.__history_query(id, start, end)
+        animal = await self.__get_animal_or_404(id)
+
+        set_committed_value(animal, "appointments", [])
+        header = AnimalHistorySchema.model_validate(animal)
+        header = header.model_dump_json(exclude={"appointments"}) + "\n"
+
+        return StreamingResponse(
+            self.__history_lines(header, query), media_type="application/x-ndjson"
+        )
+
+    async def __history_lines(self, header: str, query) -> AsyncIterator[str]:
+        yield header
+
+        order = (AppointmentsModel.scheduled_at.desc(), AppointmentsModel.id.desc())
+        last = None
+
+        # Lotes por keyset: memória limitada a EXPORT_CHUNK_SIZE consultas
+        while True:
+            batch_query = query
+            if last:
+                batch_query = query.where(
+                    or_(
+                        AppointmentsModel.scheduled_at < last.scheduled_at,
+                        and_(
+                            AppointmentsModel.scheduled_at == last.scheduled_at,
+                            AppointmentsModel.id < last.id,
+                        ),
+                    )
+                )
+
+            batch_query = batch_query.order_by(*order).limit(settings.EXPORT_CHUNK_SIZE)
+            appointments = (await self.db.execute(batch_query)).scalars().all()
+
+            if not appointments:
+                return
+
+            yield "".join(
+                AppointmentHistorySchema.model_validate(appointment).model_dump_json()
+                + "\n"
+                for appointment in appointments
+            )
+
+            last = appointments[-1]
+            self.db.expunge_all()
@@ -0,0 +1,272 @@
+from typing import List, Optional, Sequence, Set, Tuple
+from itertools import islice
+
+from datetime import datetime, timedelta, timezone
+from fastapi import status, HTTPException, Response
+from sqlalchemy import or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.configs import settings
+from src.models.__appointment_series_model import AppointmentSeriesModel
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__user_model import UserModel
+from src.schemas.appointments_schema import (
+    AppointmentSeriesCreateSchema,
+    AppointmentSeriesUpdateSchema,
+)
+from src.utils.recurrence import expand
+from src.utils.slots import SLOT, to_slot, validate_slot
+
+# Campos que mudam onde as ocorrências caem: só eles pedem lock e checagem
+SERIES_RULE_FIELDS = {"vet_id", "starts_at", "frequency", "interval", "count", "until"}
+SERIES_OPTIONAL_FIELDS = {"count", "until", "notes"}
+
+
+class AppointmentSeriesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def __validate_role(self, current_user):
+        if current_user.role not in ["admin", "receptionist"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Not allowed to create Appointments",
+            )
+
+    def __validate_start(self, starts_at: datetime):
+        if starts_at < datetime.now(timezone.utc) + timedelta(minutes=30):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Appointments must be scheduled at least 30 minutes in advance",
+            )
+
+        validate_slot(starts_at)
+
+    def __validate_rule(self, series):
+        if series.count is None and series.until is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A series needs either 'count' or 'until'.",
+            )
+
+    async def lock_vet(self, *vet_ids: int, shared: bool = False):
+        # Ocorrências virtuais não têm linha na unique (vet_id, slot). Séries
+        # pegam o lock exclusivo e consultas o compartilhado, depois de gravar:
+        # consultas seguem em paralelo entre si e a unique decide entre elas
+        for vet_id in sorted(set(vet_ids)):
+            if self.db.get_bind().dialect.name != "sqlite":
+                await self.db.execute(
+                    select(UserModel.id)
+                    .where(UserModel.id == vet_id)
+                    .with_for_update(read=shared)
+                )
+            elif not shared:
+                # SQLite ignora FOR UPDATE; a escrita vazia pega o lock do banco,
+                # que a consulta já segura desde o próprio flush
+                await self.db.execute(
+                    text("UPDATE users SET id = id WHERE id = :id"), {"id": vet_id}
+                )
+
+    async def series_for(
+        self, vet_ids: Sequence[int], start: datetime, end: datetime
+    ) -> List[AppointmentSeriesModel]:
+        query = select(AppointmentSeriesModel).where(
+            AppointmentSeriesModel.vet_id.in_(vet_ids),
+            AppointmentSeriesModel.starts_at < end,
+            or_(
+                AppointmentSeriesModel.until.is_(None),
+                AppointmentSeriesModel.until >= start,
+            ),
+        )
+        result = await self.db.execute(query)
+
+        return result.scalars().all()
+
+    async def virtual_occurrences(
+        self,
+        vet_ids: Sequence[int],
+        start: datetime,
+        end: datetime,
+        exclude: Optional[Tuple[int, datetime]] = None,
+    ) -> List[Tuple[AppointmentSeriesModel, datetime]]:
+        # Ocorrências expandidas só dentro da janela; as já materializadas
+        # viraram linhas em appointments e saem da expansão
+        start, end = start.replace(tzinfo=None), end.replace(tzinfo=None)
+        series = await self.series_for(vet_ids, start, end)
+
+        if not series:
+            return []
+
+        query = select(
+            AppointmentsModel.series_id, AppointmentsModel.occurrence_at
+        ).where(
+            AppointmentsModel.series_id.in_([item.id for item in series]),
+            AppointmentsModel.occurrence_at >= start,
+            AppointmentsModel.occurrence_at < end,
+        )
+        materialized = {tuple(row) for row in (await self.db.execute(query)).all()}
+
+        if exclude:
+            materialized.add(exclude)
+
+        return [
+            (item, moment)
+            for item in series
+            for moment in expand(item, start, end)
+            if (item.id, moment) not in materialized
+        ]
+
+    async def virtual_slots(
+        self,
+        vet_id: int,
+        start: datetime,
+        end: datetime,
+        exclude: Optional[Tuple[int, datetime]] = None,
+    ) -> Set[int]:
+        occurrences = await self.virtual_occurrences([vet_id], start, end, exclude)
+
+        return {to_slot(moment) for _, moment in occurrences}
+
+    def __occurrences(self, series: AppointmentSeriesModel) -> List[datetime]:
+        occurrences = list(
+            islice(
+                expand(series, series.starts_at, series.until or datetime.max),
+                settings.SERIES_MAX_OCCURRENCES + 1,
+            )
+        )
+
+        if len(occurrences) > settings.SERIES_MAX_OCCURRENCES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    "A series is limited to "
+                    f"{settings.SERIES_MAX_OCCURRENCES} occurrences."
+                ),
+            )
+
+        return occurrences
+
+    async def __validate_conflicts(
+        self, series: AppointmentSeriesModel, occurrences: List[datetime]
+    ):
+        # Ocorrências já materializadas (ou canceladas) da própria série são
+        # linhas e ficam de fora da regra
+        if series.id is not None:
+            query = select(AppointmentsModel.occurrence_at).where(
+                AppointmentsModel.series_id == series.id
+            )
+            materialized = set((await self.db.execute(query)).scalars())
+            occurrences = [item for item in occurrences if item not in materialized]
+
+        if not occurrences:
+            return
+
+        # Conflitos contra consultas e outras séries do veterinário no
+        # intervalo da série inteira: duas consultas, o resto é aritmética
+        slots = {to_slot(moment) for moment in occurrences}
+        first, last = min(slots), max(slots)
+
+        query = select(AppointmentsModel.slot).where(
+            AppointmentsModel.vet_id == series.vet_id,
+            AppointmentsModel.slot >= first,
+            AppointmentsModel.slot <= last,
+        )
+        taken = set((await self.db.execute(query)).scalars())
+        taken |= {
+            to_slot(moment)
+            for item, moment in await self.virtual_occurrences(
+                [series.vet_id], occurrences[0], occurrences[-1] + SLOT
+            )
+            if item.id != series.id
+        }
+
+        if slots & taken:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Vet already has an appointment at this time",
+            )
+
+    async def create_series(
+        self, schema: AppointmentSeriesCreateSchema, current_user
+    ) -> AppointmentSeriesModel:
+        self.__validate_role(current_user)
+        self.__validate_start(schema.starts_at)
+        self.__validate_rule(schema)
+
+        series = AppointmentSeriesModel(**schema.model_dump())
+        series.starts_at = schema.starts_at.replace(tzinfo=None)
+        if schema.until:
+            series.until = schema.until.replace(tzinfo=None)
+
+        occurrences = self.__occurrences(series)
+        await self.lock_vet(series.vet_id)
+        await self.__validate_conflicts(series, occurrences)
+
+        self.db.add(series)
+        await self.db.flush()
+
+        return series
+
+    async def update_series(
+        self, series_id: int, schema: AppointmentSeriesUpdateSchema, current_user
+    ) -> AppointmentSeriesModel:
+        # Mudar a regra move todas as ocorrências virtuais de uma vez; as
+        # materializadas são consultas e seguem como estão
+        self.__validate_role(current_user)
+        series = await self.get_series(series_id)
+        changes = {
+            field: value.replace(tzinfo=None) if isinstance(value, datetime) else value
+            for field, value in schema.model_dump(exclude_unset=True).items()
+            if value is not None or field in SERIES_OPTIONAL_FIELDS
+        }
+
+        if schema.starts_at:
+            self.__validate_start(schema.starts_at)
+
+        reschedule = not SERIES_RULE_FIELDS.isdisjoint(changes)
+
+        if reschedule:
+            await self.lock_vet(series.vet_id, changes.get("vet_id", series.vet_id))
+
+        for field, value in changes.items():
+            setattr(series, field, value)
+
+        if reschedule:
+            self.__validate_rule(series)
+            await self.__validate_conflicts(series, self.__occurrences(series))
+
+        await self.db.flush()
+
+        return series
+
+    async def end_series(self, series_id: int, current_user):
+        # Encerrar só encurta a série: nada novo para checar, nenhum lock.
+        # Ocorrências passadas e as materializadas continuam
+        self.__validate_role(current_user)
+        series = await self.get_series(series_id)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        if series.until is None or series.until > now:
+            series.until = now
+            await self.db.flush()
+
+        return Response(
+            content="Series Ended Successfully",
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+
+    async def get_series(self, series_id: int) -> AppointmentSeriesModel:
+        query = select(AppointmentSeriesModel).where(
+            AppointmentSeriesModel.id == series_id
+        )
+        result = await self.db.execute(query)
+
+        series = result.scalars().one_or_none()
+
+        if not series:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Series not found."
+            )
+
+        return series
@@ -1,6 +1,8 @@
-from typing import List
+from typing import Callable, List, Optional
+from contextlib import asynccontextmanager
+from itertools import groupby
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from fastapi import APIRouter, status, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,15 +11,102 @@ from src.schemas.appointments_schema import (
     AppointmentCreateSchema,
     AppointmentUpdatechema,
     AppointmentPatchStatusSchema,
+    AppointmentFilterSchema,
+    VetAgendaSchema,
+    AvailabilitySchema,
+    AppointmentBulkResultSchema,
+    AppointmentOccurrenceSchema,
+    AppointmentBulkStatusSchema,
+    AppointmentBulkStatusResultSchema,
+)
+from src.core.configs import settings
+from src.core.database import after_commit
+from src.models.__appointments_model import AppointmentsModel, AppointmentStatusEnum
+from src.utils.pagination import PageParams
+from src.utils.filters import apply_filters, resolve_sort
+from src.utils.fields import FieldSelection
+from src.utils.etag import ConditionalRequest, collection_version
+from src.utils.export import ExportFormatEnum, export_response
+from src.utils.events import broker
+from src.models.__user_model import UserModel, UserRoleEnum
+from src.services.appointment_series_service import AppointmentSeriesService
+from src.services.changes_service import record_change, record_changes
+from src.services.animal_service import invalidate_history
+from src.services.prescriptions_service import move_prescriptions
+from src.utils.recurrence import is_occurrence
+from src.utils.slots import (
+    SLOT,
+    SLOT_MINUTES,
+    ceil_slot,
+    free_windows,
+    from_slot,
+    to_slot,
+    validate_slot,
 )
-from src.models.__appointments_model import AppointmentsModel
 
+from sqlalchemy import insert, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 
+APPOINTMENT_FILTERS = {
+    "vet_id": (AppointmentsModel.vet_id, "eq"),
+    "animal_id": (AppointmentsModel.animal_id, "eq"),
+    "status": (AppointmentsModel.status, "eq"),
+    "scheduled_from": (AppointmentsModel.scheduled_at, "gte"),
+    "scheduled_to": (AppointmentsModel.scheduled_at, "lt"),
+}
+
+# Transições permitidas: status destino <- status de origem
+STATUS_TRANSITIONS = {
+    AppointmentStatusEnum.in_progress: [AppointmentStatusEnum.scheduled],
+    AppointmentStatusEnum.completed: [AppointmentStatusEnum.in_progress],
+    AppointmentStatusEnum.cancelled: [
+        AppointmentStatusEnum.scheduled,
+        AppointmentStatusEnum.in_progress,
+    ],
+}
+
+APPOINTMENTS_CHANNEL = "appointments"
+
+APPOINTMENT_SORTS = {
+    "id": AppointmentsModel.id,
+    "scheduled_at": AppointmentsModel.scheduled_at,
+    "created_at": AppointmentsModel.created_at,
+}
+
+
+def _appointment_event(event_type: str, appointment) -> dict:
+    scheduled_at = appointment.scheduled_at.replace(tzinfo=None)
+
+    return {
+        "type": event_type,
+        "id": appointment.id,
+        "vet_id": appointment.vet_id,
+        "animal_id": appointment.animal_id,
+        "scheduled_at": scheduled_at.isoformat(),
+        "status": AppointmentStatusEnum(appointment.status).value,
+    }
+
+
+def feed_filter(vet_id: Optional[int], day: Optional[date]) -> Callable[[dict], bool]:
+    def accept(message: dict) -> bool:
+        # Eventos sem vet_id/dia (ex.: status em lote) vão para todos
+        if vet_id is not None and message.get("vet_id") not in (None, vet_id):
+            return False
+
+        moment = message.get("scheduled_at") or message.get("day")
+        if day is not None and moment is not None:
+            return moment[:10] == day.isoformat()
+
+        return True
+
+    return accept
+
 
 class AppointmentsService:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.series = AppointmentSeriesService(db)
 
     def __validate_role(self, current_user) -> bool:
         if current_user.role not in ["admin", "receptionist"]:
@@ -33,6 +122,13 @@ class AppointmentsService:
                 detail="Not allowed to update Appointment's status",
             )
 
+    def __validate_admin_role(self, current_user):
+        if current_user.role not in ["admin"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only Admins are allowed for this method.",
+            )
+
     def __validate_time(self, schema: AppointmentCreateSchema):
         if schema.scheduled_at < datetime.now(timezone.utc) + timedelta(minutes=30):
             raise HTTPException(
@@ -40,19 +136,59 @@ class AppointmentsService:
                 detail="Appointments must be scheduled at least 30 minutes in advance",
             )
 
-    async def __validate_conflict(self, vet_id, schedule_time):
-        end_time = schedule_time + timedelta(minutes=30)
+    def __validate_period(self, start: datetime, end: datetime):
+        if end <= start:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'to' must be after 'from'.",
+            )
+        if end - start > timedelta(days=settings.AGENDA_MAX_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Period is limited to {settings.AGENDA_MAX_DAYS} days.",
+            )
 
-        query = select(AppointmentsModel).where(
-            AppointmentsModel.vet_id == vet_id,
-            AppointmentsModel.scheduled_at < end_time,
-            AppointmentsModel.scheduled_at > schedule_time - timedelta(minutes=30),
+    def __assign_slot(self, appointment: AppointmentsModel):
+        if appointment.status == AppointmentStatusEnum.cancelled:
+            appointment.slot = None
+        else:
+            appointment.slot = to_slot(appointment.scheduled_at)
+
+    async def __validate_series_conflict(
+        self, appointment: AppointmentsModel, exclude=None
+    ):
+        # Ocorrências de séries ainda não materializadas não têm linha nem slot
+        if appointment.slot is None:
+            return
+
+        # Chamada depois do flush: a escrita já está feita e o lock compartilhado
+        # só espera uma série do veterinário em criação ou edição
+        await self.series.lock_vet(appointment.vet_id, shared=True)
+        start = from_slot(appointment.slot)
+        taken = await self.series.virtual_slots(
+            appointment.vet_id, start, start + SLOT, exclude
         )
 
-        result = await self.db.execute(query)
-        conflict = result.scalars().first()
+        if appointment.slot in taken:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Vet already has an appointment at this time",
+            )
+
+    def __publish(self, message: dict):
+        # Só depois do commit: assinantes nunca veem escrita desfeita
+        after_commit(
+            self.db, lambda: broker.publish(APPOINTMENTS_CHANNEL, message)
+        )
 
-        if conflict:
+    @asynccontextmanager
+    async def __slot_conflicts(self):
+        # A unique (vet_id, slot) decide o conflito no próprio INSERT/UPDATE
+        try:
+            yield
+        except IntegrityError as exc:
+            if "slot" not in str(exc.orig):
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Vet already has an appointment at this time",
@@ -63,92 +199,431 @@ class AppointmentsService:
     ) -> AppointmentsModel:
         self.__validate_role(current_user)
         self.__validate_time(schema)
-        await self.__validate_conflict(
-            vet_id=schema.vet_id, schedule_time=schema.scheduled_at
-        )
+        validate_slot(schema.scheduled_at)
 
         appointment: AppointmentsModel = AppointmentsModel(**schema.dict())
+        self.__assign_slot(appointment)
 
         self.db.add(appointment)
-        await self.db.commit()
+        async with self.__slot_conflicts():
+            await self.db.flush()
+        await self.__validate_series_conflict(appointment)
         await self.db.refresh(appointment)
+        record_change(self.db, "appointments", appointment.id, "created")
+        invalidate_history(self.db, appointment.animal_id)
+        self.__publish(_appointment_event("created", appointment))
 
         return appointment
 
-    async def get_appointments(self) -> List[AppointmentSchema]:
-        async with self.db as session:
-            query = select(AppointmentsModel)
-            result = await session.execute(query)
+    async def create_appointments_bulk(
+        self, schemas: List[AppointmentCreateSchema], partial: bool, current_user
+    ) -> AppointmentBulkResultSchema:
+        self.__validate_role(current_user)
+        errors = {}
+        candidates = []
+
+        for index, schema in enumerate(schemas):
+            try:
+                self.__validate_time(schema)
+                validate_slot(schema.scheduled_at)
+            except HTTPException as exc:
+                errors[index] = exc.detail
+            else:
+                candidates.append((schema.vet_id, to_slot(schema.scheduled_at), index))
+
+        # Ordenado por (vet, slot), conflitos dentro do lote ficam adjacentes
+        candidates.sort()
+        slots_by_vet = {}
+
+        for vet_id, items in groupby(candidates, key=lambda item: item[0]):
+            kept = []
+            for _, slot, index in items:
+                if kept and kept[-1][0] == slot:
+                    errors[index] = f"Conflicts with item {kept[-1][1]} of this batch."
+                else:
+                    kept.append((slot, index))
+            slots_by_vet[vet_id] = kept
+
+        # Uma consulta por veterinário cobrindo o intervalo de slots do lote
+        for vet_id, kept in slots_by_vet.items():
+            query = select(AppointmentsModel.slot).where(
+                AppointmentsModel.vet_id == vet_id,
+                AppointmentsModel.slot >= kept[0][0],
+                AppointmentsModel.slot <= kept[-1][0],
+            )
+            taken = set((await self.db.execute(query)).scalars())
+            taken |= await self.series.virtual_slots(
+                vet_id, from_slot(kept[0][0]), from_slot(kept[-1][0] + 1)
+            )
+
+            for slot, index in kept:
+                if slot in taken:
+                    errors[index] = "Vet already has an appointment at this time"
+
+        report = [
+            {"index": index, "detail": detail}
+            for index, detail in sorted(errors.items())
+        ]
+
+        if report and not partial:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=report
+            )
+
+        rows = [
+            {**schema.model_dump(), "slot": to_slot(schema.scheduled_at)}
+            for index, schema in enumerate(schemas)
+            if index not in errors
+        ]
+
+        if rows:
+            async with self.__slot_conflicts():
+                await self.db.execute(insert(AppointmentsModel), rows)
+
+            # Série criada em paralelo com a checagem acima: revalida depois
+            # da escrita, sob o lock compartilhado
+            await self.series.lock_vet(*slots_by_vet, shared=True)
+            for vet_id, kept in slots_by_vet.items():
+                slots = {slot for slot, index in kept if index not in errors}
+                if not slots:
+                    continue
+
+                virtual = await self.series.virtual_slots(
+                    vet_id, from_slot(min(slots)), from_slot(max(slots) + 1)
+                )
+                if slots & virtual:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Vet already has an appointment at this time",
+                    )
+
+            # (vet_id, slot) é único, então identifica as linhas recém-criadas
+            pairs = [(row["vet_id"], row["slot"]) for row in rows]
+            created = tuple_(
+                AppointmentsModel.vet_id, AppointmentsModel.slot
+            ).in_(pairs)
+            await record_changes(
+                self.db, "appointments", "created", AppointmentsModel.id, created
+            )
+            invalidate_history(self.db, *(row["animal_id"] for row in rows))
+
+            query = select(
+                AppointmentsModel.id,
+                AppointmentsModel.vet_id,
+                AppointmentsModel.animal_id,
+                AppointmentsModel.scheduled_at,
+                AppointmentsModel.status,
+            ).where(created)
+            for appointment in (await self.db.execute(query)).all():
+                self.__publish(_appointment_event("created", appointment))
+
+        return {"created": len(rows), "errors": report}
+
+    async def get_appointments(
+        self,
+        page: PageParams,
+        filters: AppointmentFilterSchema,
+        fields: FieldSelection,
+        conditional: ConditionalRequest,
+    ) -> List[AppointmentSchema]:
+        version_query = apply_filters(
+            collection_version(AppointmentsModel), filters, APPOINTMENT_FILTERS
+        )
+        version = await self.db.execute(version_query)
+        not_modified = conditional.evaluate(*version.one())
+
+        if not_modified:
+            return not_modified
 
-            appointments = result.scalars().unique().all()
+        sort_column, descending = resolve_sort(filters.sort, APPOINTMENT_SORTS)
+        query = fields.select(AppointmentsModel, sort_column)
+        query = apply_filters(query, filters, APPOINTMENT_FILTERS)
+        query = page.apply(query, AppointmentsModel.id, sort_column, descending)
+        result = await self.db.execute(query)
+
+        appointments = fields.rows(result)
+
+        return fields.render(page.slice(appointments))
 
-            return appointments
+    async def get_vet_agenda(
+        self, vet_id: int, start: datetime, end: datetime
+    ) -> VetAgendaSchema:
+        self.__validate_period(start, end)
 
-    async def get_appointment(self, appointment_id: int) -> AppointmentSchema:
-        async with self.db as session:
-            query = select(AppointmentsModel).where(
-                AppointmentsModel.id == appointment_id
+        query = (
+            select(
+                AppointmentsModel.id,
+                AppointmentsModel.series_id,
+                AppointmentsModel.scheduled_at,
+                AppointmentsModel.animal_id,
+                AppointmentsModel.status,
+                AppointmentsModel.reason,
             )
-            result = await session.execute(query)
+            .where(
+                AppointmentsModel.vet_id == vet_id,
+                AppointmentsModel.scheduled_at >= start,
+                AppointmentsModel.scheduled_at < end,
+            )
+            .order_by(AppointmentsModel.scheduled_at)
+        )
+        result = await self.db.execute(query)
+
+        items = [row._asdict() for row in result.all()]
+        items += [
+            {
+                "series_id": series.id,
+                "scheduled_at": moment,
+                "animal_id": series.animal_id,
+                "status": AppointmentStatusEnum.scheduled,
+                "reason": series.reason,
+            }
+            for series, moment in await self.series.virtual_occurrences(
+                [vet_id], start, end
+            )
+        ]
+        items.sort(key=lambda item: item["scheduled_at"])
 
-            appointment = result.scalars().unique().one_or_none()
+        days = [
+            {"day": day, "appointments": list(rows)}
+            for day, rows in groupby(
+                items, key=lambda item: item["scheduled_at"].date()
+            )
+        ]
 
-            return appointment
+        return {"vet_id": vet_id, "start": start, "end": end, "days": days}
+
+    async def get_availability(
+        self, start: datetime, end: datetime, duration: int
+    ) -> AvailabilitySchema:
+        self.__validate_period(start, end)
+
+        # Mesma regra de __validate_time: no mínimo 30 minutos de antecedência
+        earliest = ceil_slot(datetime.now(timezone.utc) + timedelta(minutes=30))
+        first, last = max(ceil_slot(start), earliest), to_slot(end)
+        need = duration // SLOT_MINUTES
+
+        vets_query = (
+            select(UserModel.id, UserModel.name)
+            .where(UserModel.role == UserRoleEnum.vet, UserModel.is_active.is_(True))
+            .order_by(UserModel.id)
+        )
+        vets = (await self.db.execute(vets_query)).all()
+
+        booked_query = (
+            select(AppointmentsModel.vet_id, AppointmentsModel.slot)
+            .where(
+                AppointmentsModel.vet_id.in_([vet.id for vet in vets]),
+                AppointmentsModel.slot >= first,
+                AppointmentsModel.slot < last,
+            )
+            .order_by(AppointmentsModel.vet_id, AppointmentsModel.slot)
+        )
+        result = await self.db.execute(booked_query)
+        booked = {
+            vet_id: [row.slot for row in rows]
+            for vet_id, rows in groupby(result.all(), key=lambda row: row.vet_id)
+        }
+
+        virtual = await self.series.virtual_occurrences(
+            [vet.id for vet in vets], from_slot(first), from_slot(last)
+        )
+        for series, moment in virtual:
+            booked.setdefault(series.vet_id, []).append(to_slot(moment))
+        for slots in booked.values():
+            slots.sort()
+
+        availability = []
+        for vet in vets:
+            windows = free_windows(booked.get(vet.id, []), first, last, need)
+            if windows:
+                availability.append(
+                    {
+                        "vet_id": vet.id,
+                        "name": vet.name,
+                        "windows": [
+                            {"start": from_slot(a), "end": from_slot(b)}
+                            for a, b in windows
+                        ],
+                    }
+                )
+
+        return {
+            "start": start,
+            "end": end,
+            "duration_minutes": duration,
+            "vets": availability,
+        }
+
+    def export_appointments(self, export_format: ExportFormatEnum, current_user):
+        self.__validate_admin_role(current_user)
+        query = select(*AppointmentsModel.__table__.columns).order_by(
+            AppointmentsModel.id
+        )
+
+        return export_response(self.db, query, export_format, "appointments")
+
+    async def get_appointment(
+        self, appointment_id: int, conditional: ConditionalRequest
+    ) -> AppointmentSchema:
+        query = select(AppointmentsModel).where(
+            AppointmentsModel.id == appointment_id
+        )
+        result = await self.db.execute(query)
+
+        appointment = result.scalars().unique().one_or_none()
+
+        if not appointment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Appointment not found.",
+            )
+
+        not_modified = conditional.evaluate(appointment.id, appointment.updated_at)
+
+        return not_modified or appointment
 
     async def put_appointment(
         self, appointment_id: int, schema: AppointmentUpdatechema
     ) -> AppointmentSchema:
-        async with self.db as session:
-            query = select(AppointmentsModel).filter(
-                AppointmentsModel.id == appointment_id
-            )
-            result = await session.execute(query)
-            appointment_up = result.scalars().unique().one_or_none()
+        query = select(AppointmentsModel).filter(
+            AppointmentsModel.id == appointment_id
+        )
+        result = await self.db.execute(query)
+        appointment_up = result.scalars().unique().one_or_none()
 
-            if not appointment_up:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Appointment not found.",
-                )
+        if not appointment_up:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Appointment not found.",
+            )
 
-            if schema.animal_id:
-                appointment_up.animal_id = schema.animal_id
-            if schema.vet_id:
-                appointment_up.vet_id = schema.vet_id
-            if schema.reason:
-                appointment_up.reason = schema.reason
-            if schema.notes:
-                appointment_up.notes = schema.notes
-            if schema.created_by:
-                appointment_up.created_by = schema.created_by
+        invalidate_history(self.db, appointment_up.animal_id)
+
+        if schema.animal_id:
+            appointment_up.animal_id = schema.animal_id
+        if schema.vet_id:
+            appointment_up.vet_id = schema.vet_id
+        if schema.scheduled_at:
+            self.__validate_time(schema)
+            validate_slot(schema.scheduled_at)
+            appointment_up.scheduled_at = schema.scheduled_at
+        if schema.reason:
+            appointment_up.reason = schema.reason
+        if schema.notes:
+            appointment_up.notes = schema.notes
+        if schema.created_by:
+            appointment_up.created_by = schema.created_by
+
+        self.__assign_slot(appointment_up)
+        async with self.__slot_conflicts():
+            await self.db.flush()
+        await self.__validate_series_conflict(appointment_up)
+
+        record_change(self.db, "appointments", appointment_up.id, "updated")
+        invalidate_history(self.db, appointment_up.animal_id)
+        if schema.animal_id or schema.scheduled_at:
+            await move_prescriptions(self.db, appointment_up)
+        self.__publish(_appointment_event("updated", appointment_up))
+
+        return appointment_up
+
+    async def materialize_occurrence(
+        self, series_id: int, schema: AppointmentOccurrenceSchema, current_user
+    ) -> AppointmentsModel:
+        self.__validate_role(current_user)
+        if schema.status:
+            self.__validate_vet_or_admin_role(current_user)
 
-            await session.commit()
+        series = await self.series.get_series(series_id)
+        occurrence_at = schema.occurrence_at.replace(tzinfo=None)
 
-            return appointment_up
+        if not is_occurrence(series, occurrence_at):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Occurrence not found.",
+            )
 
-    async def delete_appointment(self, appointment_id: int):
-        async with self.db as session:
-            query = select(AppointmentsModel).filter(
-                AppointmentsModel.id == appointment_id
+        query = select(AppointmentsModel.id).where(
+            AppointmentsModel.series_id == series.id,
+            AppointmentsModel.occurrence_at == occurrence_at,
+        )
+        if (await self.db.execute(query)).first():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Occurrence already materialized.",
             )
-            result = await session.execute(query)
 
-            appointment_del = result.scalars().unique().one_or_none()
+        appointment = AppointmentsModel(
+            vet_id=series.vet_id,
+            animal_id=series.animal_id,
+            scheduled_at=occurrence_at,
+            reason=series.reason,
+            notes=series.notes,
+            created_by=series.created_by,
+            status=AppointmentStatusEnum.scheduled,
+            series_id=series.id,
+            occurrence_at=occurrence_at,
+        )
 
-            if not appointment_del:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Appointment not found.",
-                )
+        if schema.scheduled_at:
+            self.__validate_time(schema)
+            validate_slot(schema.scheduled_at)
+            appointment.scheduled_at = schema.scheduled_at
+        if schema.status:
+            appointment.status = schema.status
+        if schema.notes:
+            appointment.notes = schema.notes
 
-            await session.delete(appointment_del)
-            await session.commit()
+        self.__assign_slot(appointment)
+
+        self.db.add(appointment)
+        async with self.__slot_conflicts():
+            await self.db.flush()
+        await self.__validate_series_conflict(
+            appointment, exclude=(series.id, occurrence_at)
+        )
+        await self.db.refresh(appointment)
+        record_change(self.db, "appointments", appointment.id, "created")
+        invalidate_history(self.db, appointment.animal_id)
+        self.__publish(_appointment_event("created", appointment))
 
-            return Response(
-                content="Appointment Deleted Successfully",
-                status_code=status.HTTP_204_NO_CONTENT,
+        return appointment
+
+    async def delete_appointment(self, appointment_id: int):
+        query = select(AppointmentsModel).filter(
+            AppointmentsModel.id == appointment_id
+        )
+        result = await self.db.execute(query)
+
+        appointment_del = result.scalars().unique().one_or_none()
+
+        if not appointment_del:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Appointment not found.",
             )
 
+        invalidate_history(self.db, appointment_del.animal_id)
+
+        # Ocorrência de série vira lápide: cancelada e sem slot. Sem a linha,
+        # a ocorrência virtual voltaria a aparecer na agenda
+        if appointment_del.series_id is not None:
+            appointment_del.status = AppointmentStatusEnum.cancelled
+            self.__assign_slot(appointment_del)
+            await self.db.flush()
+            record_change(self.db, "appointments", appointment_del.id, "updated")
+            self.__publish(_appointment_event("status", appointment_del))
+        else:
+            record_change(self.db, "appointments", appointment_del.id, "deleted")
+            await self.db.delete(appointment_del)
+            await self.db.flush()
+            self.__publish(_appointment_event("deleted", appointment_del))
+
+        return Response(
+            content="Appointment Deleted Successfully",
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+
     async def patch_appointment_status(
         self,
         appointment_id: int,
@@ -156,24 +631,103 @@ class AppointmentsService:
         current_user,
     ):
         self.__validate_vet_or_admin_role(current_user)
-        async with self.db as session:
-            query = select(AppointmentsModel).filter(
-                AppointmentsModel.id == appointment_id
+        query = select(AppointmentsModel).filter(
+            AppointmentsModel.id == appointment_id
+        )
+        result = await self.db.execute(query)
+
+        appointment_patch: AppointmentsModel = (
+            result.scalars().unique().one_or_none()
+        )
+
+        if not appointment_patch:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Appointment not found",
             )
-            result = await session.execute(query)
 
-            appointment_patch: AppointmentsModel = (
-                result.scalars().unique().one_or_none()
+        appointment_patch.status = new_status.status
+        self.__assign_slot(appointment_patch)
+
+        async with self.__slot_conflicts():
+            await self.db.flush()
+        await self.__validate_series_conflict(appointment_patch)
+
+        record_change(self.db, "appointments", appointment_patch.id, "updated")
+        invalidate_history(self.db, appointment_patch.animal_id)
+        self.__publish(_appointment_event("status", appointment_patch))
+
+        return appointment_patch
+
+    async def patch_appointments_status(
+        self, schema: AppointmentBulkStatusSchema, current_user
+    ) -> AppointmentBulkStatusResultSchema:
+        self.__validate_vet_or_admin_role(current_user)
+        target = AppointmentStatusEnum(schema.status.value)
+
+        if target not in STATUS_TRANSITIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Appointments cannot be moved back to '{target.value}'.",
             )
 
-            if not appointment_patch:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Appointment not found",
-                )
+        conditions = []
+        if schema.ids:
+            conditions.append(AppointmentsModel.id.in_(schema.ids))
+        if schema.vet_id:
+            conditions.append(AppointmentsModel.vet_id == schema.vet_id)
+        if schema.day:
+            start = datetime.combine(schema.day, datetime.min.time())
+            end = start + timedelta(days=1)
+            conditions.append(AppointmentsModel.scheduled_at >= start)
+            conditions.append(AppointmentsModel.scheduled_at < end)
+
+        if not conditions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Provide 'ids' or at least one of 'vet_id' and 'day'.",
+            )
+
+        allowed = STATUS_TRANSITIONS[target]
+        if schema.current_status:
+            allowed = [item for item in allowed if item == schema.current_status]
+
+        # Um único UPDATE; a regra de transição fica no WHERE
+        # updated_at explícito marca as linhas deste UPDATE para o change log
+        changed_at = datetime.now()
+        values = {"status": target, "updated_at": changed_at}
+        if target == AppointmentStatusEnum.cancelled:
+            values["slot"] = None
+
+        statement = (
+            update(AppointmentsModel)
+            .where(*conditions, AppointmentsModel.status.in_(allowed))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(statement)
 
-            appointment_patch.status = new_status.status
+        if result.rowcount:
+            changed = (
+                *conditions,
+                AppointmentsModel.status == target,
+                AppointmentsModel.updated_at == changed_at,
+            )
+            await record_changes(
+                self.db, "appointments", "updated", AppointmentsModel.id, *changed
+            )
+            animals = select(AppointmentsModel.animal_id).where(*changed).distinct()
+            invalidate_history(self.db, *(await self.db.execute(animals)).scalars())
+            self.__publish(
+                {
+                    "type": "bulk_status",
+                    "status": target.value,
+                    "ids": schema.ids,
+                    "vet_id": schema.vet_id,
+                    "day": schema.day.isoformat() if schema.day else None,
+                    "updated": result.rowcount,
+                }
+            )
 
-            await session.commit()
+        return {"status": target, "updated": result.rowcount}
 
-            return appointment_patch
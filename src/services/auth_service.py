@@ -37,7 +37,9 @@ class AuthService:
         
         return JSONResponse(
             content={
-                "access_token": _create_access_token(sub=user.id),
+                "access_token": _create_access_token(
+                    sub=user.id, role=user.role.value, is_active=user.is_active
+                ),
                 "token_type": "bearer"
             },
             status_code=status.HTTP_200_OK
@@ -49,18 +51,17 @@ class AuthService:
         new_user = UserModel(
             name=user.name,
             email=user.email,
-            password=security.generate_hashed_password(user.password),
+            password=await security.generate_hashed_password(user.password),
             role=user.role,
         )
 
         try:
             self.db.add(new_user)
-            await self.db.commit()
+            await self.db.flush()
             await self.db.refresh(new_user)
             return new_user
 
         except IntegrityError:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="This e-mail is already in use.",
@@ -0,0 +1,142 @@
+from typing import Optional
+
+from datetime import datetime, timedelta
+from fastapi import status, HTTPException
+from sqlalchemy import delete, func, insert, literal, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.core.configs import settings
+from src.models.__change_log_model import ChangeLogModel
+from src.schemas.changes_schema import (
+    ChangeEntityEnum,
+    ChangesHeadSchema,
+    ChangesPageSchema,
+)
+
+# A linha mais antiga que sobra da compactação vira o marco do horizonte
+COMPACTED = "compacted"
+
+
+def record_change(db: AsyncSession, entity: str, entity_id: int, action: str):
+    # Entra no mesmo flush/commit da escrita que descreve
+    db.add(ChangeLogModel(entity=entity, entity_id=entity_id, action=action))
+
+
+async def record_changes(
+    db: AsyncSession, entity: str, action: str, id_column, *where
+):
+    # Escritas em lote: um INSERT ... SELECT com as linhas afetadas
+    rows = select(
+        literal(entity), id_column, literal(action), literal(datetime.now())
+    ).where(*where)
+    columns = ["entity", "entity_id", "action", "changed_at"]
+
+    await db.execute(insert(ChangeLogModel).from_select(columns, rows))
+
+
+class ChangesService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _validate_role(self, current_user):
+        if current_user.role not in ["admin"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only Admins are allowed for this method.",
+            )
+
+    async def __horizon(self) -> int:
+        query = select(ChangeLogModel.id, ChangeLogModel.action).order_by(
+            ChangeLogModel.id
+        )
+        oldest = (await self.db.execute(query.limit(1))).one_or_none()
+
+        return oldest.id if oldest and oldest.action == COMPACTED else 0
+
+    async def __settling_id(self, since: int) -> Optional[int]:
+        # O cursor para antes do primeiro id ainda recente: um id menor que
+        # não commitou a tempo nunca fica para trás do next_since
+        cutoff = datetime.now() - timedelta(seconds=settings.CHANGE_LOG_SETTLE_SECONDS)
+        settling = select(func.min(ChangeLogModel.id)).where(
+            ChangeLogModel.id > since, ChangeLogModel.changed_at > cutoff
+        )
+
+        return (await self.db.execute(settling)).scalar_one_or_none()
+
+    async def get_head(self) -> ChangesHeadSchema:
+        # Cursor para quem acabou de sincronizar as coleções do zero
+        horizon = await self.__horizon()
+        settling_id = await self.__settling_id(horizon)
+
+        query = select(func.max(ChangeLogModel.id))
+        if settling_id is not None:
+            query = query.where(ChangeLogModel.id < settling_id)
+        head = (await self.db.execute(query)).scalar_one_or_none() or 0
+
+        return {"head": max(head, horizon), "horizon": horizon}
+
+    async def get_changes(
+        self, since: int, limit: int, entity: Optional[ChangeEntityEnum]
+    ) -> ChangesPageSchema:
+        horizon = await self.__horizon()
+
+        # since=0 é "do começo": depois da compactação, o começo é o horizonte
+        if since == 0:
+            since = horizon
+        elif since < horizon:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail={
+                    "message": (
+                        "Cursor is older than the change log; resync the "
+                        "collections and continue from 'head'."
+                    ),
+                    **(await self.get_head()),
+                },
+            )
+
+        query = select(ChangeLogModel).where(
+            ChangeLogModel.id > since, ChangeLogModel.action != COMPACTED
+        )
+        settling_id = await self.__settling_id(since)
+
+        if settling_id is not None:
+            query = query.where(ChangeLogModel.id < settling_id)
+        if entity:
+            query = query.where(ChangeLogModel.entity == entity.value)
+
+        query = query.order_by(ChangeLogModel.id).limit(limit + 1)
+        changes = (await self.db.execute(query)).scalars().all()
+
+        return {
+            "changes": changes[:limit],
+            "next_since": changes[:limit][-1].id if changes else since,
+            "has_more": len(changes) > limit,
+        }
+
+    async def compact(self, current_user) -> dict:
+        self._validate_role(current_user)
+
+        if settings.CHANGE_LOG_RETENTION_DAYS <= 0:
+            return {"deleted": 0, "horizon": None}
+
+        cutoff = datetime.now() - timedelta(days=settings.CHANGE_LOG_RETENTION_DAYS)
+        query = select(func.max(ChangeLogModel.id)).where(
+            ChangeLogModel.changed_at < cutoff
+        )
+        horizon = (await self.db.execute(query)).scalar_one_or_none()
+
+        if horizon is None:
+            return {"deleted": 0, "horizon": None}
+
+        result = await self.db.execute(
+            delete(ChangeLogModel).where(ChangeLogModel.id < horizon)
+        )
+        await self.db.execute(
+            update(ChangeLogModel)
+            .where(ChangeLogModel.id == horizon)
+            .values(action=COMPACTED)
+        )
+
+        return {"deleted": result.rowcount, "horizon": horizon}
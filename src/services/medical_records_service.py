@@ -8,17 +8,55 @@ from sqlalchemy.future import select
 from src.models.__medical_records_model import MedicalRecordsModel
 from src.models.__user_model import UserModel
 from src.models.__appointments_model import AppointmentsModel
+from src.models.__animals_model import AnimalModel
 
 from src.schemas.medical_records_schema import (
     MedicalRecordSchema,
     MedicalRecordCreateSchema,
     MedicalRecordUpdateSchema,
+    MedicalRecordFilterSchema,
 )
+from src.utils.pagination import PageParams
+from src.utils.filters import apply_filters, resolve_sort
+from src.utils.fields import FieldSelection
+from src.utils.export import ExportFormatEnum, export_response
+from src.services.changes_service import record_change
+from src.services.animal_service import invalidate_history
+from src.services.prescriptions_service import (
+    clear_prescriptions,
+    sync_prescriptions,
+)
+from src.utils.search import (
+    has_terms,
+    index_medical_record,
+    medical_record_ranking,
+    unindex_medical_record,
+)
+
+
+MEDICAL_RECORD_FILTERS = {
+    "vet_id": (MedicalRecordsModel.vet_id, "eq"),
+    "appointment_id": (MedicalRecordsModel.appointment_id, "eq"),
+    "follow_up_from": (MedicalRecordsModel.follow_up_date, "gte"),
+    "follow_up_to": (MedicalRecordsModel.follow_up_date, "lte"),
+}
+
+MEDICAL_RECORD_SORTS = {
+    "id": MedicalRecordsModel.id,
+}
+
 
 class MedicalRecordsService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def __validate_admin_role(self, current_user: UserModel):
+        if current_user.role not in ["admin"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only Admins are allowed for this method.",
+            )
+
     async def __validate_vet(self, current_user: UserModel, appointment_id: int):
         query = select(AppointmentsModel.vet_id).where(
             AppointmentsModel.id == appointment_id
@@ -38,6 +76,14 @@ class MedicalRecordsService:
                 detail="You are not the veterinarian of this appointment.",
             )
 
+    async def __invalidate_history(self, *appointment_ids: int):
+        query = select(AppointmentsModel.animal_id).where(
+            AppointmentsModel.id.in_(appointment_ids)
+        )
+        animal_ids = (await self.db.execute(query)).scalars()
+
+        invalidate_history(self.db, *animal_ids)
+
     async def post_medical_records(
         self, medical_record: MedicalRecordCreateSchema, user: UserModel
     ) -> MedicalRecordsModel:
@@ -59,18 +105,81 @@ class MedicalRecordsService:
         )
 
         self.db.add(new_medical_record)
-        await self.db.commit()
+        await self.db.flush()
+        record_change(self.db, "medical_records", new_medical_record.id, "created")
+        await index_medical_record(self.db, new_medical_record)
+        await sync_prescriptions(self.db, new_medical_record)
+        await self.__invalidate_history(new_medical_record.appointment_id)
         await self.db.refresh(new_medical_record)
 
         return new_medical_record
 
-    async def get_medical_records(self) -> List[MedicalRecordsModel]:
-        query = select(MedicalRecordsModel)
+    async def get_medical_records(
+        self,
+        page: PageParams,
+        filters: MedicalRecordFilterSchema,
+        fields: FieldSelection,
+    ) -> List[MedicalRecordsModel]:
+        sort_column, descending = resolve_sort(filters.sort, MEDICAL_RECORD_SORTS)
+        query = fields.select(MedicalRecordsModel, sort_column)
+        query = apply_filters(query, filters, MEDICAL_RECORD_FILTERS)
+        query = page.apply(query, MedicalRecordsModel.id, sort_column, descending)
         result = await self.db.execute(query)
 
-        medical_records = result.scalars().unique().all()
+        medical_records = fields.rows(result)
 
-        return medical_records
+        return fields.render(page.slice(medical_records))
+
+    def export_medical_records(
+        self, export_format: ExportFormatEnum, current_user: UserModel
+    ):
+        self.__validate_admin_role(current_user)
+        query = select(*MedicalRecordsModel.__table__.columns).order_by(
+            MedicalRecordsModel.id
+        )
+
+        return export_response(self.db, query, export_format, "medical_records")
+
+    async def get_animal_medical_records(self, animal_id: int, page: PageParams):
+        # Mais recentes primeiro pela data da consulta; os dois lados do join
+        # usam índice (animal_id, scheduled_at) e medical_records.appointment_id
+        columns = MedicalRecordsModel.__table__.columns
+        query = (
+            select(*columns, AppointmentsModel.scheduled_at)
+            .join(
+                AppointmentsModel,
+                AppointmentsModel.id == MedicalRecordsModel.appointment_id,
+            )
+            .where(AppointmentsModel.animal_id == animal_id)
+        )
+        query = page.apply(
+            query, MedicalRecordsModel.id, AppointmentsModel.scheduled_at, True
+        )
+        medical_records = (await self.db.execute(query)).all()
+
+        if not medical_records and not await self.db.get(AnimalModel, animal_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Animal not found"
+            )
+
+        return page.slice(medical_records)
+
+    async def search_medical_records(self, terms: str, page: PageParams):
+        if not has_terms(terms):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Search needs at least one word.",
+            )
+
+        ranking = medical_record_ranking(self.db, terms)
+        query = (
+            select(*MedicalRecordsModel.__table__.columns, ranking.c.score)
+            .join(ranking, ranking.c.id == MedicalRecordsModel.id)
+            .order_by(ranking.c.score.desc(), MedicalRecordsModel.id.desc())
+        )
+        result = await self.db.execute(page.apply_offset(query))
+
+        return page.slice(result.all())
 
     async def get_medical_record(self, medical_record_id: int) -> MedicalRecordsModel:
         query = select(MedicalRecordsModel).filter(
@@ -94,8 +203,6 @@ class MedicalRecordsService:
         medical_record: MedicalRecordUpdateSchema,
         current_user=UserModel,
     ) -> MedicalRecordsModel:
-
-        self.__validate_vet(current_user, medical_record.appointment_id)
         query = select(MedicalRecordsModel).filter(
             MedicalRecordsModel.id == medical_record_id
         )
@@ -109,6 +216,13 @@ class MedicalRecordsService:
                 detail="Medical Record not found.",
             )
 
+        previous_appointment_id = medical_record_up.appointment_id
+
+        # Só o veterinário da consulta edita, inclusive ao mover o prontuário
+        await self.__validate_vet(current_user, previous_appointment_id)
+        if medical_record.appointment_id not in (None, previous_appointment_id):
+            await self.__validate_vet(current_user, medical_record.appointment_id)
+
         if medical_record:
             if medical_record.appointment_id:
                 medical_record_up.appointment_id = medical_record.appointment_id
@@ -129,7 +243,13 @@ class MedicalRecordsService:
             if medical_record.updated_at:
                 medical_record_up.updated_at = medical_record.updated_at
 
-        await self.db.commit()
+        record_change(self.db, "medical_records", medical_record_up.id, "updated")
+        await index_medical_record(self.db, medical_record_up)
+        await sync_prescriptions(self.db, medical_record_up)
+        await self.__invalidate_history(
+            previous_appointment_id, medical_record_up.appointment_id
+        )
+        await self.db.flush()
         await self.db.refresh(medical_record_up)
 
         return medical_record_up
@@ -148,8 +268,12 @@ class MedicalRecordsService:
                 detail="Medical Record not found.",
             )
 
+        record_change(self.db, "medical_records", medical_record_del.id, "deleted")
+        await unindex_medical_record(self.db, medical_record_del.id)
+        await clear_prescriptions(self.db, medical_record_del.id)
+        await self.__invalidate_history(medical_record_del.appointment_id)
         await self.db.delete(medical_record_del)
-        await self.db.commit()
+        await self.db.flush()
 
         return Response(
             content="Medical record deleted successfully.",
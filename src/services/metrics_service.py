@@ -0,0 +1,32 @@
+from fastapi import status, HTTPException
+
+from src.core.database import engine, replica_engines
+from src.utils.auth import user_cache, token_cache, revocation_list
+from src.services.animal_service import history_cache
+
+
+class MetricsService:
+    def _validate_role(self, current_user):
+        if current_user.role not in ["admin"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only Admins are allowed for this method.",
+            )
+
+    def get_cache_metrics(self, current_user) -> dict:
+        self._validate_role(current_user)
+
+        return {
+            "users": user_cache.stats(),
+            "tokens": token_cache.stats(),
+            "animal_history": history_cache.stats(),
+            "revoked_users": len(revocation_list),
+        }
+
+    def get_pool_metrics(self, current_user) -> dict:
+        self._validate_role(current_user)
+
+        return {
+            "primary": engine.pool.stats(),
+            "replicas": [replica.pool.stats() for replica in replica_engines],
+        }
@@ -0,0 +1,109 @@
+from typing import List, Optional
+
+from datetime import date, timedelta
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__medical_records_model import MedicalRecordsModel
+from src.models.__prescription_model import PrescriptionModel
+from src.schemas.prescriptions_schema import PrescriptionFilterSchema
+from src.utils.pagination import PageParams
+from src.utils.filters import apply_filters
+
+PRESCRIPTION_FILTERS = {
+    "animal_id": (PrescriptionModel.animal_id, "eq"),
+    "medicine": (PrescriptionModel.medicine, "eq"),
+    "batch": (PrescriptionModel.batch, "eq"),
+}
+
+
+def _period(starts_on: date, duration_days: int):
+    return starts_on, starts_on + timedelta(days=max(duration_days - 1, 0))
+
+
+async def sync_prescriptions(db: AsyncSession, medical_record: MedicalRecordsModel):
+    await clear_prescriptions(db, medical_record.id)
+
+    if not medical_record.prescriptions:
+        return
+
+    query = select(AppointmentsModel.animal_id, AppointmentsModel.scheduled_at).where(
+        AppointmentsModel.id == medical_record.appointment_id
+    )
+    appointment = (await db.execute(query)).one_or_none()
+
+    if appointment is None:
+        return
+
+    rows = []
+    for prescription in medical_record.prescriptions:
+        starts_on, ends_on = _period(
+            appointment.scheduled_at.date(), prescription["duration_days"]
+        )
+        rows.append(
+            {
+                "medical_record_id": medical_record.id,
+                "animal_id": appointment.animal_id,
+                "medicine": prescription["medicine"],
+                "dosage": prescription["dosage"],
+                "frequency": prescription["frequency"],
+                "duration_days": prescription["duration_days"],
+                "batch": prescription.get("batch"),
+                "starts_on": starts_on,
+                "ends_on": ends_on,
+            }
+        )
+
+    await db.execute(insert(PrescriptionModel), rows)
+
+
+async def clear_prescriptions(db: AsyncSession, medical_record_id: int):
+    await db.execute(
+        delete(PrescriptionModel).where(
+            PrescriptionModel.medical_record_id == medical_record_id
+        )
+    )
+
+
+async def move_prescriptions(db: AsyncSession, appointment: AppointmentsModel):
+    # Consulta remarcada ou trocada de animal: as cópias acompanham
+    query = (
+        select(PrescriptionModel)
+        .join(
+            MedicalRecordsModel,
+            MedicalRecordsModel.id == PrescriptionModel.medical_record_id,
+        )
+        .where(MedicalRecordsModel.appointment_id == appointment.id)
+    )
+
+    for prescription in (await db.execute(query)).scalars():
+        prescription.animal_id = appointment.animal_id
+        prescription.starts_on, prescription.ends_on = _period(
+            appointment.scheduled_at.date(), prescription.duration_days
+        )
+
+
+class PrescriptionsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_prescriptions(
+        self,
+        page: PageParams,
+        filters: PrescriptionFilterSchema,
+        active_on: Optional[date] = None,
+    ) -> List[PrescriptionModel]:
+        query = apply_filters(select(PrescriptionModel), filters, PRESCRIPTION_FILTERS)
+
+        if active_on:
+            query = query.where(
+                PrescriptionModel.ends_on >= active_on,
+                PrescriptionModel.starts_on <= active_on,
+            )
+
+        query = page.apply(query, PrescriptionModel.id)
+        result = await self.db.execute(query)
+
+        return page.slice(result.scalars().all())
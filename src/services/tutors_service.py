@@ -4,6 +4,7 @@ from fastapi import APIRouter, status, HTTPException, Depends, Response
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
@@ -12,6 +13,9 @@ from src.models.__animals_model import AnimalModel
 
 from src.schemas.tutors_schema import TutorsSchema, TutorWithAnimals, TutorUpdateSchema
 from src.schemas.animals_schema import AnimalsSchemaTutors
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest, collection_version
+from src.services.changes_service import record_change
 
 
 class TutorService:
@@ -22,19 +26,28 @@ class TutorService:
         new_tutor = TutorModel(**tutor.model_dump())
 
         self.db.add(new_tutor)
-        await self.db.commit()
+        await self.db.flush()
+        record_change(self.db, "tutors", new_tutor.id, "created")
 
         return new_tutor
 
-    async def get_tutors(self) -> List[TutorModel]:
-        query = select(TutorModel)
+    async def get_tutors(
+        self, page: PageParams, conditional: ConditionalRequest
+    ) -> List[TutorModel]:
+        version = await self.db.execute(collection_version(TutorModel))
+        not_modified = conditional.evaluate(*version.one())
+
+        if not_modified:
+            return not_modified
+
+        query = page.apply(select(TutorModel), TutorModel.id)
         result = await self.db.execute(query)
 
         tutors = result.scalars().unique().all()
 
-        return tutors
+        return page.slice(tutors)
 
-    async def get_tutor(self, tutor_id: int):
+    async def get_tutor(self, tutor_id: int, conditional: ConditionalRequest):
         query = select(TutorModel).where(TutorModel.id == tutor_id)
         result = await self.db.execute(query)
 
@@ -45,7 +58,7 @@ class TutorService:
                 detail="Tutor not found.", status_code=status.HTTP_404_NOT_FOUND
             )
 
-        return tutor
+        return conditional.evaluate(tutor.id, tutor.updated_at) or tutor
 
     async def put_tutor(self, tutor_id: int, tutor: TutorsSchema) -> TutorModel:
         query = select(TutorModel).filter(TutorModel.id == tutor_id)
@@ -65,7 +78,8 @@ class TutorService:
             if tutor.address:
                 tutor_up.address = tutor.address
 
-            await self.db.commit()
+            record_change(self.db, "tutors", tutor_up.id, "updated")
+            await self.db.flush()
 
             return tutor_up
         else:
@@ -80,8 +94,9 @@ class TutorService:
         tutor_del: TutorModel = result.scalars().unique().one_or_none()
 
         if tutor_del:
+            record_change(self.db, "tutors", tutor_del.id, "deleted")
             await self.db.delete(tutor_del)
-            await self.db.commit()
+            await self.db.flush()
 
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         else:
@@ -89,7 +104,30 @@ class TutorService:
                 detail="Tutor not found.", status_code=status.HTTP_404_NOT_FOUND
             )
 
-    async def get_tutor_with_animals(self, tutor_id: int) -> TutorModel:
+    async def get_tutor_with_animals(
+        self, tutor_id: int, conditional: ConditionalRequest
+    ) -> TutorModel:
+        version_query = (
+            select(
+                TutorModel.updated_at,
+                func.count(AnimalModel.id),
+                func.max(AnimalModel.id),
+                func.max(AnimalModel.updated_at),
+            )
+            .outerjoin(AnimalModel, AnimalModel.tutor_id == TutorModel.id)
+            .where(TutorModel.id == tutor_id)
+            .group_by(TutorModel.id, TutorModel.updated_at)
+        )
+        version = (await self.db.execute(version_query)).one_or_none()
+
+        if not version:
+            raise HTTPException(404, "Tutor not found")
+
+        not_modified = conditional.evaluate(*version)
+
+        if not_modified:
+            return not_modified
+
         query = (
             select(TutorModel)
             .options(selectinload(TutorModel.animals))
@@ -16,7 +16,11 @@ from src.schemas.users_schema import (
     UserPatchActive,
 )
 
+from src.core.database import after_commit
 from src.utils.security import security
+from src.utils.auth import user_cache, revoke_user
+from src.utils.pagination import PageParams
+from src.utils.etag import ConditionalRequest, collection_version
 
 
 class UserService:
@@ -30,100 +34,113 @@ class UserService:
                 detail="Only Admins are allowed for this method.",
             )
 
-    async def get_users(self) -> List[UserModel]:
-        query = select(UserModel)
+    async def get_users(
+        self, page: PageParams, conditional: ConditionalRequest
+    ) -> List[UserModel]:
+        version = await self.db.execute(collection_version(UserModel))
+        not_modified = conditional.evaluate(*version.one())
+
+        if not_modified:
+            return not_modified
+
+        query = page.apply(select(UserModel), UserModel.id)
         results = await self.db.execute(query)
 
         users = results.scalars().unique().all()
 
-        return users
+        return page.slice(users)
 
-    async def get_user(self, user_id: int) -> UserModel:
-        async with self.db as session:
-            query = select(UserModel).where(UserModel.id == user_id)
-            result = await session.execute(query)
+    async def get_user(
+        self, user_id: int, conditional: ConditionalRequest
+    ) -> UserModel:
+        query = select(UserModel).where(UserModel.id == user_id)
+        result = await self.db.execute(query)
 
-            user = result.scalars().unique().one_or_none()
+        user = result.scalars().unique().one_or_none()
 
-            if not user:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
-                )
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
+            )
 
-            return user
+        return conditional.evaluate(user.id, user.updated_at) or user
 
     async def put_user(self, user_id: int, user: UserUpdateSchema) -> UserModel:
-        async with self.db as session:
-            query = select(UserModel).where(UserModel.id == user_id)
-            result = await session.execute(query)
-
-            user_up = result.scalars().unique().one_or_none()
-
-            if not user_up:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
-                )
-
-            try:
-                if user_up:
-                    if user.name:
-                        user_up.name = user.name
-                    if user.email:
-                        user_up.email = user.email
-                    if user.password:
-                        user_up.password = security.generate_hashed_password(
-                            user.password
-                        )
-                    if user.role:
-                        user_up.role = user.role
-
-                    await session.commit()
-                    await session.refresh(user_up)
-
-                    return user_up
-            except IntegrityError:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="This e-mail is already in use.",
-                )
+        query = select(UserModel).where(UserModel.id == user_id)
+        result = await self.db.execute(query)
 
-    async def delete_user(self, user_id: int):
-        async with self.db as session:
-            query = select(UserModel).where(UserModel.id == user_id)
-            result = await session.execute(query)
+        user_up = result.scalars().unique().one_or_none()
 
-            user_del = result.scalars().unique().one_or_none()
+        if not user_up:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
+            )
 
-            if not user_del:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
-                )
+        try:
+            if user_up:
+                if user.name:
+                    user_up.name = user.name
+                if user.email:
+                    user_up.email = user.email
+                if user.password:
+                    user_up.password = await security.generate_hashed_password(
+                        user.password
+                    )
+                role_changed = user.role and user.role != user_up.role
+                if user.role:
+                    user_up.role = user.role
+
+                await self.db.flush()
+                await self.db.refresh(user_up)
+                if role_changed:
+                    after_commit(self.db, lambda: revoke_user(user_id))
+                else:
+                    after_commit(self.db, lambda: user_cache.invalidate(user_id))
+
+                return user_up
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="This e-mail is already in use.",
+            )
+
+    async def delete_user(self, user_id: int):
+        query = select(UserModel).where(UserModel.id == user_id)
+        result = await self.db.execute(query)
 
-            await session.delete(user_del)
-            await session.commit()
+        user_del = result.scalars().unique().one_or_none()
 
-            return Response(
-                status_code=status.HTTP_204_NO_CONTENT,
+        if not user_del:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
             )
 
+        await self.db.delete(user_del)
+        await self.db.flush()
+        after_commit(self.db, lambda: revoke_user(user_id))
+
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+
     async def patch_user_active(
         self, user_id: int, user_active: UserPatchActive, current_user
     ) -> UserModel:
         self._validate_role(current_user)
-        async with self.db as session:
-            query = select(UserModel).where(UserModel.id == user_id)
-            result = await session.execute(query)
+        query = select(UserModel).where(UserModel.id == user_id)
+        result = await self.db.execute(query)
 
-            user_patch: UserModel = result.scalars().unique().one_or_none()
+        user_patch: UserModel = result.scalars().unique().one_or_none()
 
-            if not user_patch:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
-                )
+        if not user_patch:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found."
+            )
 
-            user_patch.is_active = user_active.is_active
+        user_patch.is_active = user_active.is_active
             
-            await session.commit()
-            await session.refresh(user_patch)
+        await self.db.flush()
+        await self.db.refresh(user_patch)
+        after_commit(self.db, lambda: revoke_user(user_id))
 
         return user_patch
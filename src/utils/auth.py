@@ -1,3 +1,7 @@
+import hashlib
+import math
+from time import time
+
 from pytz import timezone
 from datetime import timedelta, datetime
 from typing import Optional, List
@@ -14,29 +18,101 @@ from jose import jwt
 from src.models.__user_model import UserModel
 from src.core.configs import settings
 from src.utils.security import security
+from src.utils.cache import TTLCache
 
 oauth2_schema = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/usuarios/login")
 
+user_cache: TTLCache = TTLCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+token_cache: TTLCache = TTLCache(
+    max_size=settings.TOKEN_CACHE_MAX_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+class RevocationList:
+    def __init__(self, retention_seconds: float):
+        self.retention_seconds = retention_seconds
+        self._revoked: dict = {}
+
+    def revoke(self, user_id: int):
+        self._prune()
+        # O iat do JWT é em segundos inteiros: token emitido no mesmo segundo
+        # da revogação (ex.: login logo após mudar o papel) continua válido
+        self._revoked[user_id] = math.floor(time())
+
+    def is_revoked(self, user_id: int, issued_at: float) -> bool:
+        revoked_at = self._revoked.get(user_id)
+
+        return revoked_at is not None and issued_at < revoked_at
+
+    def _prune(self):
+        # Depois de um ciclo de vida do token, nenhum token anterior é válido
+        horizon = time() - self.retention_seconds
+        expired = [user_id for user_id, at in self._revoked.items() if at < horizon]
+
+        for user_id in expired:
+            del self._revoked[user_id]
+
+    def clear(self):
+        self._revoked.clear()
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list: RevocationList = RevocationList(
+    retention_seconds=settings.STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+def revoke_user(user_id: int):
+    user_cache.invalidate(user_id)
+    revocation_list.revoke(user_id)
+
 
 async def authenticate_user(
     email: EmailStr, password: str, db: AsyncSession
 ) -> Optional[UserModel]:
-    async with db as session:
-        query = select(UserModel).filter(UserModel.email == email)
-        result = await session.execute(query)
+    query = select(UserModel).filter(UserModel.email == email)
+    result = await db.execute(query)
+
+    user: UserModel = result.scalars().one_or_none()
+
+    if not user:
+        return None
+    if not await security.verify_password(password, user.password):
+        return None
 
-        user: UserModel = result.scalars().one_or_none()
+    return user
 
-        if not user:
-            return None
-        if not security.verify_password(password, user.password):
-            return None
 
-        return user
+def _decode_token(token: str) -> dict:
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(digest)
 
+    if payload is not None and payload["exp"] > time():
+        return payload
 
-def _create_token(token_type: str, lifetime: timedelta, sub: str) -> str:
-    payload = {}
+    payload = jwt.decode(
+        token,
+        settings.JWT_SECRET,
+        algorithms=[settings.ALGORITHM],
+        options={"verify_aud": False}
+    )
+
+    if "exp" in payload:
+        token_cache.set(digest, payload, ttl=payload["exp"] - time())
+
+    return payload
+
+
+def _create_token(
+    token_type: str, lifetime: timedelta, sub: str, claims: Optional[dict] = None
+) -> str:
+    payload = dict(claims or {})
     sp = timezone("America/Sao_Paulo")
     expires = datetime.now(tz=sp) + lifetime
 
@@ -48,7 +124,17 @@ def _create_token(token_type: str, lifetime: timedelta, sub: str) -> str:
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.ALGORITHM)
 
 
-def _create_access_token(sub: str) -> str:
+def _create_access_token(
+    sub: str, role: Optional[str] = None, is_active: Optional[bool] = None
+) -> str:
+    if settings.JWT_STATELESS and role is not None:
+        return _create_token(
+            token_type="access_token",
+            lifetime=timedelta(minutes=settings.STATELESS_ACCESS_TOKEN_EXPIRE_MINUTES),
+            sub=sub,
+            claims={"role": role, "is_active": bool(is_active)},
+        )
+
     return _create_token(
         token_type="access_token",
         lifetime=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
@@ -0,0 +1,49 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+
+    return f'"{digest}"'
+
+
+def collection_version(model):
+    # count/max(id) pegam inserts e deletes; max(updated_at) (microssegundos
+    # no MySQL) pega qualquer update do conjunto filtrado
+    return select(func.count(model.id), func.max(model.id), func.max(model.updated_at))
+
+
+def _matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+
+    candidates = [value.strip() for value in header.split(",")]
+
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+class ConditionalRequest:
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+
+    def evaluate(self, *version: Any) -> Optional[Response]:
+        # A query string entra no ETag: filtros, cursor e fields mudam o corpo
+        etag = make_etag(self.request.url.path, self.request.url.query, *version)
+        self.response.headers["ETag"] = etag
+        self.response.headers["Cache-Control"] = "private, no-cache"
+
+        if _matches(self.request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+            )
+
+        return None
@@ -0,0 +1,124 @@
+import asyncio
+import importlib
+import json
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Set
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from src.core.configs import settings
+
+
+class BrokerBackend(ABC):
+    # Contrato mínimo de um backend: publish não bloqueia e entrega nas filas
+    # locais; um backend multi-worker (Redis, NATS...) publica no servidor e
+    # repassa o que recebe para as filas dos assinantes deste processo.
+    @abstractmethod
+    def publish(self, channel: str, message: dict):
+        ...
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, channel: str, queue: asyncio.Queue):
+        ...
+
+
+class MemoryBackend(BrokerBackend):
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self.channels: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self.dropped = 0
+
+    def publish(self, channel: str, message: dict):
+        for queue in tuple(self.channels.get(channel, ())):
+            if queue.full():
+                # Cliente lento perde o evento mais antigo; o publish nunca espera
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(message)
+
+    def subscribe(self, channel: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.channels[channel].add(queue)
+
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue):
+        self.channels[channel].discard(queue)
+
+        if not self.channels[channel]:
+            del self.channels[channel]
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self.channels),
+            "subscribers": sum(len(queues) for queues in self.channels.values()),
+            "dropped": self.dropped,
+        }
+
+
+class Broker:
+    def __init__(self, backend: BrokerBackend):
+        self.backend = backend
+
+    def publish(self, channel: str, message: dict):
+        self.backend.publish(channel, message)
+
+    @contextmanager
+    def subscribe(self, channel: str) -> Iterator[asyncio.Queue]:
+        queue = self.backend.subscribe(channel)
+
+        try:
+            yield queue
+        finally:
+            self.backend.unsubscribe(channel, queue)
+
+
+def _create_backend(path: str) -> BrokerBackend:
+    if path == "memory":
+        return MemoryBackend(settings.EVENT_QUEUE_SIZE)
+
+    # "pacote.modulo:Classe" para backends externos
+    module, _, name = path.partition(":")
+
+    return getattr(importlib.import_module(module), name)()
+
+
+broker = Broker(_create_backend(settings.EVENT_BROKER_BACKEND))
+
+
+async def _event_stream(
+    request: Request, channel: str, accept: Callable[[dict], bool]
+):
+    with broker.subscribe(channel) as queue:
+        yield ": connected\n\n"
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=settings.EVENT_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": ping\n\n"
+                continue
+
+            if accept(message):
+                yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+def event_response(
+    request: Request, channel: str, accept: Callable[[dict], bool]
+) -> StreamingResponse:
+    return StreamingResponse(
+        _event_stream(request, channel, accept),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
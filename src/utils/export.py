@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.configs import settings
+
+
+class ExportFormatEnum(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormatEnum.ndjson: "application/x-ndjson",
+    ExportFormatEnum.csv: "text/csv",
+}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+
+    return value
+
+
+def _render_ndjson(keys, rows) -> str:
+    return "".join(
+        json.dumps({key: _jsonable(value) for key, value in zip(keys, row)}) + "\n"
+        for row in rows
+    )
+
+
+def _render_csv(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    for row in rows:
+        writer.writerow(
+            [
+                json.dumps(value) if isinstance(value, (list, dict)) else _jsonable(value)
+                for value in row
+            ]
+        )
+
+    return buffer.getvalue()
+
+
+async def stream_rows(
+    session: AsyncSession, query, export_format: ExportFormatEnum
+) -> AsyncIterator[str]:
+    # Cursor do lado do servidor: só um lote de linhas fica em memória por vez
+    result = await session.stream(
+        query.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+    )
+    keys = list(result.keys())
+
+    if export_format == ExportFormatEnum.csv:
+        yield _render_csv([keys])
+
+    async for rows in result.partitions():
+        if export_format == ExportFormatEnum.csv:
+            yield _render_csv(rows)
+        else:
+            yield _render_ndjson(keys, rows)
+
+
+def export_response(
+    session: AsyncSession, query, export_format: ExportFormatEnum, filename: str
+) -> StreamingResponse:
+    disposition = f'attachment; filename="{filename}.{export_format.value}"'
+
+    return StreamingResponse(
+        stream_rows(session, query, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": disposition},
+    )
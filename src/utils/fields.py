@@ -0,0 +1,92 @@
+from functools import lru_cache
+from typing import List, Optional, Sequence, Type
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import BaseModel, TypeAdapter, create_model
+from sqlalchemy.future import select
+
+
+@lru_cache(maxsize=256)
+def _projection(schema: Type[BaseModel], names: tuple) -> TypeAdapter:
+    model = create_model(
+        f"{schema.__name__}Fields",
+        __config__={"from_attributes": True},
+        **{name: (schema.model_fields[name].annotation, ...) for name in names},
+    )
+
+    return TypeAdapter(List[model])
+
+
+class FieldSelection:
+    def __init__(
+        self, schema: Type[BaseModel], names: Optional[List[str]], response: Response
+    ):
+        self.schema = schema
+        self.names = names
+        self.response = response
+
+    def select(self, model, *extra_columns):
+        if self.names is None:
+            return select(model)
+
+        # Só as colunas pedidas (mais as necessárias para o cursor) vão ao banco
+        columns = [getattr(model, name) for name in self.names]
+        columns += [
+            column
+            for column in extra_columns
+            if column is not None and column.key not in self.names
+        ]
+
+        return select(*columns)
+
+    def rows(self, result) -> Sequence:
+        if self.names is None:
+            return result.scalars().unique().all()
+
+        return result.all()
+
+    def render(self, rows: Sequence):
+        if self.names is None:
+            return rows
+
+        adapter = _projection(self.schema, tuple(self.names))
+        headers = {
+            key: value
+            for key, value in self.response.headers.items()
+            if key != "content-length"
+        }
+
+        return Response(
+            content=adapter.dump_json(adapter.validate_python(rows)),
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+class SparseFields:
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+
+    def __call__(
+        self,
+        response: Response,
+        fields: Optional[str] = Query(
+            default=None, description="Comma-separated list of fields to return."
+        ),
+    ) -> FieldSelection:
+        if not fields:
+            return FieldSelection(self.schema, None, response)
+
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        invalid = [name for name in names if name not in self.schema.model_fields]
+
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(invalid)}.",
+            )
+
+        if "id" not in names:
+            names.insert(0, "id")
+
+        return FieldSelection(self.schema, list(dict.fromkeys(names)), response)
@@ -0,0 +1,39 @@
+import operator
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+OPERATORS = {
+    "eq": operator.eq,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def apply_filters(query, filters: BaseModel, columns: Dict[str, Tuple]):
+    # Só campos da whitelist viram WHERE; None significa "sem filtro"
+    for field, (column, op) in columns.items():
+        value = getattr(filters, field, None)
+
+        if value is not None:
+            query = query.where(OPERATORS[op](column, value))
+
+    return query
+
+
+def resolve_sort(sort: Optional[str], columns: Dict) -> Tuple[Optional[object], bool]:
+    if not sort:
+        return None, False
+
+    descending = sort.startswith("-")
+    name = sort.lstrip("-")
+
+    if name not in columns:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sort field. Allowed: {', '.join(sorted(columns))}.",
+        )
+
+    return columns[name], descending
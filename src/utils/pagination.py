@@ -0,0 +1,131 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, Request, Response, status
+from sqlalchemy import Integer, and_, column, or_
+
+from src.core.configs import settings
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(
+        [
+            value.isoformat() if isinstance(value, (date, datetime)) else value
+            for value in values
+        ]
+    )
+
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+
+        return [_parse(value, column) for value, column in zip(values, columns)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+
+
+def _parse(value: Any, column) -> Any:
+    python_type = column.type.python_type
+
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+
+    return python_type(value)
+
+
+class PageParams:
+    def __init__(
+        self,
+        request: Request,
+        response: Response,
+        limit: int = Query(
+            default=settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX
+        ),
+        cursor: Optional[str] = Query(default=None),
+    ):
+        self.request = request
+        self.response = response
+        self.limit = limit
+        self.cursor = cursor
+        self.next_cursor: Optional[str] = None
+        self._keys: List[str] = []
+        self._offset: Optional[int] = None
+
+    def apply(self, query, id_column, sort_column=None, descending: bool = False):
+        # Keyset: a página seguinte começa depois da última chave (sort, id),
+        # então o custo não depende da profundidade da página.
+        if sort_column is None or sort_column is id_column:
+            columns = [id_column]
+        else:
+            columns = [sort_column, id_column]
+        self._keys = [column.key for column in columns]
+
+        if self.cursor:
+            values = decode_cursor(self.cursor, columns)
+            query = query.where(_after(columns, values, descending))
+
+        order = [column.desc() if descending else column.asc() for column in columns]
+
+        return query.order_by(*order).limit(self.limit + 1)
+
+    def apply_offset(self, query):
+        # Para ordens sem chave estável (ranking de busca): cursor = deslocamento
+        self._offset = 0
+
+        if self.cursor:
+            [self._offset] = decode_cursor(self.cursor, [column("offset", Integer)])
+
+            if self._offset < 0:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+                )
+
+        return query.offset(self._offset).limit(self.limit + 1)
+
+    def slice(self, rows: Sequence) -> List:
+        rows = list(rows)
+
+        if len(rows) <= self.limit:
+            return rows
+
+        rows = rows[: self.limit]
+        if self._offset is not None:
+            self.next_cursor = encode_cursor([self._offset + self.limit])
+        else:
+            self.next_cursor = encode_cursor(
+                [getattr(rows[-1], key) for key in self._keys]
+            )
+
+        next_url = self.request.url.include_query_params(
+            cursor=self.next_cursor, limit=self.limit
+        )
+        self.response.headers["Link"] = f'<{next_url}>; rel="next"'
+        self.response.headers["X-Next-Cursor"] = self.next_cursor
+
+        return rows
+
+
+def _after(columns: Sequence, values: Sequence, descending: bool):
+    first, first_value = columns[0], values[0]
+    beyond = first < first_value if descending else first > first_value
+
+    if len(columns) == 1:
+        return beyond
+
+    return or_(
+        beyond,
+        and_(first == first_value, _after(columns[1:], values[1:], descending)),
+    )
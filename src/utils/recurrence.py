@@ -0,0 +1,89 @@
+from calendar import monthrange
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+WEEK = timedelta(weeks=1)
+
+
+def _naive(moment: datetime) -> datetime:
+    return moment.replace(tzinfo=None)
+
+
+def _add_months(moment: datetime, months: int, day: int) -> datetime:
+    index = moment.month - 1 + months
+    year, month = moment.year + index // 12, index % 12 + 1
+
+    # Dia 31 numa série mensal cai no último dia dos meses mais curtos
+    day = min(day, monthrange(year, month)[1])
+
+    return moment.replace(year=year, month=month, day=day)
+
+
+def nth(series, k: int) -> datetime:
+    starts_at = _naive(series.starts_at)
+
+    if series.frequency == "weekly":
+        return starts_at + k * series.interval * WEEK
+
+    return _add_months(starts_at, k * series.interval, starts_at.day)
+
+
+def _within_bounds(series, k: int, moment: datetime) -> bool:
+    if series.count is not None and k >= series.count:
+        return False
+    if series.until is not None and moment > _naive(series.until):
+        return False
+
+    return True
+
+
+def _first_index(series, start: datetime) -> int:
+    # Pula direto para perto da janela, sem percorrer as ocorrências anteriores
+    starts_at = _naive(series.starts_at)
+
+    if start <= starts_at:
+        return 0
+    if series.frequency == "weekly":
+        return (start - starts_at) // (series.interval * WEEK)
+
+    months = (start.year - starts_at.year) * 12 + start.month - starts_at.month
+
+    return max(months // series.interval - 1, 0)
+
+
+def expand(series, start: datetime, end: datetime) -> Iterator[datetime]:
+    start, end = _naive(start), _naive(end)
+    k = _first_index(series, start)
+
+    while True:
+        moment = nth(series, k)
+
+        if moment >= end or not _within_bounds(series, k, moment):
+            return
+        if moment >= start:
+            yield moment
+
+        k += 1
+
+
+def occurrence_index(series, moment: datetime) -> Optional[int]:
+    moment, starts_at = _naive(moment), _naive(series.starts_at)
+
+    if moment < starts_at:
+        return None
+
+    if series.frequency == "weekly":
+        k, remainder = divmod(moment - starts_at, series.interval * WEEK)
+        if remainder:
+            return None
+    else:
+        months = (moment.year - starts_at.year) * 12 + moment.month - starts_at.month
+        k, remainder = divmod(months, series.interval)
+        if remainder or nth(series, k) != moment:
+            return None
+
+    return k if _within_bounds(series, k, moment) else None
+
+
+def is_occurrence(series, moment: datetime) -> bool:
+    return occurrence_index(series, moment) is not None
@@ -0,0 +1,78 @@
+import re
+
+from sqlalchemy import Float, column, func, table, text, type_coerce
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.models.__medical_records_model import MedicalRecordsModel
+
+FTS_TABLE = table("medical_records_fts", column("rowid"))
+
+_WORDS = re.compile(r"\w+", re.UNICODE)
+
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _fts_terms(terms: str) -> str:
+    # Cada palavra vira uma frase entre aspas: nada da entrada é sintaxe FTS5.
+    # OR como no modo natural language do MySQL; o ranking prioriza quem tem todas.
+    return " OR ".join(f'"{word}"' for word in _WORDS.findall(terms))
+
+
+def medical_record_ranking(db: AsyncSession, terms: str):
+    # Subquery (id, score), maior score = mais relevante
+    if _dialect(db) == "sqlite":
+        score = type_coerce(-func.bm25(text("medical_records_fts")), Float)
+
+        return (
+            select(FTS_TABLE.c.rowid.label("id"), score.label("score"))
+            .where(text("medical_records_fts MATCH :terms"))
+            .params(terms=_fts_terms(terms))
+            .subquery()
+        )
+
+    relevance = match(
+        MedicalRecordsModel.diagnosis, MedicalRecordsModel.treatment, against=terms
+    ).in_natural_language_mode()
+
+    return (
+        select(MedicalRecordsModel.id, type_coerce(relevance, Float).label("score"))
+        .where(relevance > 0)
+        .subquery()
+    )
+
+
+def has_terms(terms: str) -> bool:
+    return bool(_WORDS.search(terms))
+
+
+async def index_medical_record(db: AsyncSession, medical_record: MedicalRecordsModel):
+    # No MySQL o FULLTEXT acompanha a tabela sozinho
+    if _dialect(db) != "sqlite":
+        return
+
+    await unindex_medical_record(db, medical_record.id)
+    await db.execute(
+        text(
+            "INSERT INTO medical_records_fts (rowid, diagnosis, treatment) "
+            "VALUES (:id, :diagnosis, :treatment)"
+        ),
+        {
+            "id": medical_record.id,
+            "diagnosis": medical_record.diagnosis,
+            "treatment": medical_record.treatment,
+        },
+    )
+
+
+async def unindex_medical_record(db: AsyncSession, medical_record_id: int):
+    if _dialect(db) != "sqlite":
+        return
+
+    await db.execute(
+        text("DELETE FROM medical_records_fts WHERE rowid = :id"),
+        {"id": medical_record_id},
+    )
@@ -1,15 +1,30 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
+from src.core.configs import settings
+
 
 class Security:
-    def __init__(self):
+    def __init__(self, max_workers: int = settings.PASSWORD_HASH_WORKERS):
         self.CRIPTO = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        # bcrypt libera o GIL, então threads dedicadas não travam o event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def verify_password(self, password: str, hash_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self.executor, self.CRIPTO.verify, password, hash_password
+        )
 
-    def verify_password(self, password: str, hash_password: str) -> bool:
-        return self.CRIPTO.verify(password, hash_password)
+    async def generate_hashed_password(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
 
-    def generate_hashed_password(self, password: str) -> str:
-        return self.CRIPTO.hash(password)
+        return await loop.run_in_executor(self.executor, self.CRIPTO.hash, password)
 
 
 security: Security = Security()
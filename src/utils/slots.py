@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from typing import List, Sequence, Tuple
+
+from fastapi import HTTPException, status
+
+SLOT_MINUTES = 30
+SLOT = timedelta(minutes=SLOT_MINUTES)
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_slot(scheduled_at: datetime) -> int:
+    # Mesmo valor "de parede" que a coluna DateTime (sem fuso) guarda
+    return (scheduled_at.replace(tzinfo=None) - EPOCH) // SLOT
+
+
+def ceil_slot(moment: datetime) -> int:
+    return -((EPOCH - moment.replace(tzinfo=None)) // SLOT)
+
+
+def from_slot(slot: int) -> datetime:
+    return EPOCH + slot * SLOT
+
+
+def validate_slot(scheduled_at: datetime):
+    if scheduled_at.replace(tzinfo=None) != from_slot(to_slot(scheduled_at)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Appointments must start on a {SLOT_MINUTES}-minute boundary.",
+        )
+
+
+def free_windows(
+    booked: Sequence[int], first: int, last: int, need: int
+) -> List[Tuple[int, int]]:
+    # Varredura sobre os slots ocupados (ordenados): cada buraco [cursor, slot)
+    # com pelo menos `need` slots livres vira uma janela
+    windows = []
+    cursor = first
+
+    for slot in booked:
+        if slot - cursor >= need:
+            windows.append((cursor, slot))
+        cursor = max(cursor, slot + 1)
+
+    if last - cursor >= need:
+        windows.append((cursor, last))
+
+    return windows
@@ -1,3 +1,4 @@
+import gc
 import sys
 import os 
 
@@ -12,8 +13,24 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from src.main import app 
-from src.core.deps import get_session
+from fastapi import Request
+
+from src.core.deps import (
+    get_session,
+    get_stream_session,
+    recent_writers,
+    _remember_writer,
+)
 from src.core.configs import settings
+from src.core.database import session_scope, after_commit
+from src.models.__user_model import UserModel
+from src.utils.auth import (
+    _create_access_token,
+    user_cache,
+    token_cache,
+    revocation_list,
+)
+from src.services.animal_service import history_cache
 
 DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
@@ -32,21 +49,64 @@ async def create_db():
     yield
     async with engine_test.begin() as conn:
         await conn.run_sync(settings.DBBaseModel.metadata.drop_all)
+    # Ciclos deixados por exceções (409 com IntegrityError no traceback) seguram
+    # conexões; coletados no meio do teste seguinte, o finalizador do pool
+    # roda dentro do greenlet de outra requisição e trava o SQLite.
+    gc.collect()
     await engine_test.dispose()
 
-async def override_get_session():
+async def override_get_session(request: Request):
+    async with session_scope(TestingSessionlocal) as session:
+        after_commit(session, lambda: _remember_writer(request, session))
+        yield session
+
+async def override_get_stream_session():
     async with TestingSessionlocal() as session:
         yield session
         
 @pytest_asyncio.fixture
-async def client(create_db):
+async def admin_user(create_db):
+    async with TestingSessionlocal() as session:
+        user = UserModel(
+            name="Admin",
+            email="admin@email.com",
+            password="not-used",
+            role="admin",
+        )
+        session.add(user)
+        await session.commit()
+
+        return user
+
+async def user_headers(role: str) -> dict:
+    async with TestingSessionlocal() as session:
+        user = UserModel(
+            name=role.title(),
+            email=f"{role}@email.com",
+            password="not-used",
+            role=role,
+        )
+        session.add(user)
+        await session.commit()
+
+    return {"Authorization": f"Bearer {_create_access_token(sub=user.id)}"}
+
+@pytest_asyncio.fixture
+async def client(admin_user):
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_stream_session] = override_get_stream_session
+    user_cache.clear()
+    token_cache.clear()
+    revocation_list.clear()
+    recent_writers.clear()
+    history_cache.clear()
 
     transport = ASGITransport(app=app)
 
     async with AsyncClient(
         transport=transport,
-        base_url="http://test"
+        base_url="http://test",
+        headers={"Authorization": f"Bearer {_create_access_token(sub=admin_user.id)}"}
     ) as ac:
         yield ac
 
@@ -0,0 +1,192 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core import deps
+from src.core.configs import settings
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__medical_records_model import MedicalRecordsModel
+from src.services.animal_service import history_cache
+from conftest import TestingSessionlocal, engine_test
+
+API_URL = "api/v1/animals/"
+
+
+async def create_animal(client, name):
+    animal = {
+        "name": name,
+        "species": "dog",
+        "breed": "vira-lata",
+        "birth_date": "2020-01-01",
+        "weight_kg": 10.0,
+        "tutor_id": 1,
+    }
+    await client.post(API_URL, json=animal)
+
+
+def booking(animal_id, hours):
+    scheduled_at = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    ) + timedelta(hours=hours)
+
+    return {
+        "vet_id": 1,
+        "animal_id": animal_id,
+        "scheduled_at": scheduled_at.isoformat(),
+        "reason": "Consulta",
+        "notes": "",
+        "created_by": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_history_is_cached_until_its_animal_changes(client):
+    await create_animal(client, "Rex")
+    await create_animal(client, "Bidu")
+    await client.post("api/v1/appointments/", json=booking(1, 0))
+
+    first = await client.get(f"{API_URL}1/history")
+    await client.get(f"{API_URL}2/history")
+    cached = await client.get(f"{API_URL}1/history")
+
+    assert cached.json() == first.json()
+    assert len(first.json()["appointments"]) == 1
+    assert history_cache.stats()["hits"] == 1
+
+    await client.post("api/v1/appointments/", json=booking(1, 1))
+
+    assert 1 not in history_cache._data
+    assert 2 in history_cache._data
+
+    refreshed = (await client.get(f"{API_URL}1/history")).json()
+
+    assert len(refreshed["appointments"]) == 2
+
+    await client.patch(
+        "api/v1/appointments/status", json={"status": "cancelled", "vet_id": 1}
+    )
+    refreshed = (await client.get(f"{API_URL}1/history")).json()
+
+    assert {item["status"] for item in refreshed["appointments"]} == {"cancelled"}
+
+
+@pytest.mark.asyncio
+async def test_history_miss_reads_the_primary_and_fills_the_cache(
+    client, monkeypatch, tmp_path
+):
+    # Réplica que ainda não aplicou nada: banco vazio
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/replica.db")
+    async with replica.begin() as conn:
+        await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+    replica_session = sessionmaker(replica, class_=AsyncSession)
+
+    await create_animal(client, "Rex")
+    monkeypatch.setattr(deps, "replica_session_factory", lambda: replica_session)
+    deps.recent_writers.clear()
+
+    try:
+        full = await client.get(f"{API_URL}1/history")
+        window = await client.get(f"{API_URL}1/history", params={"last": 1})
+    finally:
+        await replica.dispose()
+
+    assert full.status_code == 200
+    assert full.json()["name"] == "Rex"
+    assert 1 in history_cache._data
+    assert window.status_code == 404
+
+
+def test_fill_from_a_read_older_than_an_invalidation_is_dropped():
+    history_cache.clear()
+    generation = history_cache.generation
+
+    history_cache.invalidate(1)
+    history_cache.set(1, "velho", generation=generation)
+
+    assert history_cache.get(1) is None
+
+
+async def seed_visits(animal_id, visits):
+    start = datetime(2026, 1, 1, 8, 0)
+
+    async with TestingSessionlocal() as session:
+        for i in range(visits):
+            appointment = AppointmentsModel(
+                vet_id=1,
+                animal_id=animal_id,
+                scheduled_at=start + timedelta(days=i),
+                reason=f"Visita {i}",
+                status="completed",
+                created_by=1,
+            )
+            appointment.medical_record = MedicalRecordsModel(
+                vet_id=1, diagnosis=f"Diagnóstico {i}", treatment="Repouso"
+            )
+            session.add(appointment)
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_history_window_pages_only_the_requested_visits(client):
+    await create_animal(client, "Rex")
+    await seed_visits(1, 10)
+    loaded = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM medical_records" in statement:
+            loaded.append(len(parameters))
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(f"{API_URL}1/history", params={"last": 3})
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
+
+    assert [item["reason"] for item in response.json()["appointments"]] == [
+        "Visita 9",
+        "Visita 8",
+        "Visita 7",
+    ]
+    assert response.json()["appointments"][0]["medical_record"]["diagnosis"] == (
+        "Diagnóstico 9"
+    )
+    assert loaded == [4]
+
+    older = await client.get(
+        f"{API_URL}1/history",
+        params={"last": 3, "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert older.json()["appointments"][0]["reason"] == "Visita 6"
+
+    window = await client.get(
+        f"{API_URL}1/history",
+        params={"from": "2026-01-03T00:00:00", "to": "2026-01-05T00:00:00"},
+    )
+    assert [item["reason"] for item in window.json()["appointments"]] == [
+        "Visita 3",
+        "Visita 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_history_stream_sends_visits_in_batches(client, monkeypatch):
+    await create_animal(client, "Rex")
+    await seed_visits(1, 5)
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+
+    response = await client.get(f"{API_URL}1/history/stream")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert lines[0]["name"] == "Rex" and "appointments" not in lines[0]
+    assert [line["reason"] for line in lines[1:]] == [
+        f"Visita {i}" for i in range(4, -1, -1)
+    ]
+
+    missing = await client.get(f"{API_URL}999/history/stream")
+    assert missing.status_code == 404
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import event, insert, text
+
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__medical_records_model import MedicalRecordsModel
+from conftest import TestingSessionlocal, engine_test
+
+API_URL = "api/v1/animals/"
+
+
+async def seed_history(animal_id: int, visits: int):
+    start = datetime(2026, 1, 1, 8, 0)
+
+    async with TestingSessionlocal() as session:
+        for i in range(visits):
+            appointment = AppointmentsModel(
+                vet_id=1,
+                animal_id=animal_id,
+                scheduled_at=start + timedelta(days=i),
+                reason="Consulta",
+                status="completed",
+                created_by=1,
+            )
+            session.add(appointment)
+            await session.flush()
+            await session.execute(
+                insert(MedicalRecordsModel).values(
+                    appointment_id=appointment.id,
+                    vet_id=1,
+                    diagnosis=f"Visita {i}",
+                    treatment="Repouso",
+                )
+            )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_medical_records_are_paged_newest_first(client):
+    await seed_history(animal_id=1, visits=5)
+    await seed_history(animal_id=2, visits=2)
+
+    response = await client.get(f"{API_URL}1/medical_records", params={"limit": 3})
+    first = response.json()
+
+    assert [record["diagnosis"] for record in first] == [
+        "Visita 4",
+        "Visita 3",
+        "Visita 2",
+    ]
+
+    cursor = response.headers["X-Next-Cursor"]
+    second = (
+        await client.get(
+            f"{API_URL}1/medical_records", params={"limit": 3, "cursor": cursor}
+        )
+    ).json()
+
+    assert [record["diagnosis"] for record in second] == ["Visita 1", "Visita 0"]
+    assert second[0]["scheduled_at"] < first[-1]["scheduled_at"]
+
+    missing = await client.get(f"{API_URL}999/medical_records")
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_medical_records_query_uses_indexes(client):
+    await seed_history(animal_id=1, visits=3)
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM medical_records JOIN appointments" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    try:
+        await client.get(f"{API_URL}1/medical_records", params={"limit": 2})
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
+
+    [(statement, parameters)] = statements
+
+    async with engine_test.connect() as conn:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        plan = " | ".join(row[-1] for row in result)
+
+    assert "ix_appointments_animal_id_scheduled_at" in plan
+    assert "ix_medical_records_appointment_id" in plan
+    # Só o desempate por id é ordenado à parte; scheduled_at vem do índice
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan
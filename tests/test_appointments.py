@@ -0,0 +1,346 @@
+import asyncio
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from sqlalchemy import event, insert
+from sqlalchemy.future import select
+
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__user_model import UserModel
+from conftest import TestingSessionlocal, engine_test
+
+API_URL = "api/v1/appointments/"
+
+
+async def seed(rows):
+    async with TestingSessionlocal() as session:
+        await session.execute(insert(AppointmentsModel), rows)
+        await session.commit()
+
+
+def appointment(vet_id, scheduled_at, status="scheduled"):
+    return {
+        "vet_id": vet_id,
+        "animal_id": 1,
+        "scheduled_at": scheduled_at,
+        "reason": "Consulta",
+        "notes": "",
+        "status": status,
+        "created_by": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_filter_and_sort_appointments(client):
+    start = datetime(2026, 11, 2, 8, 0)
+    await seed(
+        [appointment(7, start + timedelta(hours=i)) for i in range(3)]
+        + [appointment(7, start, status="cancelled"), appointment(8, start)]
+    )
+
+    params = {"vet_id": 7, "status": "scheduled", "sort": "-scheduled_at", "limit": 2}
+    first = await client.get(API_URL, params=params)
+    second = await client.get(
+        API_URL, params={**params, "cursor": first.headers["x-next-cursor"]}
+    )
+
+    scheduled = [a["scheduled_at"] for a in first.json() + second.json()]
+
+    assert scheduled == [
+        "2026-11-02T10:00:00",
+        "2026-11-02T09:00:00",
+        "2026-11-02T08:00:00",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sort_field_must_be_whitelisted(client):
+    response = await client.get(API_URL, params={"sort": "notes"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldset_selects_only_requested_columns(client):
+    start = datetime(2026, 11, 2, 8, 0)
+    await seed([appointment(7, start + timedelta(hours=i)) for i in range(3)])
+    statements = []
+
+    def capture(conn, cursor, statement, *args):
+        if "FROM appointments" in statement:
+            statements.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    try:
+        response = await client.get(
+            API_URL, params={"fields": "scheduled_at,status", "limit": 2}
+        )
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert response.json()[0] == {
+        "id": 1,
+        "scheduled_at": "2026-11-02T08:00:00",
+        "status": "scheduled",
+    }
+    assert "link" in response.headers
+    assert "notes" not in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldset_rejects_unknown_fields(client):
+    response = await client.get(API_URL, params={"fields": "id,password"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_vet_agenda_groups_by_day(client):
+    start = datetime(2026, 11, 2, 8, 0)
+    await seed(
+        [appointment(7, start + timedelta(hours=i)) for i in range(2)]
+        + [appointment(7, start + timedelta(days=1)), appointment(8, start)]
+        + [appointment(7, start + timedelta(days=10))]
+    )
+
+    response = await client.get(
+        f"{API_URL}vets/7/agenda",
+        params={"from": "2026-11-02T00:00:00", "to": "2026-11-04T00:00:00"},
+    )
+
+    assert response.status_code == 200
+    days = response.json()["days"]
+    assert [day["day"] for day in days] == ["2026-11-02", "2026-11-03"]
+    assert [len(day["appointments"]) for day in days] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_vet_agenda_rejects_invalid_period(client):
+    params = {"from": "2026-11-04T00:00:00", "to": "2026-11-02T00:00:00"}
+    response = await client.get(f"{API_URL}vets/7/agenda", params=params)
+
+    assert response.status_code == 400
+
+
+def booking(vet_id, scheduled_at):
+    return {
+        "vet_id": vet_id,
+        "animal_id": 1,
+        "scheduled_at": scheduled_at.isoformat(),
+        "reason": "Consulta",
+        "notes": "",
+        "created_by": 1,
+    }
+
+
+async def booked_ids():
+    async with TestingSessionlocal() as session:
+        result = await session.execute(
+            select(AppointmentsModel.id).order_by(AppointmentsModel.id)
+        )
+
+        return result.scalars().all()
+
+
+def next_day():
+    tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+
+    return tomorrow.replace(hour=8, minute=0, second=0, microsecond=0)
+
+
+@pytest.mark.asyncio
+async def test_booking_must_be_slot_aligned(client):
+    response = await client.post(
+        API_URL, json=booking(7, next_day() + timedelta(minutes=10))
+    )
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cancelled_appointment_frees_the_slot(client):
+    start = next_day()
+    await client.post(API_URL, json=booking(7, start))
+
+    assert (await client.post(API_URL, json=booking(7, start))).status_code == 409
+
+    [first] = await booked_ids()
+    await client.patch(f"{API_URL}{first}", json={"status": "cancelled"})
+
+    assert (await client.post(API_URL, json=booking(7, start))).status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_update_cannot_move_onto_a_taken_slot(client):
+    start = next_day()
+    await client.post(API_URL, json=booking(7, start))
+    await client.post(API_URL, json=booking(7, start + timedelta(hours=1)))
+    [_, other] = await booked_ids()
+
+    response = await client.put(
+        f"{API_URL}{other}", json={"scheduled_at": start.isoformat()}
+    )
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_never_overlap(client):
+    start = next_day()
+    random.seed(14)
+    slots = [start + i * timedelta(minutes=30) for i in range(10)]
+    requests = [
+        booking(random.randint(1, 3), random.choice(slots)) for _ in range(300)
+    ]
+
+    responses = await asyncio.gather(
+        *(client.post(API_URL, json=payload) for payload in requests)
+    )
+    codes = Counter(response.status_code for response in responses)
+
+    async with TestingSessionlocal() as session:
+        result = await session.execute(
+            select(AppointmentsModel.vet_id, AppointmentsModel.scheduled_at)
+        )
+        booked = result.all()
+
+    assert set(codes) == {201, 409}
+    assert codes[201] == len(booked) == len(set(booked))
+    assert len(booked) == len({(p["vet_id"], p["scheduled_at"]) for p in requests})
+
+
+@pytest.mark.asyncio
+async def test_availability_sweeps_booked_slots(client):
+    async with TestingSessionlocal() as session:
+        await session.execute(
+            insert(UserModel),
+            [
+                {
+                    "name": name,
+                    "email": f"{name}@email.com",
+                    "password": "x",
+                    "role": "vet",
+                    "is_active": active,
+                }
+                for name, active in (("ana", True), ("bia", True), ("caio", False))
+            ],
+        )
+        await session.commit()
+        vets = (
+            await session.execute(select(UserModel.id).where(UserModel.role == "vet"))
+        ).scalars().all()
+
+    start = next_day()
+    await client.post(API_URL, json=booking(vets[0], start + timedelta(minutes=30)))
+    await client.post(API_URL, json=booking(vets[1], start + timedelta(minutes=60)))
+
+    params = {
+        "from": start.replace(tzinfo=None).isoformat(),
+        "to": (start + timedelta(hours=2)).replace(tzinfo=None).isoformat(),
+        "duration": 60,
+    }
+    response = await client.get(f"{API_URL}availability", params=params)
+
+    assert response.status_code == 200
+    windows = {
+        vet["vet_id"]: [(w["start"][11:16], w["end"][11:16]) for w in vet["windows"]]
+        for vet in response.json()["vets"]
+    }
+    assert windows == {
+        vets[0]: [("09:00", "10:00")],
+        vets[1]: [("08:00", "09:00")],
+    }
+
+
+@pytest.mark.asyncio
+async def test_availability_duration_must_be_slot_multiple(client):
+    params = {
+        "from": "2026-11-02T08:00:00",
+        "to": "2026-11-02T12:00:00",
+        "duration": 45,
+    }
+    response = await client.get(f"{API_URL}availability", params=params)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_item_errors(client):
+    start = next_day()
+    await client.post(API_URL, json=booking(7, start))
+
+    batch = [
+        booking(7, start + timedelta(hours=1)),
+        booking(7, start),
+        booking(8, start),
+        booking(8, start),
+        booking(8, start + timedelta(minutes=10)),
+    ]
+
+    response = await client.post(f"{API_URL}bulk", json={"appointments": batch})
+
+    assert response.status_code == 422
+    assert [error["index"] for error in response.json()["detail"]] == [1, 3, 4]
+    assert len(await booked_ids()) == 1
+
+    response = await client.post(
+        f"{API_URL}bulk", params={"partial": True}, json={"appointments": batch}
+    )
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 2
+    assert [error["index"] for error in response.json()["errors"]] == [1, 3, 4]
+    assert len(await booked_ids()) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_enforces_transitions(client):
+    day = datetime(2026, 11, 2, 8, 0)
+    await seed(
+        [
+            appointment(7, day, status="scheduled"),
+            appointment(7, day + timedelta(hours=1), status="in_progress"),
+            appointment(7, day + timedelta(hours=2), status="completed"),
+            appointment(8, day, status="scheduled"),
+            appointment(7, day + timedelta(days=1), status="scheduled"),
+        ]
+    )
+
+    response = await client.patch(
+        f"{API_URL}status",
+        json={"status": "cancelled", "vet_id": 7, "day": "2026-11-02"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["updated"] == 2
+
+    response = await client.patch(
+        f"{API_URL}status", json={"status": "completed", "ids": [1, 2, 3, 4]}
+    )
+
+    assert response.json()["updated"] == 0
+
+    async with TestingSessionlocal() as session:
+        result = await session.execute(
+            select(AppointmentsModel.status).order_by(AppointmentsModel.id)
+        )
+        statuses = [status.value for status in result.scalars()]
+
+    assert statuses == [
+        "cancelled",
+        "cancelled",
+        "completed",
+        "scheduled",
+        "scheduled",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_requires_a_selection(client):
+    response = await client.patch(f"{API_URL}status", json={"status": "cancelled"})
+
+    assert response.status_code == 400
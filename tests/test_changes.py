@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from conftest import TestingSessionlocal
+from src.core.configs import settings
+from src.models.__change_log_model import ChangeLogModel
+
+API_URL = "api/v1/changes/"
+
+
+@pytest.fixture(autouse=True)
+def settled(monkeypatch):
+    # Sem espera nos testes de paginação; o teste de concorrência liga de volta
+    monkeypatch.setattr(settings, "CHANGE_LOG_SETTLE_SECONDS", 0)
+
+
+def tutor(cpf):
+    return {
+        "name": "Arthur",
+        "cpf": cpf,
+        "email": f"{cpf}@email.com",
+        "phone": "9999",
+        "address": "BH",
+    }
+
+
+def booking(vet_id, scheduled_at):
+    return {
+        "vet_id": vet_id,
+        "animal_id": 1,
+        "scheduled_at": scheduled_at.isoformat(),
+        "reason": "Consulta",
+        "notes": "",
+        "created_by": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_changes_are_paginated_by_cursor(client):
+    first = (await client.post("api/v1/tutors/", json=tutor("111"))).json()
+    await client.post("api/v1/tutors/", json=tutor("222"))
+    await client.put(f"api/v1/tutors/{first['id']}", json={"name": "Outro"})
+    await client.delete(f"api/v1/tutors/{first['id']}")
+
+    page = (await client.get(API_URL, params={"limit": 3})).json()
+
+    assert [change["action"] for change in page["changes"]] == [
+        "created",
+        "created",
+        "updated",
+    ]
+    assert page["has_more"] is True
+
+    page = (
+        await client.get(API_URL, params={"since": page["next_since"]})
+    ).json()
+
+    assert page["changes"][0]["entity_id"] == first["id"]
+    assert page["changes"][0]["action"] == "deleted"
+    assert page["has_more"] is False
+
+    empty = (await client.get(API_URL, params={"since": page["next_since"]})).json()
+
+    assert empty == {"changes": [], "next_since": page["next_since"], "has_more": False}
+
+    filtered = (await client.get(API_URL, params={"entity": "animals"})).json()
+    assert filtered["changes"] == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_writes_are_logged(client):
+    start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    appointments = [booking(7, start + timedelta(minutes=30 * i)) for i in range(3)]
+
+    await client.post("api/v1/appointments/bulk", json={"appointments": appointments})
+    await client.patch(
+        "api/v1/appointments/status", json={"status": "cancelled", "vet_id": 7}
+    )
+
+    changes = (await client.get(API_URL, params={"entity": "appointments"})).json()
+    actions = [(change["entity_id"], change["action"]) for change in changes["changes"]]
+
+    assert sorted(actions[:3]) == [(1, "created"), (2, "created"), (3, "created")]
+    assert sorted(actions[3:]) == [(1, "updated"), (2, "updated"), (3, "updated")]
+
+
+@pytest.mark.asyncio
+async def test_compaction_expires_old_cursors(client):
+    old = datetime.now() - timedelta(days=60)
+
+    async with TestingSessionlocal() as session:
+        session.add_all(
+            ChangeLogModel(
+                entity="tutors", entity_id=i, action="created", changed_at=old
+            )
+            for i in range(1, 4)
+        )
+        await session.commit()
+
+    await client.post("api/v1/tutors/", json=tutor("111"))
+
+    result = (await client.post(f"{API_URL}compact")).json()
+
+    assert result == {"deleted": 2, "horizon": 3}
+
+    expired = await client.get(API_URL, params={"since": 2})
+
+    assert expired.status_code == 410
+    assert expired.json()["detail"]["horizon"] == 3
+    assert expired.json()["detail"]["head"] == 4
+
+    head = (await client.get(f"{API_URL}head")).json()
+    fresh = (await client.get(API_URL)).json()
+    page = (await client.get(API_URL, params={"since": 3})).json()
+
+    assert head == {"head": 4, "horizon": 3}
+    assert [change["id"] for change in fresh["changes"]] == [4]
+    assert [change["id"] for change in page["changes"]] == [4]
+
+
+async def commit_change(change_id, entity_id):
+    async with TestingSessionlocal() as session:
+        session.add(
+            ChangeLogModel(
+                id=change_id, entity="tutors", entity_id=entity_id, action="created"
+            )
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_cursor_waits_for_out_of_order_commits(client, monkeypatch):
+    monkeypatch.setattr(settings, "CHANGE_LOG_SETTLE_SECONDS", 5)
+
+    # O SQLite serializa escritas; o commit fora de ordem é simulado com ids
+    # explícitos: a transação do id 2 commita antes da que pegou o id 1
+    await commit_change(2, 2)
+    early = (await client.get(API_URL)).json()
+    early_head = (await client.get(f"{API_URL}head")).json()
+    await commit_change(1, 1)
+
+    assert early == {"changes": [], "next_since": 0, "has_more": False}
+
+    monkeypatch.setattr(settings, "CHANGE_LOG_SETTLE_SECONDS", 0)
+    page = (await client.get(API_URL, params={"since": early["next_since"]})).json()
+
+    assert [change["id"] for change in page["changes"]] == [1, 2]
+    assert early_head == {"head": 0, "horizon": 0}
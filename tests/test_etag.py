@@ -0,0 +1,86 @@
+import pytest
+
+API_URL = "api/v1/tutors/"
+
+
+async def create_tutor(client, cpf):
+    payload = {
+        "name": "Arthur",
+        "cpf": cpf,
+        "email": f"{cpf}@email.com",
+        "phone": "9999",
+        "address": "BH",
+    }
+    response = await client.post(API_URL, json=payload)
+
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_list_revalidation(client):
+    await create_tutor(client, "111")
+
+    response = await client.get(API_URL)
+    etag = response.headers["ETag"]
+
+    response = await client.get(API_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+    await create_tutor(client, "222")
+    response = await client.get(API_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_etag_depends_on_query_string(client):
+    await create_tutor(client, "111")
+
+    etag = (await client.get(API_URL)).headers["ETag"]
+    response = await client.get(
+        API_URL, params={"limit": 1}, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_detail_etag_changes_on_update(client):
+    tutor = await create_tutor(client, "111")
+    url = f"{API_URL}{tutor['id']}"
+
+    etag = (await client.get(url)).headers["ETag"]
+    assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    await client.put(url, json={"name": "Outro"})
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Outro"
+
+
+@pytest.mark.asyncio
+async def test_tutor_animals_etag_tracks_animals(client):
+    tutor = await create_tutor(client, "111")
+    url = f"{API_URL}{tutor['id']}/animals"
+
+    etag = (await client.get(url)).headers["ETag"]
+    assert (await client.get(url, headers={"If-None-Match": etag})).status_code == 304
+
+    animal = {
+        "name": "Rex",
+        "species": "dog",
+        "breed": "vira-lata",
+        "birth_date": "2020-01-01",
+        "weight_kg": 10.0,
+        "tutor_id": tutor["id"],
+    }
+    await client.post("api/v1/animals/", json=animal)
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert len(response.json()["animals"]) == 1
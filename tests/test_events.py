@@ -0,0 +1,96 @@
+import asyncio
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from src.services.appointments_service import APPOINTMENTS_CHANNEL, feed_filter
+from src.utils.events import broker, _event_stream
+
+API_URL = "api/v1/appointments/"
+
+
+class ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+
+def booking(vet_id, scheduled_at):
+    return {
+        "vet_id": vet_id,
+        "animal_id": 1,
+        "scheduled_at": scheduled_at.isoformat(),
+        "reason": "Consulta",
+        "notes": "",
+        "created_by": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_writes_are_published_after_commit(client):
+    start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+
+    with broker.subscribe(APPOINTMENTS_CHANNEL) as queue:
+        await client.post(API_URL, json=booking(7, start))
+        conflict = await client.post(API_URL, json=booking(7, start))
+
+        assert conflict.status_code == 409
+        assert queue.qsize() == 1
+
+        message = queue.get_nowait()
+
+    assert message["type"] == "created"
+    assert message["vet_id"] == 7
+    assert message["scheduled_at"] == start.replace(tzinfo=None).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_bulk_created_events_carry_ids(client):
+    start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=8, minute=0, second=0, microsecond=0
+    )
+    batch = [
+        booking(7, start),
+        booking(8, start),
+        booking(7, start + timedelta(hours=1)),
+    ]
+
+    with broker.subscribe(APPOINTMENTS_CHANNEL) as queue:
+        await client.post(f"{API_URL}bulk", json={"appointments": batch})
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+
+    listed = (await client.get(API_URL)).json()
+
+    assert {message["type"] for message in messages} == {"created"}
+    assert sorted(message["id"] for message in messages) == [
+        item["id"] for item in listed
+    ]
+    assert {(m["id"], m["vet_id"]) for m in messages} == {
+        (item["id"], item["vet_id"]) for item in listed
+    }
+
+
+@pytest.mark.asyncio
+async def test_feed_stream_filters_by_vet_and_day():
+    stream = _event_stream(
+        ConnectedRequest(), APPOINTMENTS_CHANNEL, feed_filter(7, date(2026, 11, 2))
+    )
+
+    assert await anext(stream) == ": connected\n\n"
+
+    events = [
+        {"type": "created", "vet_id": 8, "scheduled_at": "2026-11-02T08:00:00"},
+        {"type": "created", "vet_id": 7, "scheduled_at": "2026-11-03T08:00:00"},
+        {"type": "status", "vet_id": 7, "scheduled_at": "2026-11-02T09:00:00"},
+    ]
+    for event in events:
+        broker.publish(APPOINTMENTS_CHANNEL, event)
+
+    chunk = await asyncio.wait_for(anext(stream), timeout=1)
+    await stream.aclose()
+
+    assert chunk.startswith("event: status\n")
+    assert json.loads(chunk.split("data: ")[1]) == events[2]
+    assert broker.backend.stats()["subscribers"] == 0
@@ -0,0 +1,135 @@
+import json
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import insert
+
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__medical_records_model import MedicalRecordsModel
+from src.utils.export import ExportFormatEnum
+from src.services.appointments_service import AppointmentsService
+from src.services.medical_records_service import MedicalRecordsService
+from conftest import TestingSessionlocal
+
+API_URL = "api/v1/appointments/export"
+
+
+async def seed_appointments(total: int):
+    start = datetime(2026, 1, 1, 8, 0)
+
+    async with TestingSessionlocal() as session:
+        for offset in range(0, total, 10000):
+            await session.execute(
+                insert(AppointmentsModel),
+                [
+                    {
+                        "vet_id": 1,
+                        "animal_id": 1,
+                        "scheduled_at": start + timedelta(minutes=30 * i),
+                        "reason": "Consulta de rotina",
+                        "notes": "Paciente sem alterações " * 4,
+                        "status": "scheduled",
+                        "created_by": 1,
+                    }
+                    for i in range(offset, min(offset + 10000, total))
+                ],
+            )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_export_appointments_ndjson(client):
+    await seed_appointments(3)
+
+    response = await client.get(API_URL)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+
+    assert len(rows) == 3
+    assert rows[0]["status"] == "scheduled"
+
+
+@pytest.mark.asyncio
+async def test_export_appointments_csv(client):
+    await seed_appointments(2)
+
+    response = await client.get(API_URL, params={"format": "csv"})
+
+    lines = response.text.splitlines()
+
+    assert lines[0].startswith("id,vet_id,animal_id,scheduled_at")
+    assert len(lines) == 3
+
+
+async def seed_medical_records(total: int):
+    async with TestingSessionlocal() as session:
+        for offset in range(0, total, 10000):
+            await session.execute(
+                insert(MedicalRecordsModel),
+                [
+                    {
+                        "appointment_id": i + 1,
+                        "vet_id": 1,
+                        "diagnosis": "Otite externa " * 4,
+                        "treatment": "Limpeza e antibiótico " * 4,
+                        "prescriptions": [
+                            {
+                                "medicine": "Amoxicilina",
+                                "dosage": "250mg",
+                                "frequency": "12/12h",
+                                "duration_days": 7,
+                            }
+                        ],
+                    }
+                    for i in range(offset, min(offset + 10000, total))
+                ],
+            )
+        await session.commit()
+
+
+async def export_peak_mb(response) -> tuple:
+    # Pico só das alocações do export: o seed não entra na medida
+    exported = 0
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        async for chunk in response.body_iterator:
+            exported += chunk.count("\n")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return exported, peak / 1024 / 1024
+
+
+@pytest.mark.asyncio
+async def test_export_memory_stays_flat(admin_user):
+    await seed_appointments(100000)
+
+    async with TestingSessionlocal() as session:
+        response = AppointmentsService(session).export_appointments(
+            ExportFormatEnum.ndjson, current_user=admin_user
+        )
+        exported, peak_mb = await export_peak_mb(response)
+
+    assert exported == 100000
+    assert peak_mb < 20
+
+
+@pytest.mark.asyncio
+async def test_medical_records_export_memory_stays_flat(admin_user):
+    await seed_medical_records(100000)
+
+    async with TestingSessionlocal() as session:
+        response = MedicalRecordsService(session).export_medical_records(
+            ExportFormatEnum.csv, current_user=admin_user
+        )
+        exported, peak_mb = await export_peak_mb(response)
+
+    assert exported == 100001
+    assert peak_mb < 20
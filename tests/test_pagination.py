@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import insert
+
+from src.core.configs import settings
+from src.models.__animals_model import AnimalModel
+from src.models.__appointments_model import AppointmentsModel
+from src.models.__user_model import UserModel
+from conftest import TestingSessionlocal
+
+ENDPOINTS = [
+    "api/v1/tutors/",
+    "api/v1/animals/",
+    "api/v1/users/",
+    "api/v1/appointments/",
+    "api/v1/medical-records/",
+]
+
+
+async def seed(model, rows):
+    async with TestingSessionlocal() as session:
+        await session.execute(insert(model), rows)
+        await session.commit()
+
+
+async def walk(client, url, limit):
+    pages = []
+    params = {"limit": limit}
+
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+
+        pages.append(response.json())
+
+        if "x-next-cursor" not in response.headers:
+            return pages
+
+        assert 'rel="next"' in response.headers["link"]
+        params["cursor"] = response.headers["x-next-cursor"]
+
+
+@pytest.mark.asyncio
+async def test_animals_pagination(client):
+    await seed(
+        AnimalModel,
+        [
+            {
+                "name": f"Animal {i}",
+                "species": "dog",
+                "breed": "vira-lata",
+                "birth_date": datetime(2020, 1, 1).date(),
+                "weight_kg": 10.0,
+                "tutor_id": 1,
+            }
+            for i in range(5)
+        ],
+    )
+
+    pages = await walk(client, "api/v1/animals/", 2)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [a["name"] for page in pages for a in page] == [
+        f"Animal {i}" for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_vets_pagination(client):
+    await seed(
+        UserModel,
+        [
+            {
+                "name": f"Vet {i}",
+                "email": f"vet{i}@email.com",
+                "password": "not-used",
+                "role": "vet",
+            }
+            for i in range(4)
+        ],
+    )
+
+    pages = await walk(client, "api/v1/users/", 2)
+    names = [u["name"] for page in pages for u in page]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert names == ["Admin"] + [f"Vet {i}" for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_appointments_pagination(client):
+    start = datetime(2026, 11, 2, 8, 0)
+    await seed(
+        AppointmentsModel,
+        [
+            {
+                "vet_id": 1,
+                "animal_id": 1,
+                "scheduled_at": start + timedelta(hours=i),
+                "reason": "Consulta",
+                "notes": "",
+                "status": "scheduled",
+                "created_by": 1,
+            }
+            for i in range(5)
+        ],
+    )
+
+    pages = await walk(client, "api/v1/appointments/", 3)
+    ids = [a["id"] for page in pages for a in page]
+
+    assert [len(page) for page in pages] == [3, 2]
+    assert ids == sorted(set(ids))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", ENDPOINTS)
+async def test_limit_bounds(client, url):
+    for limit in (0, settings.PAGE_SIZE_MAX + 1):
+        response = await client.get(url, params={"limit": limit})
+
+        assert response.status_code == 422
+
+    response = await client.get(url, params={"limit": settings.PAGE_SIZE_MAX})
+
+    assert response.status_code == 200
@@ -0,0 +1,113 @@
+from datetime import datetime
+
+import pytest
+
+from src.models.__appointments_model import AppointmentsModel
+from conftest import TestingSessionlocal, user_headers
+
+API_URL = "api/v1/prescriptions/"
+RECORDS_URL = "api/v1/medical-records/"
+
+
+async def create_appointments(*days: int):
+    async with TestingSessionlocal() as session:
+        session.add_all(
+            AppointmentsModel(
+                vet_id=1,
+                animal_id=1,
+                scheduled_at=datetime(2026, 3, day, 8, 0),
+                reason="Consulta",
+                status="completed",
+                created_by=1,
+            )
+            for day in days
+        )
+        await session.commit()
+
+
+def prescription(medicine, duration_days, batch=None):
+    return {
+        "medicine": medicine,
+        "dosage": "250mg",
+        "frequency": "12/12h",
+        "duration_days": duration_days,
+        "batch": batch,
+    }
+
+
+async def create_record(client, appointment_id, prescriptions):
+    payload = {
+        "appointment_id": appointment_id,
+        "vet_id": 1,
+        "diagnosis": "Otite",
+        "treatment": "Antibiótico",
+        "prescriptions": prescriptions,
+        "follow_up_date": None,
+        "created_at": None,
+        "updated_at": None,
+    }
+    response = await client.post(RECORDS_URL, json=payload)
+
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_active_prescriptions_follow_period_and_filters(client):
+    await create_appointments(1, 10)
+    await create_record(
+        client, 1, [prescription("Amoxicilina", 7, "L-01"), prescription("Dipirona", 3)]
+    )
+    await create_record(client, 2, [prescription("Amoxicilina", 5, "L-02")])
+
+    active = await client.get(
+        f"{API_URL}active", params={"medicine": "Amoxicilina", "on": "2026-03-07"}
+    )
+    ended = await client.get(
+        f"{API_URL}active", params={"medicine": "Amoxicilina", "on": "2026-03-08"}
+    )
+    by_animal = await client.get(
+        f"{API_URL}active", params={"animal_id": 1, "on": "2026-03-12"}
+    )
+    by_batch = await client.get(API_URL, params={"batch": "L-01"})
+
+    assert [item["ends_on"] for item in active.json()] == ["2026-03-07"]
+    assert ended.json() == []
+    assert [item["batch"] for item in by_animal.json()] == ["L-02"]
+    assert [item["medical_record_id"] for item in by_batch.json()] == [1]
+
+
+@pytest.mark.asyncio
+async def test_prescriptions_follow_record_writes(client):
+    await create_appointments(1)
+    record = await create_record(client, 1, [prescription("Amoxicilina", 7)])
+
+    await client.put(
+        f"{RECORDS_URL}{record['id']}",
+        json={"prescriptions": [prescription("Meloxicam", 2, "L-03")]},
+    )
+    replaced = (await client.get(API_URL, params={"animal_id": 1})).json()
+
+    assert [item["medicine"] for item in replaced] == ["Meloxicam"]
+    assert replaced[0]["ends_on"] == "2026-03-02"
+
+    await client.delete(f"{RECORDS_URL}{record['id']}")
+
+    assert (await client.get(API_URL)).json() == []
+
+
+@pytest.mark.asyncio
+async def test_other_vet_cannot_rewrite_prescriptions(client):
+    await create_appointments(1)
+    record = await create_record(client, 1, [prescription("Amoxicilina", 7)])
+
+    response = await client.put(
+        f"{RECORDS_URL}{record['id']}",
+        json={"prescriptions": [prescription("Meloxicam", 2)]},
+        headers=await user_headers("vet"),
+    )
+    active = await client.get(
+        f"{API_URL}active", params={"animal_id": 1, "on": "2026-03-01"}
+    )
+
+    assert response.status_code == 403
+    assert [item["medicine"] for item in active.json()] == ["Amoxicilina"]
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+
+from src.models.__appointments_model import AppointmentsModel
+from conftest import TestingSessionlocal, user_headers
+
+API_URL = "api/v1/medical-records/"
+
+
+async def create_appointments(total: int):
+    async with TestingSessionlocal() as session:
+        session.add_all(
+            AppointmentsModel(
+                vet_id=1,
+                animal_id=1,
+                scheduled_at=datetime(2026, 1, 1 + i, 8, 0),
+                reason="Consulta",
+                status="completed",
+                created_by=1,
+            )
+            for i in range(total)
+        )
+        await session.commit()
+
+
+async def create_record(client, appointment_id, diagnosis, treatment):
+    payload = {
+        "appointment_id": appointment_id,
+        "vet_id": 1,
+        "diagnosis": diagnosis,
+        "treatment": treatment,
+        "prescriptions": None,
+        "follow_up_date": None,
+        "created_at": None,
+        "updated_at": None,
+    }
+    response = await client.post(API_URL, json=payload)
+
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_search_is_ranked_and_follows_writes(client):
+    await create_appointments(4)
+    await create_record(client, 1, "Dermatite alérgica", "Amoxicilina e banho")
+    await create_record(client, 2, "Dermatite", "Pomada")
+    otite = await create_record(client, 3, "Otite", "Limpeza")
+    fratura = await create_record(client, 4, "Fratura", "Imobilização")
+
+    response = await client.get(
+        f"{API_URL}search", params={"q": "dermatite amoxicilina"}
+    )
+    results = response.json()
+
+    assert [item["appointment_id"] for item in results] == [1, 2]
+    assert results[0]["score"] > results[1]["score"]
+
+    await client.put(f"{API_URL}{otite['id']}", json={"diagnosis": "Dermatite"})
+    await client.delete(f"{API_URL}{fratura['id']}")
+
+    found = (await client.get(f"{API_URL}search", params={"q": "dermatite"})).json()
+    gone = (await client.get(f"{API_URL}search", params={"q": "fratura"})).json()
+
+    assert {item["appointment_id"] for item in found} == {1, 2, 3}
+    assert gone == []
+
+
+@pytest.mark.asyncio
+async def test_search_pages_with_offset_cursor(client):
+    await create_appointments(5)
+    for i in range(1, 6):
+        await create_record(client, i, "Otite externa", "Limpeza")
+
+    first = await client.get(f"{API_URL}search", params={"q": "otite", "limit": 3})
+    second = await client.get(
+        f"{API_URL}search",
+        params={"q": "otite", "limit": 3, "cursor": first.headers["X-Next-Cursor"]},
+    )
+
+    ids = [item["id"] for item in first.json() + second.json()]
+
+    assert len(ids) == len(set(ids)) == 5
+    assert "X-Next-Cursor" not in second.headers
+
+    syntax = await client.get(f"{API_URL}search", params={"q": 'otite" OR -*'})
+    assert syntax.status_code == 200
+    assert len(syntax.json()) == 5
+
+
+@pytest.mark.asyncio
+async def test_other_vet_cannot_edit_or_reindex_a_record(client):
+    await create_appointments(1)
+    record = await create_record(client, 1, "Otite", "Limpeza")
+
+    response = await client.put(
+        f"{API_URL}{record['id']}",
+        json={"diagnosis": "Dermatite"},
+        headers=await user_headers("vet"),
+    )
+    found = (await client.get(f"{API_URL}search", params={"q": "dermatite"})).json()
+    kept = (await client.get(f"{API_URL}search", params={"q": "otite"})).json()
+
+    assert response.status_code == 403
+    assert found == []
+    assert [item["id"] for item in kept] == [record["id"]]
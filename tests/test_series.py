@@ -0,0 +1,318 @@
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from sqlalchemy import event
+from sqlalchemy.future import select
+
+from src.models.__appointment_series_model import AppointmentSeriesModel
+from src.models.__appointments_model import AppointmentsModel
+from src.utils.recurrence import expand, is_occurrence
+from conftest import TestingSessionlocal, engine_test, user_headers
+
+API_URL = "api/v1/appointments/"
+
+
+def rule(frequency, starts_at, interval=1, count=None, until=None):
+    return SimpleNamespace(
+        frequency=frequency,
+        starts_at=starts_at,
+        interval=interval,
+        count=count,
+        until=until,
+    )
+
+
+def test_monthly_expansion_clamps_to_month_end():
+    series = rule("monthly", datetime(2027, 1, 31, 9, 0), count=4)
+
+    assert list(expand(series, datetime(2027, 1, 1), datetime(2028, 1, 1))) == [
+        datetime(2027, 1, 31, 9, 0),
+        datetime(2027, 2, 28, 9, 0),
+        datetime(2027, 3, 31, 9, 0),
+        datetime(2027, 4, 30, 9, 0),
+    ]
+    assert is_occurrence(series, datetime(2027, 2, 28, 9, 0))
+    assert not is_occurrence(series, datetime(2027, 5, 31, 9, 0))
+
+
+def test_weekly_expansion_starts_inside_the_window():
+    series = rule("weekly", datetime(2027, 1, 4, 9, 0), interval=2)
+    window = list(expand(series, datetime(2030, 1, 1), datetime(2030, 2, 1)))
+
+    assert window and all(is_occurrence(series, moment) for moment in window)
+    assert [b - a for a, b in zip(window, window[1:])] == [timedelta(weeks=2)] * (
+        len(window) - 1
+    )
+    assert not is_occurrence(series, window[0] + timedelta(weeks=1))
+
+
+def next_monday():
+    today = datetime.now(timezone.utc).replace(
+        hour=9, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+
+    return today + timedelta(days=7 - today.weekday())
+
+
+def series_payload(starts_at, **rule):
+    return {
+        "animal_id": 1,
+        "vet_id": 7,
+        "starts_at": starts_at.isoformat() + "+00:00",
+        "frequency": "weekly",
+        "reason": "Fisioterapia",
+        "notes": "",
+        "created_by": 1,
+        **rule,
+    }
+
+
+def booking(scheduled_at):
+    return {
+        "vet_id": 7,
+        "animal_id": 2,
+        "scheduled_at": scheduled_at.isoformat() + "+00:00",
+        "reason": "Consulta",
+        "notes": "",
+        "created_by": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_series_occurrences_appear_in_agenda_and_block_slots(client):
+    start = next_monday()
+    response = await client.post(
+        f"{API_URL}series", json=series_payload(start, count=10)
+    )
+
+    assert response.status_code == 201
+
+    agenda = await client.get(
+        f"{API_URL}vets/7/agenda",
+        params={
+            "from": (start + timedelta(weeks=3)).isoformat(),
+            "to": (start + timedelta(weeks=3, days=1)).isoformat(),
+        },
+    )
+    [day] = agenda.json()["days"]
+
+    assert day["appointments"][0]["id"] is None
+    assert day["appointments"][0]["series_id"] == response.json()["id"]
+
+    conflict = await client.post(API_URL, json=booking(start + timedelta(weeks=3)))
+
+    assert conflict.status_code == 409
+
+    overlapping = await client.post(
+        f"{API_URL}series",
+        json=series_payload(start + timedelta(weeks=4), frequency="monthly", count=2),
+    )
+
+    assert overlapping.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_materialized_occurrence_frees_its_virtual_slot(client):
+    start = next_monday()
+    series = (
+        await client.post(f"{API_URL}series", json=series_payload(start, count=4))
+    ).json()
+    occurrence_at = start + timedelta(weeks=1)
+
+    moved = await client.post(
+        f"{API_URL}series/{series['id']}/occurrences",
+        json={
+            "occurrence_at": occurrence_at.isoformat(),
+            "scheduled_at": (occurrence_at + timedelta(hours=2)).isoformat()
+            + "+00:00",
+        },
+    )
+
+    assert moved.status_code == 201
+    assert moved.json()["scheduled_at"].startswith(
+        (occurrence_at + timedelta(hours=2)).isoformat()
+    )
+
+    again = await client.post(
+        f"{API_URL}series/{series['id']}/occurrences",
+        json={"occurrence_at": occurrence_at.isoformat()},
+    )
+    assert again.status_code == 409
+
+    freed = await client.post(API_URL, json=booking(occurrence_at))
+    assert freed.status_code == 201
+
+    missing = await client.post(
+        f"{API_URL}series/{series['id']}/occurrences",
+        json={"occurrence_at": (occurrence_at + timedelta(days=1)).isoformat()},
+    )
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_materializing_requires_booking_and_status_roles(client):
+    start = next_monday()
+    series = (
+        await client.post(f"{API_URL}series", json=series_payload(start, count=4))
+    ).json()
+    url = f"{API_URL}series/{series['id']}/occurrences"
+    occurrence = {"occurrence_at": (start + timedelta(weeks=1)).isoformat()}
+
+    vet = await client.post(url, json=occurrence, headers=await user_headers("vet"))
+    receptionist = await user_headers("receptionist")
+    completed = await client.post(
+        url, json={**occurrence, "status": "completed"}, headers=receptionist
+    )
+    scheduled = await client.post(url, json=occurrence, headers=receptionist)
+
+    assert vet.status_code == 403
+    assert completed.status_code == 403
+    assert scheduled.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_concurrent_series_and_bookings_never_overlap(client):
+    start = next_monday()
+    requests = [
+        client.post(f"{API_URL}series", json=series_payload(start, count=4))
+        for _ in range(5)
+    ] + [
+        client.post(API_URL, json=booking(start + timedelta(weeks=week)))
+        for week in range(4)
+        for _ in range(5)
+    ]
+
+    responses = await asyncio.gather(*requests)
+    codes = Counter(response.status_code for response in responses)
+
+    async with TestingSessionlocal() as session:
+        booked = (
+            await session.execute(select(AppointmentsModel.scheduled_at))
+        ).scalars().all()
+        series = (
+            await session.execute(select(AppointmentSeriesModel))
+        ).scalars().all()
+
+    taken = booked + [
+        moment
+        for item in series
+        for moment in expand(item, start, start + timedelta(weeks=5))
+    ]
+
+    assert set(codes) == {201, 409}
+    assert codes[201] == len(booked) + len(series)
+    assert len(taken) == len(set(taken)) == 4
+
+
+@pytest.mark.asyncio
+async def test_only_series_writes_take_the_vet_write_lock(client):
+    start = next_monday()
+    locks = []
+
+    def capture(conn, cursor, statement, *args):
+        if statement.startswith("UPDATE users"):
+            locks.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", capture)
+    try:
+        booked = await client.post(API_URL, json=booking(start))
+        series = await client.post(
+            f"{API_URL}series",
+            json=series_payload(start + timedelta(hours=1), count=2),
+        )
+        conflict = await client.post(
+            API_URL, json=booking(start + timedelta(hours=1))
+        )
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", capture)
+
+    async with TestingSessionlocal() as session:
+        rows = (
+            await session.execute(select(AppointmentsModel.scheduled_at))
+        ).scalars().all()
+
+    assert [booked.status_code, series.status_code] == [201, 201]
+    assert conflict.status_code == 409
+    assert len(locks) == 1
+    assert rows == [start]
+
+
+async def agenda_times(client, start, weeks):
+    response = await client.get(
+        f"{API_URL}vets/7/agenda",
+        params={
+            "from": start.isoformat(),
+            "to": (start + timedelta(weeks=weeks)).isoformat(),
+        },
+    )
+
+    return [
+        (item["scheduled_at"], item["status"])
+        for day in response.json()["days"]
+        for item in day["appointments"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_series_can_be_moved_shortened_and_ended(client):
+    start = next_monday()
+    series = (
+        await client.post(f"{API_URL}series", json=series_payload(start, count=4))
+    ).json()
+    url = f"{API_URL}series/{series['id']}"
+    busy, later = start + timedelta(hours=1), start + timedelta(hours=2)
+
+    await client.post(API_URL, json=booking(busy + timedelta(weeks=3)))
+    onto_booking = await client.patch(
+        url, json={"starts_at": busy.isoformat() + "+00:00"}
+    )
+    moved = await client.patch(url, json={"starts_at": later.isoformat() + "+00:00"})
+
+    assert onto_booking.status_code == 409
+    assert moved.status_code == 202
+    assert (await client.post(API_URL, json=booking(start))).status_code == 201
+    assert (await client.post(API_URL, json=booking(later))).status_code == 409
+
+    shortened = await client.patch(url, json={"count": 2})
+    virtual = [
+        moment
+        for moment, _ in await agenda_times(client, start, 4)
+        if moment.endswith(later.time().isoformat())
+    ]
+
+    assert shortened.status_code == 202
+    assert virtual == [
+        later.isoformat(),
+        (later + timedelta(weeks=1)).isoformat(),
+    ]
+
+    ended = await client.delete(url)
+    freed = await client.post(API_URL, json=booking(later + timedelta(weeks=1)))
+
+    assert ended.status_code == 204
+    assert freed.status_code == 201
+
+
+@pytest.mark.asyncio
+async def test_deleted_occurrence_stays_deleted(client):
+    start = next_monday()
+    series = (
+        await client.post(f"{API_URL}series", json=series_payload(start, count=3))
+    ).json()
+    occurrence_at = start + timedelta(weeks=1)
+
+    materialized = await client.post(
+        f"{API_URL}series/{series['id']}/occurrences",
+        json={"occurrence_at": occurrence_at.isoformat()},
+    )
+    await client.delete(f"{API_URL}{materialized.json()['id']}")
+
+    times = await agenda_times(client, start, 4)
+
+    assert (occurrence_at.isoformat(), "cancelled") in times
+    assert (occurrence_at.isoformat(), "scheduled") not in times
+    assert (await client.post(API_URL, json=booking(occurrence_at))).status_code == 201
@@ -0,0 +1,144 @@
+import pytest
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.configs import settings
+from src.core.database import (
+    InstrumentedQueuePool,
+    _create_engine,
+    _create_session_factory,
+)
+from src.services.appointment_series_service import AppointmentSeriesService
+
+from src.core import deps
+from conftest import engine_test, TestingSessionlocal
+
+API_URL = "api/v1/tutors/"
+
+
+@pytest.fixture
+def checkouts():
+    counter = []
+
+    def count(dbapi_connection, connection_record, connection_proxy):
+        counter.append(connection_record)
+
+    event.listen(engine_test.sync_engine.pool, "checkout", count)
+    yield counter
+    event.remove(engine_test.sync_engine.pool, "checkout", count)
+
+
+@pytest.mark.asyncio
+async def test_read_request_uses_one_connection(client, checkouts):
+    response = await client.get(API_URL)
+
+    assert response.status_code == 200
+    assert len(checkouts) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_request_uses_one_connection(client, checkouts):
+    payload = {
+        "name": "Arthur",
+        "cpf": "123",
+        "email": "arthur@email.com",
+        "phone": "9999",
+        "address": "BH"
+    }
+
+    response = await client.post(API_URL, json=payload)
+
+    assert response.status_code == 201
+    assert len(checkouts) == 1
+
+    response = await client.get(f"{API_URL}{response.json()['id']}")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_failed_request_rolls_back(client):
+    payload = {"name": "Admin 2", "email": "admin@email.com", "password": "x", "role": "vet"}
+
+    response = await client.post("api/v1/auth/users", json=payload)
+
+    assert response.status_code == 409
+
+    response = await client.get("api/v1/users/")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_reports_usage():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = engine.pool.stats()
+
+        assert stats["checked_out"] == 1
+        assert stats["acquisitions"] == 1
+
+    assert engine.pool.stats()["idle"] == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_endpoint(client):
+    response = await client.get("api/v1/metrics/pool")
+
+    assert response.status_code == 200
+    assert "checked_out" in response.json()["primary"]
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_until_client_writes(client, monkeypatch):
+    replica_sessions = []
+
+    def replica_factory():
+        replica_sessions.append(True)
+        return TestingSessionlocal()
+
+    monkeypatch.setattr(deps, "replica_session_factory", lambda: replica_factory)
+
+    response = await client.get(API_URL)
+
+    assert response.status_code == 200
+    assert len(replica_sessions) == 1
+
+    payload = {
+        "name": "Arthur",
+        "cpf": "123",
+        "email": "arthur@email.com",
+        "phone": "9999",
+        "address": "BH"
+    }
+    await client.post(API_URL, json=payload)
+    response = await client.get(API_URL)
+
+    assert len(response.json()) == 1
+    assert len(replica_sessions) == 1
+
+
+@pytest.mark.asyncio
+async def test_app_engine_runs_on_sqlite(tmp_path):
+    engine = _create_engine(f"sqlite+aiosqlite:///{tmp_path}/local.db")
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(settings.DBBaseModel.metadata.create_all)
+
+        async with _create_session_factory(engine)() as session:
+            await AppointmentSeriesService(session).lock_vet(1)
+            await session.commit()
+    finally:
+        await engine.dispose()
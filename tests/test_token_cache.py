@@ -0,0 +1,77 @@
+import hashlib
+from time import monotonic, time
+
+import pytest
+
+from src.core.configs import settings
+from src.utils import auth
+from src.utils.auth import (
+    token_cache,
+    revoke_user,
+    _create_access_token,
+    _decode_token,
+)
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    calls = []
+    decode = auth.jwt.decode
+
+    def counting(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting)
+    token_cache.clear()
+
+    return calls
+
+
+def test_cached_token_is_decoded_once(decodes):
+    token = _create_access_token(sub=1)
+
+    first = _decode_token(token)
+    second = _decode_token(token)
+
+    assert first == second
+    assert len(decodes) == 1
+    assert token_cache.stats()["hits"] == 1
+
+
+def test_cached_entry_expires_at_token_exp(decodes, monkeypatch):
+    token = _create_access_token(sub=1)
+    payload = _decode_token(token)
+
+    _, expires_at = token_cache._data[hashlib.sha256(token.encode()).digest()]
+
+    assert abs((expires_at - monotonic()) - (payload["exp"] - time())) < 1
+
+    monkeypatch.setattr(auth, "time", lambda: payload["exp"] - 1)
+    _decode_token(token)
+
+    assert len(decodes) == 1
+
+    monkeypatch.setattr(auth, "time", lambda: payload["exp"])
+    _decode_token(token)
+
+    assert len(decodes) == 2
+
+
+@pytest.mark.asyncio
+async def test_revocation_rejects_a_cached_token(
+    client, admin_user, decodes, monkeypatch
+):
+    monkeypatch.setattr(settings, "JWT_STATELESS", True)
+    token = _create_access_token(sub=admin_user.id, role="admin", is_active=True)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert (await client.get("api/v1/tutors/", headers=headers)).status_code == 200
+
+    revoked_at = time() + 1
+    monkeypatch.setattr(auth, "time", lambda: revoked_at)
+    revoke_user(admin_user.id)
+    response = await client.get("api/v1/tutors/", headers=headers)
+
+    assert response.status_code == 401
+    assert decodes.count(token) == 1
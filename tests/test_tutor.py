@@ -70,4 +70,28 @@ async def test_update_tutor(client):
     response = await client.put(f"{API_URL}{tutor_id}", json=update)
     
     assert response.status_code == 202 
-    assert response.json()["name"] == "Arthur"
\ No newline at end of file
+    assert response.json()["name"] == "Arthur"
+
+
+@pytest.mark.asyncio
+async def test_get_tutors_keyset_pagination(client):
+    for i in range(3):
+        payload = {
+            "name": f"Tutor {i}",
+            "cpf": f"{i}",
+            "email": f"tutor{i}@email.com",
+            "phone": "9999",
+            "address": "BH"
+        }
+        await client.post(API_URL, json=payload)
+    
+    first = await client.get(API_URL, params={"limit": 2})
+    
+    assert [t["name"] for t in first.json()] == ["Tutor 0", "Tutor 1"]
+    assert 'rel="next"' in first.headers["link"]
+    
+    cursor = first.headers["x-next-cursor"]
+    second = await client.get(API_URL, params={"limit": 2, "cursor": cursor})
+    
+    assert [t["name"] for t in second.json()] == ["Tutor 2"]
+    assert "link" not in second.headers
@@ -0,0 +1,111 @@
+from time import time
+
+import pytest
+
+from sqlalchemy import event
+
+from src.core.configs import settings
+from src.core.deps import _load_user
+from src.utils import auth
+from src.utils.auth import (
+    user_cache,
+    revoke_user,
+    revocation_list,
+    _create_access_token,
+)
+from conftest import TestingSessionlocal, engine_test
+
+API_URL = "api/v1/users/"
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_cached(client):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", count)
+    try:
+        await client.get("api/v1/tutors/")
+        await client.get("api/v1/tutors/")
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    assert user_cache.hits == 1
+    assert user_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_load_racing_invalidation_is_not_cached(client, admin_user):
+    def invalidate(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            user_cache.invalidate(admin_user.id)
+
+    event.listen(engine_test.sync_engine, "before_cursor_execute", invalidate)
+    try:
+        async with TestingSessionlocal() as session:
+            user = await _load_user(session, admin_user.id)
+    finally:
+        event.remove(engine_test.sync_engine, "before_cursor_execute", invalidate)
+
+    assert user.id == admin_user.id
+    assert len(user_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_patch_user_active_invalidates_cache(client, admin_user):
+    await client.get("api/v1/auth/me")
+    assert len(user_cache) == 1
+
+    response = await client.patch(f"{API_URL}{admin_user.id}", json={"is_active": True})
+
+    assert response.status_code == 202
+    assert len(user_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_stateless_token_skips_db_and_honours_revocation(
+    client, admin_user, monkeypatch
+):
+    monkeypatch.setattr(settings, "JWT_STATELESS", True)
+    token = _create_access_token(sub=admin_user.id, role="admin", is_active=True)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get("api/v1/tutors/", headers=headers)
+
+    assert response.status_code == 200
+    assert len(user_cache) == 0
+
+    # Revogação num segundo posterior ao iat do token
+    revoked_at = time() + 1
+    monkeypatch.setattr(auth, "time", lambda: revoked_at)
+    revoke_user(admin_user.id)
+    response = await client.get("api/v1/tutors/", headers=headers)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_right_after_revocation_is_accepted(
+    client, admin_user, monkeypatch
+):
+    monkeypatch.setattr(settings, "JWT_STATELESS", True)
+    monkeypatch.setattr(auth, "time", lambda: 1792357761.165)
+
+    revoke_user(admin_user.id)
+
+    assert revocation_list.is_revoked(admin_user.id, 1792357760)
+    assert not revocation_list.is_revoked(admin_user.id, 1792357761)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(settings, "JWT_STATELESS", True)
+    revoke_user(admin_user.id)
+    token = _create_access_token(sub=admin_user.id, role="admin", is_active=True)
+    response = await client.get(
+        "api/v1/tutors/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200